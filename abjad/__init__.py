@@ -15,6 +15,7 @@ from .contextmanagers import (
     FilesystemState,
     ForbidUpdate,
     NullContextManager,
+    Profiler,
     ProgressIndicator,
     RedirectedStreams,
     TemporaryDirectory,
@@ -199,7 +200,7 @@ from .overrides import (
 from .parentage import Parentage
 from .parsers import parser
 from .parsers.base import Parser
-from .parsers.parse import parse
+from .parsers.parse import parse, parse_many
 from .path import Path
 from .pattern import Pattern, PatternTuple
 from .pitch.Accidental import Accidental
@@ -332,6 +333,7 @@ from .templates import (
     StringQuartetScoreTemplate,
     TwoStaffPianoScoreTemplate,
 )
+from .tempomap import TempoMap
 from .timespan import AnnotatedTimespan, Timespan, TimespanList, timespan
 from .typedcollections import (
     TypedCollection,
@@ -359,7 +361,7 @@ from .verticalmoment import (
     iterate_pitch_pairs,
     iterate_vertical_moments,
 )
-from .wellformedness import Wellformedness, wellformed
+from .wellformedness import Wellformedness, WellformednessCheck, wellformed
 
 index = Pattern.index
 index_all = Pattern.index_all
@@ -576,6 +578,7 @@ __all__ = [
     "PitchVector",
     "Postscript",
     "PostscriptOperator",
+    "Profiler",
     "ProgressIndicator",
     "Prototype",
     "Ratio",
@@ -648,6 +651,7 @@ __all__ = [
     "StringQuartetScoreTemplate",
     "Strings",
     "Tag",
+    "TempoMap",
     "TemporaryDirectory",
     "TemporaryDirectoryChange",
     "TenorSaxophone",
@@ -683,6 +687,7 @@ __all__ = [
     "Violin",
     "Voice",
     "Wellformedness",
+    "WellformednessCheck",
     "WellformednessError",
     "WoodwindFingering",
     "Wrapper",
@@ -728,6 +733,7 @@ __all__ = [
     "ottava",
     "override",
     "parse",
+    "parse_many",
     "parser",
     "persist",
     "phrasing_slur",
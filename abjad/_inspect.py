@@ -3,6 +3,7 @@ import collections
 import typing
 
 from . import exceptions, typings
+from .contextmanagers import Profiler
 from .duration import Duration
 from .indicators.MetronomeMark import MetronomeMark
 from .instruments import Instrument
@@ -96,11 +97,60 @@ def _get_duration_in_seconds(COMPONENT):
         raise exceptions.MissingMetronomeMarkError
 
 
+def _get_dependent_wrapper_index(CONTEXT, prototype, attributes, command):
+    """
+    Gets sorted offsets and offset-to-wrappers dictionary of those wrappers
+    that depend on ``CONTEXT`` and match ``prototype``.
+
+    Caches one index per context and query; offset updates and effective
+    context changes clear the cache.
+    """
+    key = (prototype, command)
+    if attributes is not None:
+        key += tuple(sorted(attributes.items()))
+    try:
+        return CONTEXT._dependent_wrapper_index[key]
+    except KeyError:
+        pass
+    except TypeError:
+        key = None
+    offset_to_wrappers = {}
+    for wrapper in CONTEXT._dependent_wrappers:
+        if wrapper.annotation:
+            continue
+        if isinstance(wrapper.indicator, prototype):
+            append_wrapper = True
+            if command is not None and wrapper.indicator.command != command:
+                continue
+            if attributes is not None:
+                for name, value in attributes.items():
+                    if getattr(wrapper.indicator, name, None) != value:
+                        append_wrapper = False
+            if not append_wrapper:
+                continue
+            offset = wrapper.start_offset
+            offset_to_wrappers.setdefault(offset, []).append(wrapper)
+    index = (sorted(offset_to_wrappers), offset_to_wrappers)
+    if key is not None:
+        CONTEXT._dependent_wrapper_index[key] = index
+    return index
+
+
 def _get_effective(
     COMPONENT, prototype, *, attributes=None, command=None, n=0, unwrap=True
 ):
+    start_time = Profiler._start()
+    result = _get_effective_uncounted(
+        COMPONENT, prototype, attributes, command, n, unwrap
+    )
+    Profiler._stop("get_effective", start_time)
+    return result
+
+
+def _get_effective_uncounted(COMPONENT, prototype, attributes, command, n, unwrap):
     COMPONENT._update_now(indicators=True)
-    candidate_wrappers = {}
+    start_offset = COMPONENT._get_timespan().start_offset
+    indices = []
     parentage = COMPONENT._get_parentage()
     enclosing_voice_name = None
     for component in parentage:
@@ -132,36 +182,45 @@ def _get_effective(
             _.deactivate is True for _ in local_wrappers
         ):
             local_wrappers = [_ for _ in local_wrappers if _.deactivate is not True]
-        for wrapper in local_wrappers:
-            offset = wrapper.start_offset
-            candidate_wrappers.setdefault(offset, []).append(wrapper)
+        if local_wrappers:
+            offset_to_wrappers = {}
+            for wrapper in local_wrappers:
+                offset = wrapper.start_offset
+                offset_to_wrappers.setdefault(offset, []).append(wrapper)
+            indices.append((sorted(offset_to_wrappers), offset_to_wrappers))
         if not isinstance(component, Context):
             continue
-        for wrapper in component._dependent_wrappers:
-            if wrapper.annotation:
-                continue
-            if isinstance(wrapper.indicator, prototype):
-                append_wrapper = True
-                if command is not None and wrapper.indicator.command != command:
-                    continue
-                if attributes is not None:
-                    for name, value in attributes.items():
-                        if getattr(wrapper.indicator, name, None) != value:
-                            append_wrapper = False
-                if not append_wrapper:
-                    continue
-                offset = wrapper.start_offset
-                candidate_wrappers.setdefault(offset, []).append(wrapper)
-    if not candidate_wrappers:
-        return
-    all_offsets = sorted(candidate_wrappers)
-    start_offset = COMPONENT._get_timespan().start_offset
-    index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
-    if index < 0:
+        index = _get_dependent_wrapper_index(component, prototype, attributes, command)
+        if index[0]:
+            indices.append(index)
+    if not indices:
         return
-    elif len(candidate_wrappers) <= index:
-        return
-    wrapper = candidate_wrappers[all_offsets[index]][0]
+    if n == 0:
+        # one bisect per index; earlier indices win ties
+        wrapper, wrapper_offset = None, None
+        for offsets, offset_to_wrappers in indices:
+            i = bisect.bisect(offsets, start_offset) - 1
+            if i < 0:
+                continue
+            offset = offsets[i]
+            if wrapper_offset is None or wrapper_offset < offset:
+                wrapper = offset_to_wrappers[offset][0]
+                wrapper_offset = offset
+        if wrapper is None:
+            return
+    else:
+        candidate_wrappers = {}
+        for offsets, offset_to_wrappers in indices:
+            for offset in offsets:
+                wrappers = offset_to_wrappers[offset]
+                candidate_wrappers.setdefault(offset, []).extend(wrappers)
+        all_offsets = sorted(candidate_wrappers)
+        index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
+        if index < 0:
+            return
+        elif len(candidate_wrappers) <= index:
+            return
+        wrapper = candidate_wrappers[all_offsets[index]][0]
     if unwrap:
         return wrapper.indicator
     return wrapper
@@ -1,4 +1,5 @@
 import collections
+import itertools
 import typing
 
 from . import _inspect, score
@@ -17,7 +18,35 @@ def _coerce_exclude(exclude):
     return exclude
 
 
+class _LeafIndex:
+    """
+    Leaf index.
+
+    Caches next leaves, previous leaves and logical-tie leaves of the leaves
+    in one score tree. Lives on the root of the tree. Cleared whenever offsets,
+    voice names or ties change anywhere in the tree.
+    """
+
+    __slots__ = ("logical_ties", "next_leaves", "previous_leaves")
+
+    def __init__(self):
+        self.logical_ties = {}
+        self.next_leaves = {}
+        self.previous_leaves = {}
+
+
+def _get_leaf_index(LEAF):
+    root = LEAF._get_parentage()[-1]
+    if root._leaf_index is None:
+        root._leaf_index = _LeafIndex()
+    return root._leaf_index
+
+
 def _get_logical_tie_leaves(LEAF):
+    leaf_index = _get_leaf_index(LEAF)
+    leaves = leaf_index.logical_ties.get(LEAF)
+    if leaves is not None:
+        return list(leaves)
     leaves_before, leaves_after = [], []
     current_leaf = LEAF
     while True:
@@ -40,9 +69,24 @@ def _get_logical_tie_leaves(LEAF):
             break
         current_leaf = next_leaf
     leaves = leaves_before + [LEAF] + leaves_after
+    # every leaf shares logical tie only when leaves link both ways:
+    if all(
+        _get_leaf(left, 1) is right and _get_leaf(right, -1) is left
+        for left, right in zip(leaves, leaves[1:])
+    ):
+        for leaf in leaves:
+            leaf_index.logical_ties[leaf] = tuple(leaves)
+    else:
+        leaf_index.logical_ties[LEAF] = tuple(leaves)
     return leaves
 
 
+def _is_grace_container(component):
+    if isinstance(component, (score.AfterGraceContainer, score.BeforeGraceContainer)):
+        return True
+    return component.__class__.__name__ == "OnBeatGraceContainer"
+
+
 def _iterate_components(
     client,
     prototype=None,
@@ -51,105 +95,118 @@ def _iterate_components(
     do_not_iterate_grace_containers=None,
     grace=None,
     reverse=None,
+    snapshot=None,
 ):
-    argument = client
+    """
+    Iterates components of ``client`` in score order.
+
+    Walks an explicit stack instead of recursing; graceness propagates from
+    parent to child instead of being looked up in the parentage of every
+    component.
+
+    Set ``snapshot`` to true to keep the result on ``client`` until the
+    structure of ``client`` next changes; ignored when ``exclude`` is given.
+    """
     prototype = prototype or score.Component
-    before_grace_container = None
-    after_grace_container = None
     exclude = _coerce_exclude(exclude)
-    assert isinstance(exclude, tuple), repr(exclude)
-    if grace is not False and isinstance(argument, score.Leaf):
-        before_grace_container = argument._before_grace_container
-        after_grace_container = argument._after_grace_container
-    if not reverse:
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and before_grace_container
-        ):
-            yield from _iterate_components(
-                before_grace_container,
-                prototype,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
-            )
-        if isinstance(argument, prototype):
-            if (
-                grace is None
-                or (grace is True and _inspect._get_grace_container(argument))
-                or (grace is False and not _inspect._get_grace_container(argument))
-            ):
-                if not _should_exclude(argument, exclude):
-                    yield argument
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and after_grace_container
-        ):
-            yield from _iterate_components(
-                after_grace_container,
-                prototype,
-                exclude=exclude,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
-            )
-        if isinstance(argument, collections.abc.Iterable):
-            for item in argument:
-                yield from _iterate_components(
-                    item,
+    if snapshot and not exclude and isinstance(client, score.Component):
+        key = (prototype, bool(do_not_iterate_grace_containers), grace, bool(reverse))
+        if client._iteration_snapshots is None:
+            client._iteration_snapshots = {}
+        components = client._iteration_snapshots.get(key)
+        if components is None:
+            components = tuple(
+                _iterate_components(
+                    client,
                     prototype,
-                    exclude=exclude,
                     do_not_iterate_grace_containers=do_not_iterate_grace_containers,
                     grace=grace,
                     reverse=reverse,
                 )
-    else:
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and after_grace_container
-        ):
-            yield from _iterate_components(
-                after_grace_container,
-                prototype,
-                exclude=exclude,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
             )
-        if isinstance(argument, prototype):
-            if (
-                grace is None
-                or (grace is True and _inspect._get_grace_container(argument))
-                or (grace is False and not _inspect._get_grace_container(argument))
-            ):
-                if not _should_exclude(argument, exclude):
-                    yield argument
-        if (
-            not do_not_iterate_grace_containers
-            and grace is not False
-            and before_grace_container
-        ):
-            yield from _iterate_components(
-                before_grace_container,
-                prototype,
-                exclude=exclude,
-                do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                grace=grace,
-                reverse=reverse,
+            client._iteration_snapshots[key] = components
+        return iter(components)
+    return _iterate_components_from_stack(
+        client,
+        prototype,
+        exclude,
+        not do_not_iterate_grace_containers and grace is not False,
+        grace,
+        reverse,
+    )
+
+
+def _iterate_components_from_stack(
+    client, prototype, exclude, iterate_graces, grace, reverse
+):
+    # caches isinstance() results by type:
+    is_prototype, is_iterable = {}, {}
+    # entries are (component, exclude, is_grace, expand) tuples;
+    # is_grace is none until needed:
+    stack = [iter([(client, exclude, None, True)])]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        component, exclude_, is_grace, expand = entry
+        class_ = type(component)
+        if expand:
+            if iterate_graces and isinstance(component, score.Leaf):
+                before = component._before_grace_container
+                after = component._after_grace_container
+                if before or after:
+                    entries = []
+                    if not reverse:
+                        if before:
+                            # before-grace music ignores exclude:
+                            entries.append((before, (), True, True))
+                        entries.append((component, exclude_, is_grace, False))
+                        if after:
+                            entries.append((after, exclude_, True, True))
+                    else:
+                        if after:
+                            entries.append((after, exclude_, True, True))
+                        entries.append((component, exclude_, is_grace, False))
+                        if before:
+                            entries.append((before, exclude_, True, True))
+                    stack.append(iter(entries))
+                    continue
+        if class_ not in is_prototype:
+            is_prototype[class_] = isinstance(component, prototype)
+        matches = is_prototype[class_]
+        if grace is not None and is_grace is None:
+            if matches or (expand and isinstance(component, score.Container)):
+                is_grace = _inspect._get_grace_container(component)
+        if matches and (grace is None or grace == is_grace):
+            if not exclude_ or not _should_exclude(component, exclude_):
+                yield component
+        if not expand:
+            continue
+        if class_ not in is_iterable:
+            is_iterable[class_] = isinstance(component, collections.abc.Iterable)
+        if not is_iterable[class_]:
+            continue
+        if isinstance(component, score.Container):
+            children = component._components
+        else:
+            children = list(component)
+        if reverse:
+            children = children[::-1]
+        if grace is None or not isinstance(component, score.Container):
+            is_graces = itertools.repeat(None)
+        elif is_grace:
+            is_graces = itertools.repeat(True)
+        else:
+            is_graces = map(_is_grace_container, children)
+        stack.append(
+            zip(
+                children,
+                itertools.repeat(exclude_),
+                is_graces,
+                itertools.repeat(True),
             )
-        if isinstance(argument, collections.abc.Iterable):
-            for item in reversed(argument):
-                yield from _iterate_components(
-                    item,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
+        )
 
 
 def _iterate_descendants(component, cross_offset=None):
@@ -215,10 +272,19 @@ def _get_leaf(ARGUMENT, n: int = 0):
         message += f"   {repr(n)}"
         raise Exception(message)
     if isinstance(ARGUMENT, score.Leaf):
-        candidate = _inspect._get_sibling_with_graces(ARGUMENT, n)
-        if isinstance(candidate, score.Leaf):
-            return candidate
-        return _inspect._get_leaf_from_leaf(ARGUMENT, n)
+        if n == 0:
+            return ARGUMENT
+        leaf_index = _get_leaf_index(ARGUMENT)
+        if n == 1:
+            leaves = leaf_index.next_leaves
+        else:
+            leaves = leaf_index.previous_leaves
+        if ARGUMENT not in leaves:
+            candidate = _inspect._get_sibling_with_graces(ARGUMENT, n)
+            if not isinstance(candidate, score.Leaf):
+                candidate = _inspect._get_leaf_from_leaf(ARGUMENT, n)
+            leaves[ARGUMENT] = candidate
+        return leaves[ARGUMENT]
     if 0 <= n:
         reverse = False
     else:
@@ -9,16 +9,33 @@ Updates start offsets, stop offsets and indicators everywhere in score.
     implementation of the update manager.
 
 """
-from . import mathx
+import bisect
+
+from . import _inspect
+from ._iterate import _iterate_components
+from .contextmanagers import Profiler
 from .duration import Duration, Multiplier, Offset
 from .indicators.MetronomeMark import MetronomeMark
 from .indicators.TimeSignature import TimeSignature
-from .iterate import Iteration
 from .obgc import OnBeatGraceContainer
 from .parentage import Parentage
-from .score import AfterGraceContainer, BeforeGraceContainer
+from .score import (
+    AfterGraceContainer,
+    BeforeGraceContainer,
+    Container,
+    Context,
+    Leaf,
+)
 from .sequence import Sequence
-from .timespan import AnnotatedTimespan, TimespanList
+from .tempomap import TempoMap
+
+
+def _extend_after_grace_music(container, grace_music):
+    for leaf in container._get_descendants_stopping_with():
+        after_grace_container = getattr(leaf, "_after_grace_container", None)
+        if after_grace_container is not None:
+            components = _iterate_components(after_grace_container, grace=True)
+            grace_music.extend(components)
 
 
 def _get_after_grace_leaf_offsets(leaf):
@@ -100,6 +117,32 @@ def _get_measure_start_offsets(component):
     return measure_start_offsets
 
 
+def _get_on_beat_anchor_start_offset(component, start_offset):
+    """
+    Displaces ``start_offset`` when ``component`` is on-beat anchor leaf.
+    """
+    if (
+        component._parent is not None
+        and OnBeatGraceContainer._is_on_beat_anchor_voice(component._parent)
+        and component is component._parent[0]
+    ):
+        anchor_voice = component._parent
+        assert OnBeatGraceContainer._is_on_beat_anchor_voice(anchor_voice)
+        on_beat_grace_container = None
+        on_beat_wrapper = anchor_voice._parent
+        assert OnBeatGraceContainer._is_on_beat_wrapper(on_beat_wrapper)
+        index = on_beat_wrapper.index(anchor_voice)
+        if index == 0:
+            on_beat_grace_container = on_beat_wrapper[1]
+        else:
+            on_beat_grace_container = on_beat_wrapper[0]
+        if on_beat_grace_container is not None:
+            durations = [_._get_duration() for _ in on_beat_grace_container]
+            start_displacement = sum(durations)
+            start_offset = Offset(start_offset, displacement=start_displacement)
+    return start_offset
+
+
 def _get_on_beat_grace_leaf_offsets(leaf):
     container = leaf._parent
     anchor_leaf = container._get_on_beat_anchor_leaf()
@@ -146,13 +189,30 @@ def _iterate_entire_score(root):
     """
     NOTE: RETURNS GRACE NOTES LAST (AND OUT-OF-ORDER).
     """
-    components = list(Iteration(root).components(grace=False))
-    graces = Iteration(root).components(grace=True)
+    do_not_iterate_grace_containers = not isinstance(root, Container)
+    components = list(
+        _iterate_components(
+            root,
+            do_not_iterate_grace_containers=do_not_iterate_grace_containers,
+            grace=False,
+            snapshot=True,
+        )
+    )
+    graces = _iterate_components(
+        root,
+        do_not_iterate_grace_containers=do_not_iterate_grace_containers,
+        grace=True,
+        snapshot=True,
+    )
     components.extend(graces)
     return components
 
 
 def _make_metronome_mark_map(root):
+    """
+    Makes tempo map once per update; returns none when score has no
+    metronome mark at offset 0.
+    """
     pairs = []
     all_stop_offsets = set()
     for component in _iterate_entire_score(root):
@@ -170,32 +230,14 @@ def _make_metronome_mark_map(root):
     if pairs[0][0] != 0:
         return
     score_stop_offset = max(all_stop_offsets)
-    timespans = TimespanList()
-    clocktime_start_offset = Offset(0)
-    for left, right in Sequence(pairs).nwise(wrapped=True):
-        metronome_mark = left[-1]
-        start_offset = left[0]
-        stop_offset = right[0]
-        # last timespan
-        if stop_offset == 0:
-            stop_offset = score_stop_offset
-        duration = stop_offset - start_offset
-        multiplier = Multiplier(60, metronome_mark.units_per_minute)
-        clocktime_duration = duration / metronome_mark.reference_duration
-        clocktime_duration *= multiplier
-        timespan = AnnotatedTimespan(
-            start_offset=start_offset,
-            stop_offset=stop_offset,
-            annotation=(clocktime_start_offset, clocktime_duration),
-        )
-        timespans.append(timespan)
-        clocktime_start_offset += clocktime_duration
-    return timespans
+    return TempoMap(pairs, score_stop_offset)
 
 
-# TODO: reimplement with some type of bisection
 def _to_measure_number(component, measure_start_offsets):
-    component_start_offset = component._get_timespan().start_offset
+    """
+    Bisects ``measure_start_offsets``; offsets must be current.
+    """
+    component_start_offset = component._start_offset
     displacement = component_start_offset.displacement
     if displacement is not None:
         component_start_offset = Offset(component_start_offset, displacement=None)
@@ -203,17 +245,12 @@ def _to_measure_number(component, measure_start_offsets):
         if displacement < 0 and component_start_offset == 0:
             measure_number = 0
             return measure_number
-    measure_start_offsets = measure_start_offsets[:]
-    measure_start_offsets.append(mathx.Infinity())
-    pairs = Sequence(measure_start_offsets)
-    pairs = pairs.nwise()
-    for measure_index, pair in enumerate(pairs):
-        if pair[0] <= component_start_offset < pair[-1]:
-            measure_number = measure_index + 1
-            return measure_number
-    message = f"can not find measure number for {repr(component)}:\n"
-    message += f"   {repr(measure_start_offsets)}"
-    raise ValueError(message)
+    measure_number = bisect.bisect(measure_start_offsets, component_start_offset)
+    if measure_number == 0:
+        message = f"can not find measure number for {repr(component)}:\n"
+        message += f"   {repr(measure_start_offsets)}"
+        raise ValueError(message)
+    return measure_number
 
 
 def _update_all_indicators(root):
@@ -223,12 +260,14 @@ def _update_all_indicators(root):
     offsets when at least one indicator of the appropriate type
     attaches to score.
     """
+    start_time = Profiler._start()
     components = _iterate_entire_score(root)
     for component in components:
         for wrapper in component._get_indicators(unwrap=False):
             if wrapper.context is not None:
                 wrapper._update_effective_context()
         component._indicators_are_current = True
+    Profiler._stop("update_indicators", start_time)
 
 
 def _update_all_offsets(root):
@@ -236,8 +275,17 @@ def _update_all_offsets(root):
     Updating offsets does not update indicators.
     Updating offsets does not update offsets in seconds.
     """
+    start_time = Profiler._start()
+    _update_offsets_in_order(_iterate_entire_score(root))
+    Profiler._stop("update_all_offsets", start_time)
+
+
+def _update_offsets_in_order(components):
+    """
+    Defers on-beat grace music until all other components are current.
+    """
     on_beat_grace_music = []
-    for component in _iterate_entire_score(root):
+    for component in components:
         if isinstance(component, OnBeatGraceContainer) or isinstance(
             component._parent, OnBeatGraceContainer
         ):
@@ -251,41 +299,48 @@ def _update_all_offsets(root):
 
 
 def _update_all_offsets_in_seconds(root):
-    _update_all_offsets(root)
-    timespans = _make_metronome_mark_map(root)
+    start_time = Profiler._start()
+    _update_changed_offsets(root)
+    tempo_map = _make_metronome_mark_map(root)
     for component in _iterate_entire_score(root):
-        _update_clocktime_offsets(component, timespans)
+        _update_clocktime_offsets(component, tempo_map)
         component._offsets_in_seconds_are_current = True
+    Profiler._stop("update_offsets_in_seconds", start_time)
 
 
-def _update_clocktime_offsets(component, timespans):
-    if not timespans:
-        return
-    for timespan in timespans:
-        if timespan.start_offset <= component._start_offset < timespan.stop_offset:
-            pair = timespan.annotation
-            clocktime_start_offset, clocktime_duration = pair
-            local_offset = component._start_offset - timespan.start_offset
-            multiplier = local_offset / timespan.duration
-            duration = multiplier * clocktime_duration
-            offset = clocktime_start_offset + duration
-            component._start_offset_in_seconds = Offset(offset)
-        if timespan.start_offset <= component._stop_offset < timespan.stop_offset:
-            pair = timespan.annotation
-            clocktime_start_offset, clocktime_duration = pair
-            local_offset = component._stop_offset - timespan.start_offset
-            multiplier = local_offset / timespan.duration
-            duration = multiplier * clocktime_duration
-            offset = clocktime_start_offset + duration
-            component._stop_offset_in_seconds = Offset(offset)
-            return
-    if component._stop_offset == timespans[-1].stop_offset:
-        pair = timespans[-1].annotation
-        clocktime_start_offset, clocktime_duration = pair
-        offset = clocktime_start_offset + clocktime_duration
-        component._stop_offset_in_seconds = Offset(offset)
+def _update_clocktime_offsets(component, tempo_map):
+    if not tempo_map:
         return
-    raise Exception(f"can not find {offset} in {timespans}.")
+    start_offset = tempo_map.offset_to_seconds(component._start_offset)
+    component._start_offset_in_seconds = start_offset
+    stop_offset = tempo_map.offset_to_seconds(component._stop_offset)
+    component._stop_offset_in_seconds = stop_offset
+
+
+def _update_changed_offsets(root):
+    """
+    Updates offsets of components that have changed since the last update.
+
+    Gives the same offsets as ``_update_all_offsets()`` but visits only stale
+    components and those siblings whose start offsets have moved. Subtrees
+    that are current and whose start offsets are unchanged are skipped.
+
+    Grace music attached to (or following) visited leaves is updated
+    afterwards in score order, just as ``_update_all_offsets()`` does.
+    """
+    start_time = Profiler._start()
+    if _inspect._get_grace_container(root):
+        _update_all_offsets(root)
+    else:
+        grace_music = []
+        _update_subtree_offsets(root, Offset(0), Multiplier(1), grace_music)
+        components, ids = [], set()
+        for component in grace_music:
+            if id(component) not in ids:
+                ids.add(id(component))
+                components.append(component)
+        _update_offsets_in_order(components)
+    Profiler._stop("update_offsets", start_time)
 
 
 def _update_component_offsets(component):
@@ -319,39 +374,99 @@ def _update_component_offsets(component):
             start_offset = previous._stop_offset
         else:
             start_offset = Offset(0)
-        # on-beat anchor leaf:
-        if (
-            component._parent is not None
-            and OnBeatGraceContainer._is_on_beat_anchor_voice(component._parent)
-            and component is component._parent[0]
-        ):
-            anchor_voice = component._parent
-            assert OnBeatGraceContainer._is_on_beat_anchor_voice(anchor_voice)
-            on_beat_grace_container = None
-            on_beat_wrapper = anchor_voice._parent
-            assert OnBeatGraceContainer._is_on_beat_wrapper(on_beat_wrapper)
-            index = on_beat_wrapper.index(anchor_voice)
-            if index == 0:
-                on_beat_grace_container = on_beat_wrapper[1]
-            else:
-                on_beat_grace_container = on_beat_wrapper[0]
-            if on_beat_grace_container is not None:
-                durations = [_._get_duration() for _ in on_beat_grace_container]
-                start_displacement = sum(durations)
-                start_offset = Offset(start_offset, displacement=start_displacement)
+        start_offset = _get_on_beat_anchor_start_offset(component, start_offset)
         stop_offset = start_offset + component._get_duration()
     component._start_offset = start_offset
     component._stop_offset = stop_offset
     component._timespan._start_offset = start_offset
     component._timespan._stop_offset = stop_offset
+    if isinstance(component, Context):
+        component._dependent_wrapper_index.clear()
 
 
 def _update_measure_numbers(component):
-    measure_start_offsets = _get_measure_start_offsets(component)
+    """
+    Measure numbers stay current until offsets or time signatures change.
+    """
     root = Parentage(component).root
+    if root._measure_numbers_are_current:
+        return
+    start_time = Profiler._start()
+    measure_start_offsets = _get_measure_start_offsets(root)
     for component in _iterate_entire_score(root):
         measure_number = _to_measure_number(component, measure_start_offsets)
         component._measure_number = measure_number
+    root._measure_numbers_are_current = True
+    Profiler._stop("update_measure_numbers", start_time)
+
+
+def _update_subtree_offsets(component, start_offset, prolation, grace_music):
+    """
+    Updates offsets of ``component`` and of its changed descendants.
+
+    ``start_offset`` is the stop offset of the component that precedes
+    ``component`` in time; ``prolation`` is the product of the implied
+    prolations of the parents of ``component``.
+
+    Returns duration of ``component``.
+    """
+    if isinstance(component, Leaf):
+        grace_music.extend(_iterate_components(component, grace=True))
+    start_offset_ = _get_on_beat_anchor_start_offset(component, start_offset)
+    if (
+        component._offsets_are_current
+        and component._start_offset is not None
+        and component._start_offset == start_offset_
+        and not OnBeatGraceContainer._is_on_beat_anchor_voice(component)
+    ):
+        return component._stop_offset - component._start_offset
+    if isinstance(component, Container):
+        prolation_ = prolation * getattr(component, "implied_prolation", 1)
+        durations = []
+        previous = None
+        for child in component:
+            if previous is None or component.simultaneous:
+                child_start_offset = start_offset
+            else:
+                child_start_offset = previous._stop_offset
+            if isinstance(child, OnBeatGraceContainer):
+                grace_music.extend(_iterate_components(child, grace=True))
+                duration = child._get_duration()
+            else:
+                # after grace music of clean previous container depends on
+                # before grace music of child, which may be new or changed:
+                if (
+                    isinstance(previous, Container)
+                    and not component.simultaneous
+                    and (
+                        getattr(child, "_before_grace_container", None) is not None
+                        or not child._offsets_are_current
+                        or child._start_offset is None
+                    )
+                ):
+                    _extend_after_grace_music(previous, grace_music)
+                duration = _update_subtree_offsets(
+                    child, child_start_offset, prolation_, grace_music
+                )
+            durations.append(duration)
+            previous = child
+        if isinstance(previous, Container) and not component.simultaneous:
+            _extend_after_grace_music(previous, grace_music)
+        if component.simultaneous:
+            duration = max([Duration(0)] + durations)
+        else:
+            duration = sum(durations, Duration(0))
+    else:
+        duration = component._get_preprolated_duration() * prolation
+    stop_offset = start_offset_ + duration
+    component._start_offset = start_offset_
+    component._stop_offset = stop_offset
+    component._timespan._start_offset = start_offset_
+    component._timespan._stop_offset = stop_offset
+    if isinstance(component, Context):
+        component._dependent_wrapper_index.clear()
+    component._offsets_are_current = True
+    return duration
 
 
 def _update_now(component, offsets=False, offsets_in_seconds=False, indicators=False):
@@ -362,14 +477,14 @@ def _update_now(component, offsets=False, offsets_in_seconds=False, indicators=F
     for parent in parentage:
         if parent._is_forbidden_to_update:
             return
-        (
-            offsets_are_current,
-            indicators_are_current,
-            offsets_in_seconds_are_current,
-        ) = _get_score_tree_state_flags(parentage)
+    (
+        offsets_are_current,
+        indicators_are_current,
+        offsets_in_seconds_are_current,
+    ) = _get_score_tree_state_flags(parentage)
     root = parentage.root
     if offsets and not offsets_are_current:
-        _update_all_offsets(root)
+        _update_changed_offsets(root)
     if offsets_in_seconds and not offsets_in_seconds_are_current:
         _update_all_offsets_in_seconds(root)
     if indicators and not indicators_are_current:
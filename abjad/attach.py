@@ -349,12 +349,20 @@ class Wrapper:
             self._update_effective_context()
             if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
                 self._component._update_later(offsets_in_seconds=True)
+            if getattr(self.indicator, "_mutates_measure_numbers", False):
+                self._component._update_later(measure_numbers=True)
         component._wrappers.append(self)
+        if getattr(self.indicator, "_mutates_logical_ties", False):
+            component._clear_leaf_index()
+        # leaves format markup and some indicators attached to containers:
+        component._clear_lilypond_format(descendants=True)
 
     def _bind_effective_context(self, correct_effective_context):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            correct_effective_context._dependent_wrapper_index.clear()
+            correct_effective_context._journal_change()
         self._effective_context = correct_effective_context
         self._update_effective_context()
         if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
@@ -440,9 +448,18 @@ class Wrapper:
             storage_format_keyword_names=keywords,
         )
 
+    def _remove_from_component(self, component):
+        component._wrappers.remove(self)
+        if getattr(self.indicator, "_mutates_measure_numbers", False):
+            component._update_later(measure_numbers=True)
+        if getattr(self.indicator, "_mutates_logical_ties", False):
+            component._clear_leaf_index()
+        component._clear_lilypond_format(descendants=True)
+        component._journal_change()
+
     def _unbind_component(self):
         if self._component is not None and self in self._component._wrappers:
-            self._component._wrappers.remove(self)
+            self._remove_from_component(self._component)
         self._component = None
 
     def _unbind_effective_context(self):
@@ -451,6 +468,8 @@ class Wrapper:
             and self in self._effective_context._dependent_wrappers
         ):
             self._effective_context._dependent_wrappers.remove(self)
+            self._effective_context._dependent_wrapper_index.clear()
+            self._effective_context._journal_change()
         self._effective_context = None
 
     def _update_effective_context(self):
@@ -562,6 +581,8 @@ class Wrapper:
     def deactivate(self, argument):
         assert argument in (True, False, None)
         self._deactivate: typing.Optional[bool] = argument
+        if self._component is not None:
+            self._component._clear_lilypond_format(descendants=True)
 
     @property
     def indicator(self) -> typing.Any:
@@ -658,6 +679,8 @@ class Wrapper:
             raise Exception(f"string or tag: {argument!r}.")
         tag = Tag(argument)
         self._tag = tag
+        if self._component is not None:
+            self._component._clear_lilypond_format(descendants=True)
 
 
 ### FUNCTIONS ###
@@ -1226,7 +1249,8 @@ def detach(argument, target=None, by_id=False):
             result = []
             for wrapper in target._wrappers[:]:
                 if isinstance(wrapper, argument):
-                    target._wrappers.remove(wrapper)
+                    wrapper._remove_from_component(target)
+                    wrapper._unbind_effective_context()
                     result.append(wrapper)
                 elif isinstance(wrapper.indicator, argument):
                     wrapper._detach()
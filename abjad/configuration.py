@@ -262,6 +262,14 @@ class Configuration:
                 "default": None,
                 "validator": str,
             },
+            "parser_tables_directory": {
+                "comment": [
+                    "Set to the directory where Abjad caches parsing tables.",
+                    "Defaults to $HOME/.abjad/parsers/",
+                ],
+                "default": os.path.join(str(self.configuration_directory), "parsers"),
+                "validator": str,
+            },
             "pdf_viewer": {
                 "comment": [
                     "PDF viewer to open PDF files.",
@@ -451,6 +459,15 @@ class Configuration:
         """
         return self.abjad_output_directory / "lily.log"
 
+    @property
+    def parser_tables_directory(self) -> pathlib.Path:
+        """
+        Gets parser tables directory.
+        """
+        if "parser_tables_directory" in self._settings:
+            return pathlib.Path(self._settings["parser_tables_directory"])
+        return self.configuration_directory / "parsers"
+
     ### PUBLIC METHODS ###
 
     def get(self, *arguments, **keywords):
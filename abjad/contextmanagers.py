@@ -8,6 +8,7 @@ import subprocess
 import sys
 import tempfile
 import time
+import typing
 
 from .configuration import Configuration
 from .storage import FormatSpecification, StorageFormatManager
@@ -303,6 +304,153 @@ class NullContextManager(ContextManager):
         pass
 
 
+class Profiler(ContextManager):
+    r"""
+    A context manager for counting and timing score-tree hot paths.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> with abjad.Profiler() as profiler:
+        ...     string = abjad.lilypond(staff)
+        ...     clef = abjad.inspect(staff[-1]).effective(abjad.Clef)
+        ...     clef = abjad.inspect(staff[-1]).effective(abjad.Clef)
+        ...
+
+        >>> for name, count in sorted(profiler.counts.items()):
+        ...     print(count, name)
+        ...
+        5 format
+        5 format_component
+        2 get_effective
+        1 update_indicators
+        1 update_offsets
+
+        >>> print(profiler.report()) # doctest: +SKIP
+        5   0.001412    format
+        5   -           format_component
+        2   0.000288    get_effective
+        1   0.000390    update_indicators
+        1   0.000184    update_offsets
+
+    Counts these hot paths:
+
+    ``format``: component formats that miss format cache.
+
+    ``format_component``: format contribution bundles built for one
+    component.
+
+    ``get_effective``: effective indicator lookups.
+
+    ``update_all_offsets``: offset updates that visit every component.
+
+    ``update_indicators``: effective context updates of every indicator.
+
+    ``update_measure_numbers``: measure number updates.
+
+    ``update_offsets``: offset updates of changed components.
+
+    ``update_offsets_in_seconds``: clock time offset updates of every
+    component.
+
+    Times every hot path except ``format_component``; times are inclusive of
+    nested hot paths. Profilers count hot paths in all threads.
+
+    Profilers cost one check per hot path when inactive. Profilers can be
+    reused between ``with`` blocks; they reset counts and times on entering
+    any ``with`` block.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Context managers"
+
+    __slots__ = ("_counts", "_times")
+
+    _active: typing.List["Profiler"] = []
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self._counts: typing.Counter[str] = collections.Counter()
+        self._times: typing.Counter[str] = collections.Counter()
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        """
+        Enters context manager.
+
+        Returns context manager.
+        """
+        self._counts.clear()
+        self._times.clear()
+        Profiler._active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exits context manager.
+
+        Returns none.
+        """
+        Profiler._active.remove(self)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _count(name):
+        for profiler in Profiler._active:
+            profiler._counts[name] += 1
+
+    @staticmethod
+    def _start():
+        if Profiler._active:
+            return time.perf_counter()
+        return None
+
+    @staticmethod
+    def _stop(name, start_time):
+        if start_time is None:
+            return
+        elapsed_time = time.perf_counter() - start_time
+        for profiler in Profiler._active:
+            profiler._counts[name] += 1
+            profiler._times[name] += elapsed_time
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def counts(self) -> typing.Dict[str, int]:
+        """
+        Gets counts of hot paths.
+        """
+        return dict(self._counts)
+
+    @property
+    def times(self) -> typing.Dict[str, float]:
+        """
+        Gets times of hot paths in seconds.
+        """
+        return dict(self._times)
+
+    ### PUBLIC METHODS ###
+
+    def report(self) -> str:
+        """
+        Reports count and time of each hot path.
+        """
+        strings = []
+        for name in sorted(self._counts):
+            count = self._counts[name]
+            if name in self._times:
+                string = f"{count}\t{self._times[name]:.6f}\t{name}"
+            else:
+                string = f"{count}\t-\t{name}"
+            strings.append(string)
+        return "\n".join(strings)
+
+
 class ProgressIndicator(ContextManager):
     """
     A context manager for printing progress indications.
@@ -48,6 +48,8 @@ class Tie:
 
     _context = "Voice"
 
+    _mutates_logical_ties = True
+
     _persistent = True
 
     ### INITIALIZER ###
@@ -121,6 +121,8 @@ class TimeSignature:
 
     _format_slot = "opening"
 
+    _mutates_measure_numbers = True
+
     _persistent = True
 
     ### INITIALIZER ###
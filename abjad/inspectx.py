@@ -14,6 +14,7 @@ from .score import Chord, Component, Container, Leaf, Note, Staff
 from .selectx import LogicalTie, Selection
 from .storage import StorageFormatManager
 from .tag import Tag
+from .tempomap import TempoMap
 from .timespan import Timespan
 
 
@@ -3703,6 +3704,61 @@ class Inspection:
             return True
         return False
 
+    def tempo_map(self) -> typing.Optional[TempoMap]:
+        r"""
+        Gets tempo map of score that contains client.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> mark = abjad.MetronomeMark((1, 4), 60)
+            >>> abjad.attach(mark, staff[0])
+            >>> mark = abjad.MetronomeMark((1, 4), 90)
+            >>> abjad.attach(mark, staff[2])
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    \tempo 4=60
+                    c'4
+                    d'4
+                    \tempo 4=90
+                    e'4
+                    f'4
+                }
+
+            >>> tempo_map = abjad.inspect(staff[-1]).tempo_map()
+            >>> for offset, mark in tempo_map.pairs:
+            ...     print(repr(offset), repr(mark))
+            Offset((0, 1)) MetronomeMark(reference_duration=Duration(1, 4), units_per_minute=60)
+            Offset((1, 2)) MetronomeMark(reference_duration=Duration(1, 4), units_per_minute=90)
+
+            >>> tempo_map.offset_to_seconds(abjad.Offset(3, 4))
+            Offset((8, 3))
+
+            >>> tempo_map.seconds_to_offset(3)
+            Offset((7, 8))
+
+        ..  container:: example
+
+            Returns none when score has no metronome mark at offset 0:
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> abjad.inspect(staff).tempo_map() is None
+            True
+
+        """
+        from ._update import _make_metronome_mark_map
+
+        if not isinstance(self.client, Component):
+            raise Exception("can only get tempo map of component.")
+        self.client._update_now(offsets=True)
+        root = Parentage(self.client).root
+        return _make_metronome_mark_map(root)
+
     def timespan(self, in_seconds: bool = False) -> Timespan:
         r"""
         Gets timespan.
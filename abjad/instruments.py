@@ -1,10 +1,13 @@
 """
 Instrument classes.
 """
+import collections
 import copy
+import heapq
+import itertools
+import math
 import typing
 
-from .enumeratex import Enumerator
 from .markups import Markup
 from .pitch.PitchRange import PitchRange
 from .pitch.pitchclasses import NamedPitchClass
@@ -543,9 +546,27 @@ class Tuning:
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _count_arrangements(counts):
+        result = math.factorial(sum(counts))
+        for count in counts:
+            result //= math.factorial(count)
+        return result
+
     def _get_format_specification(self):
         return FormatSpecification(client=self)
 
+    @staticmethod
+    def _make_voicing_option(pitch):
+        # named pitches compare equal to none as though it were middle C
+        number = None if pitch is None else pitch.number
+        named_pitch = NamedPitch(pitch)
+        sort_key = (
+            named_pitch._get_diatonic_pitch_number(),
+            named_pitch.accidental.semitones,
+        )
+        return pitch, number, sort_key
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -656,7 +677,15 @@ class Tuning:
             result.append(pitch)
         return tuple(result)
 
-    def voice_pitch_classes(self, pitch_classes, allow_open_strings: bool = True):
+    def voice_pitch_classes(
+        self,
+        pitch_classes,
+        allow_open_strings: bool = True,
+        *,
+        maximum_span: typing.Union[int, float] = None,
+        maximum_voicings: int = None,
+        prefer_open_strings: bool = False,
+    ) -> typing.Tuple[typing.Tuple[typing.Optional[NamedPitch], ...], ...]:
         r"""
         Voices ``pitch_classes``.
 
@@ -733,36 +762,147 @@ class Tuning:
             (NamedPitch("d''"), NamedPitch("a'"), None, None)
             (NamedPitch("d''"), NamedPitch("a''"), None, None)
 
+        ..  container:: example
+
+            Prunes voicings wider than ``maximum_span`` semitones and keeps
+            only the first ``maximum_voicings`` voicings:
+
+            >>> voicings = tuning.voice_pitch_classes(
+            ...     ('a', 'd'),
+            ...     maximum_span=5,
+            ...     maximum_voicings=4,
+            ...     )
+            >>> for voicing in voicings:
+            ...     voicing
+            ...
+            (NamedPitch('a'), NamedPitch("d'"), None, None)
+            (None, None, NamedPitch("a''"), NamedPitch("d'''"))
+            (None, None, NamedPitch("d'''"), NamedPitch("a''"))
+            (None, None, NamedPitch("a'''"), NamedPitch("d''''"))
+
+        ..  container:: example
+
+            Voices pitch-classes sounded by open strings only on those open
+            strings:
+
+            >>> voicings = tuning.voice_pitch_classes(('a', 'e'), maximum_span=7)
+            >>> len(voicings)
+            30
+
+            >>> voicings = tuning.voice_pitch_classes(
+            ...     ('a', 'e'),
+            ...     maximum_span=7,
+            ...     prefer_open_strings=True,
+            ...     )
+            >>> len(voicings)
+            23
+
+        Returns voicings sorted in ascending order.
+        """
+        voicings = self.yield_voicings(
+            pitch_classes,
+            allow_open_strings=allow_open_strings,
+            maximum_span=maximum_span,
+            prefer_open_strings=prefer_open_strings,
+        )
+        if maximum_voicings is not None:
+            voicings = itertools.islice(voicings, maximum_voicings)
+        return tuple(voicings)
+
+    def yield_voicings(
+        self,
+        pitch_classes,
+        *,
+        allow_open_strings: bool = True,
+        maximum_span: typing.Union[int, float] = None,
+        prefer_open_strings: bool = False,
+    ) -> typing.Iterator[typing.Tuple[typing.Optional[NamedPitch], ...]]:
+        """
+        Yields voicings of ``pitch_classes`` lazily in ascending order.
+
+        ..  container:: example
+
+            >>> tuning = abjad.Tuning(('E2', 'A2', 'D3', 'G3', 'B3', 'E4'))
+            >>> voicings = tuning.yield_voicings(
+            ...     ('c', 'e', 'g', 'bf'),
+            ...     maximum_span=10,
+            ...     )
+            >>> next(voicings)
+            (NamedPitch('bf,'), NamedPitch('c'), NamedPitch('e'), NamedPitch('g'), None, None)
+
+        Assigns one pitch-class or none to each string, string by string, and
+        abandons partial voicings that break ``maximum_span``. Partial
+        voicings that agree on a string are merged, so voicings come out in
+        the same order as ``voice_pitch_classes()``, one at a time.
+
+        Set ``prefer_open_strings`` to true to voice a pitch-class only on the
+        open string of each string whose open string sounds it.
         """
         assert self.pitches is not None
+        if prefer_open_strings and not allow_open_strings:
+            message = "can not prefer open strings that are not allowed."
+            raise ValueError(message)
         pitch_classes = [NamedPitchClass(_) for _ in pitch_classes]
         pitch_classes.extend([None] * (len(self.pitches) - len(pitch_classes)))
-        enumerator = Enumerator(pitch_classes)
-        permutations = enumerator.yield_permutations()
-        permutations = set([tuple(_) for _ in permutations])
-        pitch_ranges = self.pitch_ranges
-        result: typing.List[typing.Tuple[typing.Union[NamedPitch, None], ...]] = []
-        for permutation in permutations:
-            sequences: typing.List = []
-            for pitch_range, pitch_class in zip(pitch_ranges, permutation):
-                pitches: typing.List[typing.Optional[NamedPitch]]
-                if pitch_class is None:
-                    sequences.append([None])
+        counts = collections.Counter(pitch_classes)
+        keys = list(counts)
+        options = []
+        for pitch_range in self.pitch_ranges:
+            open_string = pitch_range.start_pitch
+            options_ = []
+            for key in keys:
+                if key is None:
+                    options_.append([self._make_voicing_option(None)])
                     continue
-                pitches = list(pitch_range.voice_pitch_class(pitch_class))
+                pitches = list(pitch_range.voice_pitch_class(key))
                 if not allow_open_strings:
-                    pitches = [
-                        pitch for pitch in pitches if pitch != pitch_range.start_pitch
-                    ]
+                    pitches = [_ for _ in pitches if _ != open_string]
+                elif prefer_open_strings and open_string in pitches:
+                    pitches = [open_string]
                 if not pitches:
                     pitches = [None]
-                sequences.append(pitches)
-            enumerator = Enumerator(sequences)
-            subresult = enumerator.yield_outer_product()
-            subresult = [tuple(x) for x in subresult]
-            result.extend(subresult)
-        result.sort()
-        return tuple(result)
+                options_.append([self._make_voicing_option(_) for _ in pitches])
+            options.append(options_)
+        remaining = [counts[_] for _ in keys]
+
+        def recurse(index, low, high):
+            if index == len(options):
+                for _ in range(self._count_arrangements(remaining)):
+                    yield (), ()
+                return
+            branches: typing.Dict[typing.Tuple, typing.List] = {}
+            for i, pitches in enumerate(options[index]):
+                if not remaining[i]:
+                    continue
+                for pitch, number, sort_key in pitches:
+                    low_, high_ = low, high
+                    if pitch is not None:
+                        if low_ is None or number < low_:
+                            low_ = number
+                        if high_ is None or high_ < number:
+                            high_ = number
+                        if maximum_span is not None and maximum_span < high_ - low_:
+                            continue
+                    branches.setdefault(sort_key, []).append((i, pitch, low_, high_))
+            for sort_key in sorted(branches):
+                generators = [branch(index, sort_key, *_) for _ in branches[sort_key]]
+                if len(generators) == 1:
+                    yield from generators[0]
+                else:
+                    yield from heapq.merge(*generators, key=lambda _: _[0])
+
+        def branch(index, sort_key, i, pitch, low, high):
+            remaining[i] -= 1
+            try:
+                for sort_keys_, voicing in recurse(index + 1, low, high):
+                    remaining[i] += 1
+                    yield (sort_key,) + sort_keys_, (pitch,) + voicing
+                    remaining[i] -= 1
+            finally:
+                remaining[i] += 1
+
+        for _, voicing in recurse(0, None, None):
+            yield voicing
 
 
 class Accordion(Instrument):
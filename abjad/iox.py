@@ -1,3 +1,5 @@
+import collections
+import concurrent.futures
 import cProfile
 import datetime
 import difflib
@@ -28,6 +30,10 @@ from .score import Container, Leaf, Tuplet
 
 configuration = Configuration()
 
+LilyPondRenderJob = collections.namedtuple(
+    "LilyPondRenderJob", ("ly_path", "log_path", "render_time", "skipped", "success")
+)
+
 
 class AbjadGrapher(uqbar.graphs.Grapher):
     """
@@ -252,6 +258,31 @@ class IOManager:
             lines.append(line)
         return "\n".join(lines)
 
+    @staticmethod
+    def _run_lilypond_job(ly_path, flags, force):
+        ly_path = str(ly_path)
+        lilypond_base, extension = os.path.splitext(ly_path)
+        log_path = f"{lilypond_base}.log"
+        hash_path = f"{ly_path}.sha1"
+        with open(ly_path, "rb") as file_pointer:
+            checksum = hashlib.sha1(file_pointer.read())
+        checksum.update((flags or "").encode())
+        checksum = checksum.hexdigest()
+        if not force and os.path.isfile(hash_path):
+            with open(hash_path) as file_pointer:
+                if file_pointer.read() == checksum:
+                    return LilyPondRenderJob(ly_path, log_path, 0, True, True)
+        with Timer() as timer:
+            success = IOManager.run_lilypond(
+                ly_path, flags=flags, lilypond_log_file_path=log_path
+            )
+        if success:
+            with open(hash_path, "w") as file_pointer:
+                file_pointer.write(checksum)
+        elif os.path.isfile(hash_path):
+            os.remove(hash_path)
+        return LilyPondRenderJob(ly_path, log_path, timer.elapsed_time, False, success)
+
     @staticmethod
     def _warn_when_output_directory_almost_full(last_number):
         abjad_output_directory = configuration["abjad_output_directory"]
@@ -635,6 +666,44 @@ class IOManager:
             return False
         return True
 
+    @staticmethod
+    def run_lilypond_many(
+        ly_paths: typing.Iterable, *, flags: str = None, force=False, workers=None,
+    ) -> typing.List[LilyPondRenderJob]:
+        r"""
+        Runs LilyPond on each of ``ly_paths`` with at most ``workers``
+        LilyPond processes running at once.
+
+        Renders score package segments concurrently:
+
+        >>> path = abjad.Path("/path/to/scores/my_score/my_score/segments")
+        >>> ly_paths = sorted(path.glob("*/illustration.ly"))
+        >>> jobs = abjad.IOManager.run_lilypond_many(ly_paths) # doctest: +SKIP
+
+        Writes LilyPond output of each ``.ly`` file to a log file with the
+        same stem. Writes SHA-1 hash of ``.ly`` file contents (and ``flags``)
+        to a ``.ly.sha1`` file after each successful render; skips ``.ly``
+        files whose hash is unchanged unless ``force`` is true. Files
+        included with ``\include`` are not hashed.
+
+        Sets ``workers`` to the number of CPUs when ``workers`` is none.
+
+        Returns one ``(ly_path, log_path, render_time, skipped, success)``
+        job per ``.ly`` file, in input order.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(f"workers must be positive integer: {workers!r}.")
+        ly_paths = list(ly_paths)
+        # LilyPond runs in subprocesses; threads only wait on them:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(IOManager._run_lilypond_job, _, flags, force)
+                for _ in ly_paths
+            ]
+            return [_.result() for _ in futures]
+
     @staticmethod
     def spawn_subprocess(command: str) -> int:
         """
@@ -695,11 +764,22 @@ class PersistenceManager:
     ### PUBLIC METHODS ###
 
     def as_ly(
-        self, ly_file_path, *, illustrate_function=None, strict=None, **keywords,
+        self,
+        ly_file_path,
+        *,
+        illustrate_function=None,
+        strict=None,
+        streaming=False,
+        **keywords,
     ):
         """
         Persists client as LilyPond file.
 
+        Writes format pieces to file as score is walked when ``streaming`` is
+        true. Output is identical but memory use no longer grows with the
+        length of the formatted string; elapsed formatting time then includes
+        writing time.
+
         Returns output path and elapsed formatting time when LilyPond output is
         written.
         """
@@ -715,6 +795,18 @@ class PersistenceManager:
         ly_file_path = str(ly_file_path)
         ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith(".ly"), ly_file_path
+        if streaming:
+            directory = os.path.dirname(ly_file_path)
+            IOManager._ensure_directory_existence(directory)
+            timer = Timer()
+            with timer, open(ly_file_path, "w") as file_pointer:
+                for i, line in enumerate(lilypond_file._iterate_format_lines()):
+                    if isinstance(strict, int):
+                        line = LilyPondFormatManager.align_tags(line, strict)
+                    if 0 < i:
+                        file_pointer.write("\n")
+                    file_pointer.write(line)
+            return ly_file_path, timer.elapsed_time
         timer = Timer()
         with timer:
             string = lilypond_file._get_lilypond_format()
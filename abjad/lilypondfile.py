@@ -2,6 +2,7 @@ import collections
 import copy
 import importlib
 import inspect
+import itertools
 import numbers
 import os
 import pathlib
@@ -154,33 +155,7 @@ class Block:
     ### PRIVATE METHODS ###
 
     def _format_item(self, item, depth=1):
-        indent = LilyPondFormatBundle.indent * depth
-        result = []
-        if isinstance(item, (list, tuple)):
-            result.append(indent + "{")
-            depth_ = depth + 1
-            for x in item:
-                pieces = self._format_item(x, depth=depth_)
-                result.extend(pieces)
-            result.append(indent + "}")
-        elif isinstance(item, str):
-            if item.isspace():
-                string = ""
-            else:
-                string = indent + item
-            result.append(string)
-        elif "_get_format_pieces" in dir(item):
-            try:
-                pieces = item._get_format_pieces()
-            except TypeError:
-                pieces = item._get_format_pieces()
-            for piece in pieces:
-                if piece.isspace():
-                    piece = ""
-                else:
-                    piece = indent + piece
-                result.append(piece)
-        return result
+        return list(self._iterate_item_pieces(item, depth=depth))
 
     def _formatted_context_blocks(self):
         result = []
@@ -193,43 +168,7 @@ class Block:
         return result
 
     def _get_format_pieces(self, tag=None):
-        indent = LilyPondFormatBundle.indent
-        result = []
-        if (
-            not self._get_formatted_user_attributes()
-            and not getattr(self, "contexts", None)
-            and not getattr(self, "context_blocks", None)
-            and not len(self.items)
-        ):
-            if self.name == "score":
-                return ""
-            string = f"{self._escaped_name} {{}}"
-            result.append(string)
-            return result
-        string = f"{self._escaped_name} {{"
-        if tag is not None:
-            strings = Tag.tag([string], tag=tag)
-            string = strings[0]
-        result.append(string)
-        for item in self.items:
-            if isinstance(item, ContextBlock):
-                continue
-            if isinstance(item, (Leaf, Markup)):
-                item = [item]
-            result.extend(self._format_item(item))
-        formatted_attributes = self._get_formatted_user_attributes()
-        formatted_attributes = [indent + _ for _ in formatted_attributes]
-        result.extend(formatted_attributes)
-        formatted_context_blocks = self._formatted_context_blocks()
-        formatted_context_blocks = [indent + _ for _ in formatted_context_blocks]
-        result.extend(formatted_context_blocks)
-        string = "}"
-        if tag is not None:
-            strings = Tag.tag([string], tag=tag)
-            string = strings[0]
-        result.append(string)
-
-        return result
+        return list(self._iterate_format_pieces(tag=tag))
 
     def _get_format_specification(self):
         return FormatSpecification(
@@ -271,6 +210,67 @@ class Block:
     def _get_lilypond_format(self, tag=None):
         return "\n".join(self._get_format_pieces(tag=tag))
 
+    def _iterate_format_pieces(self, tag=None, streaming=False):
+        indent = LilyPondFormatBundle.indent
+        if (
+            not self._get_formatted_user_attributes()
+            and not getattr(self, "contexts", None)
+            and not getattr(self, "context_blocks", None)
+            and not len(self.items)
+        ):
+            if self.name == "score":
+                return
+            yield f"{self._escaped_name} {{}}"
+            return
+        string = f"{self._escaped_name} {{"
+        if tag is not None:
+            strings = Tag.tag([string], tag=tag)
+            string = strings[0]
+        yield string
+        for item in self.items:
+            if isinstance(item, ContextBlock):
+                continue
+            if isinstance(item, (Leaf, Markup)):
+                item = [item]
+            yield from self._iterate_item_pieces(item, streaming=streaming)
+        formatted_attributes = self._get_formatted_user_attributes()
+        for string in formatted_attributes:
+            yield indent + string
+        formatted_context_blocks = self._formatted_context_blocks()
+        for string in formatted_context_blocks:
+            yield indent + string
+        string = "}"
+        if tag is not None:
+            strings = Tag.tag([string], tag=tag)
+            string = strings[0]
+        yield string
+
+    def _iterate_item_pieces(self, item, depth=1, streaming=False):
+        indent = LilyPondFormatBundle.indent * depth
+        if isinstance(item, (list, tuple)):
+            yield indent + "{"
+            depth_ = depth + 1
+            for x in item:
+                yield from self._iterate_item_pieces(
+                    x, depth=depth_, streaming=streaming
+                )
+            yield indent + "}"
+        elif isinstance(item, str):
+            if item.isspace():
+                yield ""
+            else:
+                yield indent + item
+        elif "_get_format_pieces" in dir(item):
+            if streaming and isinstance(item, Component):
+                pieces = item._get_format_pieces(streaming=True)
+            else:
+                pieces = item._get_format_pieces()
+            for piece in pieces:
+                if piece.isspace():
+                    yield ""
+                else:
+                    yield indent + piece
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -462,6 +462,9 @@ class ContextBlock(Block):
         result.append("}")
         return result
 
+    def _iterate_format_pieces(self, tag=None, streaming=False):
+        yield from self._get_format_pieces(tag=tag)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1185,30 +1188,7 @@ class LilyPondFile:
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self, tag=None):
-        result = []
-        if self.date_time_token is not None:
-            string = f"% {self.date_time_token}"
-            result.append(string)
-        result.extend(self._get_formatted_comments())
-        includes = []
-        if self.lilypond_version_token is not None:
-            string = f"{self.lilypond_version_token._get_lilypond_format()}"
-            includes.append(string)
-        if self.lilypond_language_token is not None:
-            string = f"{self.lilypond_language_token._get_lilypond_format()}"
-            includes.append(string)
-        tag = Tag("abjad.LilyPondFile._get_format_pieces()")
-        includes = Tag.tag(includes, tag=self.get_tag(tag))
-        includes = "\n".join(includes)
-        if includes:
-            result.append(includes)
-        postincludes = []
-        if self.use_relative_includes:
-            string = "#(ly:set-option 'relative-includes #t)"
-            postincludes.append(string)
-        postincludes.extend(self._get_formatted_includes())
-        postincludes.extend(self._get_formatted_scheme_settings())
-        result.extend(postincludes)
+        result = self._get_formatted_preamble()
         result.extend(self._get_formatted_blocks())
         return result
 
@@ -1219,18 +1199,9 @@ class LilyPondFile:
 
     def _get_formatted_blocks(self):
         result = []
-        tag = Tag("abjad.LilyPondFile._get_formatted_blocks()")
-        tag = self.get_tag(tag)
-        for item in self.items:
-            if "_get_lilypond_format" in dir(item) and not isinstance(item, str):
-                try:
-                    string = item._get_lilypond_format(tag=tag)
-                except TypeError:
-                    string = item._get_lilypond_format()
-                if string:
-                    result.append(string)
-            else:
-                result.append(str(item))
+        for pieces in self._iterate_formatted_blocks():
+            string = "\n".join(pieces)
+            result.append(string)
         return result
 
     def _get_formatted_comments(self):
@@ -1269,6 +1240,33 @@ class LilyPondFile:
             result = ["\n".join(result)]
         return result
 
+    def _get_formatted_preamble(self):
+        result = []
+        if self.date_time_token is not None:
+            string = f"% {self.date_time_token}"
+            result.append(string)
+        result.extend(self._get_formatted_comments())
+        includes = []
+        if self.lilypond_version_token is not None:
+            string = f"{self.lilypond_version_token._get_lilypond_format()}"
+            includes.append(string)
+        if self.lilypond_language_token is not None:
+            string = f"{self.lilypond_language_token._get_lilypond_format()}"
+            includes.append(string)
+        tag = Tag("abjad.LilyPondFile._get_format_pieces()")
+        includes = Tag.tag(includes, tag=self.get_tag(tag))
+        includes = "\n".join(includes)
+        if includes:
+            result.append(includes)
+        postincludes = []
+        if self.use_relative_includes:
+            string = "#(ly:set-option 'relative-includes #t)"
+            postincludes.append(string)
+        postincludes.extend(self._get_formatted_includes())
+        postincludes.extend(self._get_formatted_scheme_settings())
+        result.extend(postincludes)
+        return result
+
     def _get_formatted_scheme_settings(self):
         result = []
         tag = Tag("abjad.LilyPondFile._get_formatted_scheme_settings()")
@@ -1297,6 +1295,41 @@ class LilyPondFile:
                 lines.append(line)
         return "\n".join(lines)
 
+    def _iterate_format_lines(self):
+        pieces = [[_] for _ in self._get_formatted_preamble()]
+        pieces = itertools.chain(pieces, self._iterate_formatted_blocks(streaming=True))
+        for i, pieces_ in enumerate(pieces):
+            if 0 < i:
+                yield ""
+            for piece in pieces_:
+                for line in piece.split("\n"):
+                    if line.isspace():
+                        yield ""
+                    else:
+                        yield line
+
+    def _iterate_formatted_blocks(self, streaming=False):
+        tag = Tag("abjad.LilyPondFile._get_formatted_blocks()")
+        tag = self.get_tag(tag)
+        for item in self.items:
+            if "_get_lilypond_format" in dir(item) and not isinstance(item, str):
+                if streaming and isinstance(item, Block):
+                    pieces = item._iterate_format_pieces(tag=tag, streaming=True)
+                elif streaming and isinstance(item, Component):
+                    pieces = item._iterate_lilypond_format()
+                else:
+                    try:
+                        pieces = [item._get_lilypond_format(tag=tag)]
+                    except TypeError:
+                        pieces = [item._get_lilypond_format()]
+                # skips blocks that format empty:
+                pieces = iter(pieces)
+                first_piece = next(pieces, "")
+                if first_piece:
+                    yield itertools.chain([first_piece], pieces)
+            else:
+                yield [str(item)]
+
     @staticmethod
     def _make_global_context_block(font_size=3, minimum_distance=10, padding=4):
         assert isinstance(font_size, (int, float))
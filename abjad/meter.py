@@ -248,23 +248,59 @@ class Meter:
     and ``3`` summing to that prime. Summands are arranged from greatest
     to least by default. This means that ``5`` becomes ``3+2`` and ``7``
     becomes ``3+2+2`` in the examples above.
+
+    ..  container:: example
+
+        Meters initialized from pairs, time signatures and other fraction-like
+        objects are interned:
+
+        >>> abjad.Meter((3, 4)) is abjad.Meter(abjad.TimeSignature((3, 4)))
+        True
+
+        >>> abjad.Meter((3, 4)) is abjad.Meter((6, 8))
+        False
+
+        Meters are treated as immutable: do not change the root node of a
+        meter in place.
     """
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "_depthwise_offset_inventory",
         "_increase_monotonic",
         "_denominator",
         "_numerator",
+        "_offset_kernels",
         "_preferred_boundary_depth",
         "_root_node",
     )
 
+    _identity_map: typing.Dict[typing.Tuple, "Meter"] = {}
+
+    ### CONSTRUCTOR ###
+
+    def __new__(
+        class_, argument=None, increase_monotonic=None, preferred_boundary_depth=None,
+    ):
+        key = class_._get_intern_key(
+            argument, increase_monotonic, preferred_boundary_depth
+        )
+        if key is not None and key in class_._identity_map:
+            return class_._identity_map[key]
+        return object.__new__(class_)
+
     ### INITIALIZER ###
 
     def __init__(
         self, argument=None, increase_monotonic=None, preferred_boundary_depth=None,
     ):
+        # interned meter already initialized:
+        if getattr(self, "_root_node", None) is not None:
+            return
+        key = self._get_intern_key(
+            argument, increase_monotonic, preferred_boundary_depth
+        )
         argument = argument or (4, 4)
         assert isinstance(preferred_boundary_depth, (int, type(None)))
         self._preferred_boundary_depth = preferred_boundary_depth
@@ -367,10 +403,14 @@ class Meter:
             name = type(self).__name__
             raise ValueError(f"can not initialize {name}: {argument!r}.")
 
+        self._depthwise_offset_inventory = None
+        self._offset_kernels = {}
         self._root_node = root
         self._numerator = numerator
         self._denominator = denominator
         self._increase_monotonic = increase_monotonic
+        if key is not None:
+            type(self)._identity_map[key] = self
 
     ### SPECIAL METHODS ###
 
@@ -635,6 +675,31 @@ class Meter:
             stop_offset = stop_offset.with_denominator(self.denominator)
             yield start_offset, stop_offset
 
+    def __reduce__(self):
+        """
+        Reduces meter for copy and pickle.
+
+        ..  container:: example
+
+            Copies of interned meters are interned meters:
+
+            >>> import copy
+            >>> meter = abjad.Meter((3, 4))
+            >>> copy.deepcopy(meter) is meter
+            True
+
+        Returns pair.
+        """
+        key = self._get_intern_key(
+            self.pair, self.increase_monotonic, self.preferred_boundary_depth
+        )
+        if self._identity_map.get(key) is self:
+            argument = self.pair
+        else:
+            argument = self.rtm_format
+        arguments = (argument, self.increase_monotonic, self.preferred_boundary_depth)
+        return type(self), arguments
+
     def __repr__(self) -> str:
         """
         Gets interpreter representation.
@@ -674,6 +739,23 @@ class Meter:
             storage_format_keyword_names=[],
         )
 
+    @classmethod
+    def _get_intern_key(
+        class_, argument, increase_monotonic=None, preferred_boundary_depth=None
+    ):
+        argument = argument or (4, 4)
+        if isinstance(argument, (Meter, str, rhythmtrees.RhythmTreeContainer)):
+            return None
+        if isinstance(argument, tuple):
+            if len(argument) != 2 or not all(isinstance(_, int) for _ in argument):
+                return None
+            pair = argument
+        elif hasattr(argument, "numerator") and hasattr(argument, "denominator"):
+            pair = (argument.numerator, argument.denominator)
+        else:
+            return None
+        return (class_, pair, bool(increase_monotonic), preferred_boundary_depth)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -708,6 +790,8 @@ class Meter:
 
         Returns dictionary.
         """
+        if self._depthwise_offset_inventory is not None:
+            return self._depthwise_offset_inventory
         inventory = []
         all_offsets = set()
         all_offsets.add(Offset(self.numerator, self.denominator))
@@ -715,7 +799,8 @@ class Meter:
             for node in nodes:
                 all_offsets.add(Offset(node.start_offset))
             inventory.append(tuple(sorted(all_offsets)))
-        return tuple(inventory)
+        self._depthwise_offset_inventory = tuple(inventory)
+        return self._depthwise_offset_inventory
 
     @property
     def duration(self):
@@ -1100,6 +1185,8 @@ class Meter:
         discard_final_orphan_downbeat=True,
         maximum_run_length=None,
         starting_offset=None,
+        search="greedy",
+        beam_width=None,
     ):
         """
         Finds the best-matching sequence of meters for the offsets
@@ -1137,6 +1224,29 @@ class Meter:
             5/4
             5/4
 
+        ..  container:: example
+
+            Set ``search`` to ``"viterbi"`` to maximize summed response over
+            the whole of ``argument`` instead of choosing meters greedily;
+            here every offset falls on a beat of ``5/4``:
+
+            >>> argument = [(0, 4), (3, 4), (5, 4), (10, 4), (15, 4), (20, 4)]
+            >>> for meter in abjad.Meter.fit_meters(
+            ...     argument, meters, search="viterbi"
+            ... ):
+            ...     print(meter.implied_time_signature)
+            ...
+            5/4
+            5/4
+            5/4
+            5/4
+
+            Viterbi search counts offsets on integer ticks of duration ``1 /
+            denominator`` and runs in time linear in the length of
+            ``argument``. Offsets that fall between ticks are ignored. Set
+            ``beam_width`` to keep only that many best-scoring candidates
+            at each tick when ``maximum_run_length`` is set.
+
         Coerces offsets from ``argument`` via
         ``MetricAccentKernel.count_offsets()``.
 
@@ -1144,12 +1254,23 @@ class Meter:
 
         Returns list.
         """
-        session = _MeterFittingSession(
-            kernel_denominator=denominator,
-            maximum_run_length=maximum_run_length,
-            meters=meters,
-            offset_counter=argument,
-        )
+        if search == "greedy":
+            session = _MeterFittingSession(
+                kernel_denominator=denominator,
+                maximum_run_length=maximum_run_length,
+                meters=meters,
+                offset_counter=argument,
+            )
+        elif search == "viterbi":
+            session = _ViterbiMeterFittingSession(
+                beam_width=beam_width,
+                kernel_denominator=denominator,
+                maximum_run_length=maximum_run_length,
+                meters=meters,
+                offset_counter=argument,
+            )
+        else:
+            raise ValueError(f"search must be 'greedy' or 'viterbi': {search!r}.")
         meters = session()
         return meters
 
@@ -1181,8 +1302,13 @@ class Meter:
         This is useful for testing how strongly a collection of offsets
         responds to a given meter.
 
+        Caches kernel by ``denominator`` and ``normalize``.
+
         Returns dictionary.
         """
+        key = (denominator, bool(normalize))
+        if key in self._offset_kernels:
+            return self._offset_kernels[key]
         assert mathx.is_positive_integer_power_of_two(denominator // self.denominator)
         inventory = list(self.depthwise_offset_inventory)
         old_flag_count = Duration(1, self.denominator).flag_count
@@ -1207,7 +1333,8 @@ class Meter:
         if normalize:
             for offset, response in kernel.items():
                 kernel[offset] = Multiplier(response, total)
-        return MetricAccentKernel(kernel)
+        self._offset_kernels[key] = MetricAccentKernel(kernel)
+        return self._offset_kernels[key]
 
     def rewrite_meter(
         components,
@@ -2466,6 +2593,112 @@ class Meter:
                     maximum_dot_count=maximum_dot_count,
                 )
 
+    @staticmethod
+    def rewrite_meters(
+        components,
+        meters,
+        boundary_depth=None,
+        maximum_dot_count=None,
+        rewrite_tuplets=True,
+    ):
+        r"""
+        Rewrites ``components`` to match consecutive ``meters``.
+
+        ..  container:: example
+
+            Splits ``components`` at barlines and rewrites each measure:
+
+            >>> staff = abjad.Staff("c'2 d'2 e'2 f'4. g'8")
+            >>> meters = [(3, 4), (3, 4), (2, 4)]
+            >>> abjad.Meter.rewrite_meters(staff, meters)
+            >>> abjad.show(staff) # doctest: +SKIP
+
+            ..  docs::
+
+                >>> abjad.f(staff)
+                \new Staff
+                {
+                    c'2
+                    d'4
+                    ~
+                    d'4
+                    e'2
+                    f'4.
+                    g'8
+                }
+
+        Equivalent to splitting ``components`` at barlines with
+        ``abjad.mutate().split()`` and then calling ``rewrite_meter()`` on
+        each measure. But rewrites each measure in a temporary container
+        that is detached from the score, and then reinserts all measures in
+        a single mutation. Offsets of the score are therefore updated once
+        rather than after every split.
+
+        Coerces ``meters`` with ``abjad.Meter``; ``components`` may be a
+        container or a selection of consecutive components with the same
+        unprolated parent. Uses only as many meters as needed to cover
+        ``components``.
+
+        Raises value error when ``meters`` are shorter than ``components``.
+
+        Operates in place and returns none.
+        """
+        if isinstance(components, Container):
+            components = components[:]
+        assert isinstance(components, Selection), repr(components)
+        if not components:
+            return
+        parent = components[0]._parent
+        assert parent is not None, repr(components)
+        assert all(_._parent is parent for _ in components), repr(components)
+        if Parentage(parent).prolation != 1:
+            raise ValueError(f"components must not be prolated: {components!r}.")
+        meters = [_ if isinstance(_, Meter) else Meter(_) for _ in meters]
+        durations = [_inspect._get_duration(_) for _ in components]
+        duration = sum(durations)
+        barlines = mathx.cumulative_sums([_.duration for _ in meters], start=None)
+        if not barlines or barlines[-1] < duration:
+            message = f"meters {meters!r} shorter than {duration!r}."
+            raise ValueError(message)
+        meters = meters[: bisect.bisect_left(barlines, duration) + 1]
+        # detach components and find split points in one offset pass:
+        start = parent.index(components[0])
+        del parent[start : start + len(components)]
+        shards = [[] for _ in meters]
+        i, start_offset = 0, Duration(0)
+        for component, duration in zip(components, durations):
+            stop_offset = start_offset + duration
+            while barlines[i] <= start_offset:
+                i += 1
+            if stop_offset <= barlines[i]:
+                shards[i].append(component)
+            else:
+                split_durations, offset, j = [], start_offset, i
+                while barlines[j] < stop_offset:
+                    split_durations.append(barlines[j] - offset)
+                    offset = barlines[j]
+                    j += 1
+                split_durations.append(stop_offset - offset)
+                container = Container([component])
+                selections = Mutation(container[:]).split(split_durations)
+                del container[:]
+                for k, selection in enumerate(selections):
+                    shards[i + k].extend(selection)
+            start_offset = stop_offset
+        # rewrite each measure apart from score:
+        containers = []
+        for shard, meter in zip(shards, meters):
+            container = Container(shard)
+            Meter.rewrite_meter(
+                container[:],
+                meter,
+                boundary_depth=boundary_depth,
+                maximum_dot_count=maximum_dot_count,
+                rewrite_tuplets=rewrite_tuplets,
+            )
+            containers.append(container)
+        parent[start:start] = [_ for container in containers for _ in container[:]]
+
 
 class MeterList(TypedList):
     """
@@ -3179,6 +3412,165 @@ class _MeterFittingSession:
         return self._ordered_offsets
 
 
+class _ViterbiMeterFittingSession(_MeterFittingSession):
+    """
+    Viterbi meter-fitting session.
+
+    Used internally by Meter.fit_meters().
+
+    Scores each kernel placement as kernel response times kernel duration,
+    so that a run of short meters scores no higher than a long meter
+    covering the same offsets. Finds the sequence of meters with greatest
+    summed score by dynamic programming over integer ticks.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_beam_width",)
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        beam_width=None,
+        kernel_denominator=32,
+        maximum_run_length=None,
+        meters=None,
+        offset_counter=None,
+    ):
+        if beam_width is not None:
+            beam_width = int(beam_width)
+            assert 0 < beam_width
+        self._beam_width = beam_width
+        _MeterFittingSession.__init__(
+            self,
+            kernel_denominator=kernel_denominator,
+            maximum_run_length=maximum_run_length,
+            meters=meters,
+            offset_counter=offset_counter,
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self):
+        """
+        Fits meters.
+
+        Returns meter list.
+        """
+        if not self.ordered_offsets:
+            return MeterList()
+        kernels = self._get_kernels([])
+        durations, weights = self._get_integer_kernels(kernels)
+        counts, prefix_sums = self._get_histogram(max(durations))
+        last_tick = len(counts) - max(durations) - 1
+        maximum_run_length = self.maximum_run_length
+        if len(kernels) == 1:
+            maximum_run_length = None
+        # states[tick] maps (last kernel index, run length) to
+        # (score, previous tick, previous state key, kernel index):
+        states = [None] * len(counts)
+        states[0] = {(None, 0): (0, None, None, None)}
+        for tick in range(last_tick):
+            states_ = states[tick]
+            if states_ is None:
+                continue
+            items = list(states_.items())
+            if self.beam_width is not None and self.beam_width < len(items):
+                items.sort(key=lambda _: -_[1][0])
+                items = items[: self.beam_width]
+            scores = []
+            for duration, weights_ in zip(durations, weights):
+                stop_tick = tick + duration
+                if prefix_sums[stop_tick + 1] == prefix_sums[tick]:
+                    scores.append(0)
+                else:
+                    scores.append(
+                        sum(_ * counts[tick + i] for i, _ in enumerate(weights_) if _)
+                    )
+            for key, (score, _, _, _) in items:
+                last_index, run_length = key
+                for index, duration in enumerate(durations):
+                    if maximum_run_length is not None:
+                        if index == last_index:
+                            if maximum_run_length <= run_length:
+                                continue
+                            key_ = (index, run_length + 1)
+                        else:
+                            key_ = (index, 1)
+                    else:
+                        key_ = (None, 0)
+                    score_ = score + scores[index]
+                    stop_tick = tick + duration
+                    if states[stop_tick] is None:
+                        states[stop_tick] = {}
+                    previous = states[stop_tick].get(key_)
+                    if previous is None or previous[0] < score_:
+                        states[stop_tick][key_] = (score_, tick, key, index)
+        best = None
+        for tick in range(last_tick, len(states)):
+            for key, state in (states[tick] or {}).items():
+                if best is None or best[0][0] < state[0]:
+                    best = (state, tick, key)
+        indices = []
+        state, tick, key = best
+        while state[3] is not None:
+            indices.append(state[3])
+            state, tick, key = states[state[1]][state[2]], state[1], state[2]
+        indices.reverse()
+        selected_meters = (self.kernels[kernels[_]] for _ in indices)
+        selected_meters = MeterList(selected_meters)
+        return selected_meters
+
+    ### PRIVATE METHODS ###
+
+    def _get_histogram(self, longest_duration):
+        denominator = int(self.kernel_denominator)
+        ticks = {}
+        for offset, count in self.offset_counter.items():
+            tick = offset * denominator
+            if tick.denominator == 1 and 0 <= tick:
+                ticks[int(tick)] = count
+        last_tick = max(ticks, default=0)
+        counts = [0] * (last_tick + longest_duration + 1)
+        for tick, count in ticks.items():
+            counts[tick] = count
+        prefix_sums = [0]
+        for count in counts:
+            prefix_sums.append(prefix_sums[-1] + count)
+        return counts, prefix_sums
+
+    def _get_integer_kernels(self, kernels):
+        denominator = int(self.kernel_denominator)
+        least_common_multiple = mathx.least_common_multiple(
+            *[_.denominator for kernel in kernels for _ in kernel.kernel.values()]
+        )
+        durations, weights = [], []
+        for kernel in kernels:
+            duration = kernel.duration * denominator
+            assert duration.denominator == 1, repr(kernel)
+            duration = int(duration)
+            weights_ = [0] * (duration + 1)
+            for offset, weight in kernel.kernel.items():
+                tick = int(offset * denominator)
+                weight = weight * least_common_multiple * duration
+                weights_[tick] = int(weight)
+            durations.append(duration)
+            weights.append(weights_)
+        return durations, weights
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def beam_width(self):
+        """
+        Gets beam width.
+
+        Returns integer or none.
+        """
+        return self._beam_width
+
+
 class _MeterManager:
     """
     Meter manager.
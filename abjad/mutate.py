@@ -1266,9 +1266,13 @@ class Mutation:
             donor._wrappers.remove(wrapper)
             wrapper._component = recipient
             recipient._wrappers.append(wrapper)
+            if getattr(wrapper.indicator, "_mutates_logical_ties", False):
+                recipient._clear_leaf_index()
             context = wrapper._find_correct_effective_context()
             if context is not None:
                 context._dependent_wrappers.append(wrapper)
+                context._dependent_wrapper_index.clear()
+                context._journal_change()
 
     def scale(self, multiplier) -> None:
         r"""
@@ -400,6 +400,11 @@ class Interface:
     Base class from which grob, setting and tweak managers inherit.
     """
 
+    ### CLASS VARIABLES ###
+
+    # owner is kept out of vars() so that it neither formats nor compares:
+    __slots__ = ("__dict__", "_owner")
+
     ### SPECIAL METHODS ###
 
     def __eq__(self, argument) -> bool:
@@ -514,15 +519,35 @@ class Interface:
         body_string = ", ".join(pairs)
         return f"{type(self).__name__}({body_string})"
 
+    def __setattr__(self, name, value) -> None:
+        """
+        Sets attribute ``name`` equal to ``value``.
+        """
+        object.__setattr__(self, name, value)
+        if name != "_owner":
+            self._clear_lilypond_format()
+
     def __setstate__(self, state) -> None:
         """
         Sets object state.
         """
         for key, value in state.items():
             self.__dict__[key] = value
+            if isinstance(value, Interface):
+                value._owner = self
 
     ### PRIVATE METHODS ###
 
+    def _clear_lilypond_format(self):
+        manager = self
+        owner = getattr(manager, "_owner", None)
+        while isinstance(owner, Interface):
+            manager = owner
+            owner = getattr(manager, "_owner", None)
+        if owner is not None:
+            indicators = isinstance(manager, TweakInterface)
+            _clear_lilypond_format(owner, indicators=indicators)
+
     def _get_attribute_pairs(self):
         return list(sorted(vars(self).items()))
 
@@ -1141,14 +1166,17 @@ class OverrideInterface(Interface):
                 return vars(self)["_" + name]
             except KeyError:
                 context = OverrideInterface()
+                context._owner = self
                 vars(self)["_" + name] = context
                 return context
         elif camel_name in grob_interfaces:
             try:
                 return vars(self)[name]
             except KeyError:
-                vars(self)[name] = Interface()
-                return vars(self)[name]
+                grob = Interface()
+                grob._owner = self
+                vars(self)[name] = grob
+                return grob
         else:
             try:
                 return vars(self)[name]
@@ -1163,7 +1191,7 @@ class OverrideInterface(Interface):
         Sets attribute ``attribute`` of grob name manager to ``value``.
         """
         # make sure attribute name is valid grob name before setting value
-        object.__setattr__(self, attribute, value)
+        Interface.__setattr__(self, attribute, value)
 
     ### PRIVATE METHODS ###
 
@@ -1307,6 +1335,21 @@ class OverrideInterface(Interface):
 ### FUNCTIONS ###
 
 
+def _clear_lilypond_format(argument, indicators=False):
+    # note-heads format with client:
+    from .score import Component
+
+    if hasattr(argument, "_client"):
+        argument = argument._client
+        if argument is None:
+            return
+    if isinstance(argument, Component):
+        argument._clear_lilypond_format()
+    elif indicators:
+        # indicators do not know the components to which they attach:
+        Component._lilypond_format_epoch += 1
+
+
 def override(argument):
     r"""
     Makes LilyPond grob name manager.
@@ -1365,6 +1408,7 @@ def override(argument):
     """
     if getattr(argument, "_overrides", None) is None:
         argument._overrides = OverrideInterface()
+    argument._overrides._owner = argument
     return argument._overrides
 
 
@@ -1427,6 +1471,7 @@ class SettingInterface(Interface):
                 return vars(self)["_" + name]
             except KeyError:
                 context = Interface()
+                context._owner = self
                 vars(self)["_" + name] = context
                 return context
         else:
@@ -1551,6 +1596,7 @@ def setting(argument):
     """
     if getattr(argument, "_lilypond_setting_name_manager", None) is None:
         argument._lilypond_setting_name_manager = SettingInterface()
+    argument._lilypond_setting_name_manager._owner = argument
     return argument._lilypond_setting_name_manager
 
 
@@ -1713,6 +1759,8 @@ class TweakInterface(Interface):
             return vars(self).get("_currently_tagging")
         if name == "_literal":
             return vars(self).get("_literal")
+        if name == "_owner":
+            return None
         if "_pending_value" in vars(self):
             _pending_value = self._pending_value
             self.__setattr__(name, _pending_value)
@@ -1729,8 +1777,10 @@ class TweakInterface(Interface):
             try:
                 return vars(self)[name]
             except KeyError:
-                vars(self)[name] = Interface()
-                return vars(self)[name]
+                grob = Interface()
+                grob._owner = self
+                vars(self)[name] = grob
+                return grob
         else:
             try:
                 return vars(self)[name]
@@ -1761,6 +1811,9 @@ class TweakInterface(Interface):
             Exception: 'SavannahGreen' is not a LilyPond color.
 
         """
+        if name == "_owner":
+            object.__setattr__(self, name, value)
+            return
         if name == "color":
             if "x11-color" in value:
                 _, color = value.split()
@@ -1776,9 +1829,10 @@ class TweakInterface(Interface):
                 value = ("TAGGED", value, tag, True)
             else:
                 value = ("TAGGED", value, tag)
-        object.__setattr__(self, name, value)
         if name in ("_currently_deactivated", "_currently_tagging"):
+            object.__setattr__(self, name, value)
             return
+        Interface.__setattr__(self, name, value)
         try:
             delattr(self, "_currently_deactivated")
         except AttributeError:
@@ -1913,6 +1967,7 @@ class TweakInterface(Interface):
                 message = "tweak tuple must have length 2 or 3"
                 message += f" (not {tuple_!r})."
                 raise ValueError(message)
+        existing_manager._owner = argument
         return existing_manager
 
 
@@ -2175,4 +2230,5 @@ def tweak(argument, *, deactivate=None, expression=None, literal=None, tag=None)
     else:
         interface = argument._tweaks
         interface.__init__(deactivate=deactivate, literal=literal, tag=tag)
+    interface._owner = argument
     return interface
@@ -1,9 +1,10 @@
 import abc
+import hashlib
 import logging
 import os
-import pickle
 import sys
-import traceback
+import types
+import typing
 
 import ply
 from ply import yacc
@@ -27,6 +28,8 @@ class Parser:
 
     __slots__ = ("_debug", "_lexer", "_logger", "_parser")
 
+    _grammar_hashes: typing.Dict[type, str] = {}
+
     _is_abstract = True
 
     ### INITIALIZER ###
@@ -48,29 +51,6 @@ class Parser:
         else:
             self._logger = yacc.NullLogger()
 
-        self._lexer = ply.lex.lex(
-            debug=self.debug, debuglog=self.logger, object=self.lexer_rules_object,
-        )
-
-        if self.pickle_path and not os.path.exists(self.pickle_path):
-            try:
-                directory, _ = os.path.split(self.pickle_path)
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
-                string = pickle.dumps(None)
-                with open(self.pickle_path, "wb") as file_pointer:
-                    file_pointer.write(string)
-            except (IOError, OSError):
-                traceback.print_exc()
-
-        self._parser = ply.yacc.yacc(
-            debug=self.debug,
-            debuglog=self.logger,
-            module=self.parser_rules_object,
-            outputdir=self.output_path,
-            picklefile=self.pickle_path,
-        )
-
     ### SPECIAL METHODS ###
 
     def __call__(self, string):
@@ -92,6 +72,62 @@ class Parser:
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_rules_module(rules_object):
+        """
+        Gets module-like copy of ``rules_object`` for PLY reflection.
+
+        Omits properties because PLY gets every attribute of the rules object
+        and properties like ``lexer`` and ``parser`` build lazily.
+        """
+        class_ = type(rules_object)
+        attributes = {"__file__": sys.modules[class_.__module__].__file__}
+        for name in dir(rules_object):
+            if name.startswith("__"):
+                continue
+            if isinstance(getattr(class_, name, None), property):
+                continue
+            try:
+                attributes[name] = getattr(rules_object, name)
+            except AttributeError:
+                pass
+        return types.SimpleNamespace(**attributes)
+
+    def _make_lexer(self):
+        module = self._get_rules_module(self.lexer_rules_object)
+        return ply.lex.lex(debug=self.debug, debuglog=self.logger, module=module)
+
+    def _make_parser(self):
+        module = self._get_rules_module(self.parser_rules_object)
+        pickle_path = self.pickle_path
+        if pickle_path is None or os.path.exists(pickle_path):
+            return yacc.yacc(
+                debug=self.debug,
+                debuglog=self.logger,
+                module=module,
+                outputdir=self.output_path,
+                picklefile=pickle_path,
+                write_tables=False,
+            )
+        # write to temporary path, then rename, so that concurrent processes
+        # never read partially written tables:
+        temporary_path = f"{pickle_path}.{os.getpid()}.tmp"
+        parser = yacc.yacc(
+            debug=self.debug,
+            debuglog=self.logger,
+            module=module,
+            outputdir=self.output_path,
+            picklefile=temporary_path,
+            write_tables=False,
+        )
+        try:
+            os.replace(temporary_path, pickle_path)
+        except (IOError, OSError):
+            pass
+        return parser
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, string):
@@ -111,11 +147,33 @@ class Parser:
         """
         return self._debug
 
+    @property
+    def grammar_hash(self) -> str:
+        """
+        Gets hash of parser's grammar.
+
+        Hashes the start symbol, precedence, tokens and production docstrings
+        of the parser's syntactical rules. Caches one hash per rules class.
+        """
+        class_ = type(self.parser_rules_object)
+        if class_ not in self._grammar_hashes:
+            module = self._get_rules_module(self.parser_rules_object)
+            reflection = yacc.ParserReflect(vars(module))
+            reflection.get_all()
+            signature = reflection.signature().encode()
+            grammar_hash = hashlib.sha1(signature).hexdigest()[:16]
+            self._grammar_hashes[class_] = grammar_hash
+        return self._grammar_hashes[class_]
+
     @property
     def lexer(self):
         """
         Gets parser's PLY Lexer instance.
+
+        Builds lexer on first use.
         """
+        if self._lexer is None:
+            self._lexer = self._make_lexer()
         return self._lexer
 
     @abc.abstractproperty
@@ -147,8 +205,11 @@ class Parser:
     def output_path(self):
         """
         Gets output path for files associated with the parser.
+
+        Set ``parser_tables_directory`` in the Abjad configuration file to
+        change output path.
         """
-        output_path = configuration.configuration_directory / "parsers"
+        output_path = configuration.parser_tables_directory
         if not output_path.is_dir():
             try:
                 os.makedirs(output_path)
@@ -160,7 +221,12 @@ class Parser:
     def parser(self):
         """
         Gets parser's PLY LRParser instance.
+
+        Builds parser on first use; reads parsing tables from
+        ``pickle_path`` when present and writes them there otherwise.
         """
+        if self._parser is None:
+            self._parser = self._make_parser()
         return self._parser
 
     @abc.abstractproperty
@@ -174,9 +240,15 @@ class Parser:
     def pickle_path(self):
         """
         Gets output path for the parser's pickled parsing tables.
+
+        Keys file name to PLY version and grammar hash, so that tables
+        persist across processes and grammars share no tables. Returns none
+        when output path is not writable.
         """
-        if self.output_path is None:
+        output_path = self.output_path
+        if output_path is None or not os.access(output_path, os.W_OK | os.X_OK):
             return None
-        string = "-".join(str(x) for x in sys.version_info)
-        file_name = f"parse_tables_{type(self).__name__}_{string}.pkl"
-        return os.path.join(self.output_path, file_name)
+        name = type(self).__name__
+        version = f"ply-{ply.__version__}"
+        file_name = f"parse_tables_{name}_{version}_{self.grammar_hash}.pkl"
+        return os.path.join(output_path, file_name)
@@ -1,3 +1,5 @@
+import concurrent.futures
+import functools
 import typing
 
 from .parser import LilyPondParser
@@ -31,7 +33,93 @@ def parse(string, language="english"):
     """
     if string.startswith("abj:"):
         return parse_reduced_ly_syntax(string[4:])
+    return _get_lilypond_parser(language)(string)
+
+
+def _get_lilypond_parser(language):
     if language not in _lilypond_parsers_by_language:
         parser = LilyPondParser(default_language=language)
         _lilypond_parsers_by_language[language] = parser
-    return _lilypond_parsers_by_language[language](string)
+    return _lilypond_parsers_by_language[language]
+
+
+def _initialize_worker(language):
+    parser = _get_lilypond_parser(language)
+    # build PLY lexer and parser before first string arrives:
+    parser.lexer, parser.parser
+
+
+def _parse_or_capture(string, language="english"):
+    try:
+        return parse(string, language=language)
+    except Exception as exception:
+        return exception
+
+
+def _parse_or_capture_picklable(string, language="english"):
+    result = _parse_or_capture(string, language=language)
+    if not isinstance(result, Exception):
+        return result
+    # parser errors may carry unpicklable PLY tokens:
+    try:
+        return type(result)(str(result))
+    except Exception:
+        return Exception(repr(result))
+
+
+def parse_many(strings, language="english", workers=None) -> typing.List:
+    r"""
+    Parses LilyPond ``strings``.
+
+    ..  container:: example
+
+        Parses many LilyPond strings:
+
+        >>> strings = ["{c'4 d'4}", "{e'4 f'4 g'4}", "abj: a'8 b'8"]
+        >>> for container in abjad.parse_many(strings):
+        ...     abjad.f(container)
+        ...
+        {
+            c'4
+            d'4
+        }
+        {
+            e'4
+            f'4
+            g'4
+        }
+        {
+            a'8
+            b'8
+        }
+
+    ..  container:: example
+
+        Captures errors item by item:
+
+        >>> results = abjad.parse_many(["{c'4}", "{c'4 \\foo}"])
+        >>> results[0]
+        Container("c'4")
+
+        >>> results[1]
+        Exception("unknown escaped word: '\\\\foo'.")
+
+    Reuses one parser per language in each process. Parses serially in this
+    process when ``workers`` is none; otherwise fans out across a pool of
+    ``workers`` processes, each of which builds its parser once before
+    parsing.
+
+    Returns list of Abjad components (and exceptions) in order of
+    ``strings``.
+    """
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError(f"workers must be positive integer: {workers!r}.")
+    strings = list(strings)
+    if workers in (None, 1) or len(strings) <= 1:
+        return [_parse_or_capture(_, language=language) for _ in strings]
+    chunksize = max(1, len(strings) // (4 * workers))
+    function = functools.partial(_parse_or_capture_picklable, language=language)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize_worker, initargs=(language,)
+    ) as executor:
+        return list(executor.map(function, strings, chunksize=chunksize))
@@ -2705,7 +2705,7 @@ class LilyPondParser(Parser):
         self._lexdef = LilyPondLexicalDefinition(self)
         self._syndef = LilyPondSyntacticalDefinition(self)
 
-        # build PLY parser and lexer
+        # PLY parser and lexer build on first use
         Parser.__init__(self, debug=debug)
 
         self._reset_parser_variables()
@@ -2718,13 +2718,14 @@ class LilyPondParser(Parser):
 
         Returns Abjad components.
         """
+        parser, lexer = self.parser, self.lexer
         self._reset_parser_variables()
         if self._debug:
-            result = self._parser._lilypond_patch_parse_debug(
-                input_string, lexer=self._lexer, debug=self._logger
+            result = parser._lilypond_patch_parse_debug(
+                input_string, lexer=lexer, debug=self._logger
             )
         else:
-            result = self._parser._lilypond_patch_parse(input_string, lexer=self._lexer)
+            result = parser._lilypond_patch_parse(input_string, lexer=lexer)
         return result
 
     ### PRIVATE METHODS ###
@@ -2898,6 +2899,11 @@ class LilyPondParser(Parser):
             "symbol?": lambda x: True,
         }
 
+    def _make_lexer(self):
+        lexer = Parser._make_lexer(self)
+        lexer.push_state("notes")
+        return lexer
+
     def _pop_variable_scope(self):
         if self._scope_stack:
             self._scope_stack.pop()
@@ -2965,13 +2971,15 @@ class LilyPondParser(Parser):
         self._parser.lookahead = reparse
 
     def _reset_parser_variables(self):
-        try:
-            self._parser.restart()
-        except Exception:
-            pass
+        if self._parser is not None:
+            try:
+                self._parser.restart()
+            except Exception:
+                pass
         self._scope_stack = [{}]
         self._chord_pitch_orders = {}
-        self._lexer.push_state("notes")
+        if self._lexer is not None:
+            self._lexer.push_state("notes")
         self._default_duration = LilyPondDuration((1, 4), None)
         self._last_chord = None
         # LilyPond's default!
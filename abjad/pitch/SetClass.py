@@ -1,5 +1,8 @@
+import typing
+
 from .. import mathx
 from ..storage import StorageFormatManager
+from . import _pcmasks
 from .pitchclasses import NumberedPitchClass
 from .sets import PitchClassSet
 
@@ -68,7 +71,7 @@ class SetClass:
         SC(4-22){0, 2, 4, 7}
         SC(4-23){0, 2, 5, 7}
         SC(4-24){0, 2, 4, 8}
-        SC(4-25){2, 6, 8, 9}
+        SC(4-25){0, 2, 6, 8}
         SC(4-26){0, 3, 5, 8}
         SC(4-27){0, 2, 5, 8}
         SC(4-28){0, 3, 6, 9}
@@ -235,7 +238,7 @@ class SetClass:
         (4, 22): (0, 2, 4, 7),
         (4, 23): (0, 2, 5, 7),
         (4, 24): (0, 2, 4, 8),
-        (4, 25): (9, 2, 6, 8),
+        (4, 25): (0, 2, 6, 8),
         (4, 26): (0, 3, 5, 8),
         (4, 27): (0, 2, 5, 8),
         (4, 28): (0, 3, 6, 9),
@@ -580,7 +583,7 @@ class SetClass:
         # 0
         (0, 1): (),
         # 1
-        (1, 1): (0),
+        (1, 1): (0,),
         # 2
         (2, 1): (0, 1),
         (2, 2): (0, 2),
@@ -958,6 +961,10 @@ class SetClass:
         v: k for k, v in _transposition_only_identifier_to_prime_form.items()
     }
 
+    _identifier_tables: typing.Dict[typing.Tuple, typing.Tuple] = {}
+
+    _prime_forms: typing.Dict[typing.Tuple, PitchClassSet] = {}
+
     ### INITIALIZER ###
 
     def __init__(
@@ -1091,6 +1098,35 @@ class SetClass:
         print(message)
         print()
 
+    @staticmethod
+    def _get_identifier(prime_form, lex_rank=None, transposition_only=None):
+        if transposition_only:
+            return SetClass._prime_form_to_transposition_only_identifier[prime_form]
+        elif lex_rank:
+            return SetClass._prime_form_to_lex_identifier[prime_form]
+        return SetClass._prime_form_to_forte_identifier[prime_form]
+
+    @staticmethod
+    def _get_identifier_table(lex_rank=None, transposition_only=None):
+        key = (bool(lex_rank), bool(transposition_only))
+        if key not in SetClass._identifier_tables:
+            identifiers = []
+            for mask in range(4096):
+                prime_form = _pcmasks.get_prime_form(
+                    mask, 12, transposition_only=transposition_only
+                )
+                try:
+                    identifier = SetClass._get_identifier(
+                        prime_form,
+                        lex_rank=lex_rank,
+                        transposition_only=transposition_only,
+                    )
+                except KeyError:
+                    identifier = None
+                identifiers.append(identifier)
+            SetClass._identifier_tables[key] = tuple(identifiers)
+        return SetClass._identifier_tables[key]
+
     def _unrank(self, cardinality, rank, transposition_only=None):
         pair = (cardinality, rank)
         if self.transposition_only:
@@ -1099,8 +1135,11 @@ class SetClass:
             prime_form = self._lex_identifier_to_prime_form[pair]
         else:
             prime_form = self._forte_identifier_to_prime_form[pair]
-        prime_form = PitchClassSet(items=prime_form, item_class=NumberedPitchClass)
-        return prime_form
+        if prime_form not in self._prime_forms:
+            self._prime_forms[prime_form] = PitchClassSet(
+                items=prime_form, item_class=NumberedPitchClass
+            )
+        return self._prime_forms[prime_form]
 
     @staticmethod
     def _yield_all_pitch_class_sets():
@@ -1545,20 +1584,30 @@ class SetClass:
 
         Returns set-class.
         """
-        pitch_class_set = PitchClassSet(
-            items=pitch_class_set, item_class=NumberedPitchClass
-        )
-        prime_form = pitch_class_set.get_prime_form(
-            transposition_only=transposition_only
-        )
-        prime_form = tuple([_.number for _ in sorted(prime_form)])
-        if transposition_only:
-            pair = SetClass._prime_form_to_transposition_only_identifier[prime_form]
-        elif lex_rank:
-            pair = SetClass._prime_form_to_lex_identifier[prime_form]
+        if not (
+            isinstance(pitch_class_set, PitchClassSet)
+            and pitch_class_set.item_class is NumberedPitchClass
+        ):
+            pitch_class_set = PitchClassSet(
+                items=pitch_class_set, item_class=NumberedPitchClass
+            )
+        pair = pitch_class_set._get_mask()
+        if pair is not None and pair[1] == 12:
+            table = SetClass._get_identifier_table(
+                lex_rank=lex_rank, transposition_only=transposition_only
+            )
+            identifier = table[pair[0]]
         else:
-            pair = SetClass._prime_form_to_forte_identifier[prime_form]
-        cardinality, rank = pair
+            identifier = None
+        if identifier is None:
+            prime_form = pitch_class_set.get_prime_form(
+                transposition_only=transposition_only
+            )
+            prime_form = tuple([_.number for _ in sorted(prime_form)])
+            identifier = SetClass._get_identifier(
+                prime_form, lex_rank=lex_rank, transposition_only=transposition_only
+            )
+        cardinality, rank = identifier
         set_class = SetClass(
             cardinality=cardinality,
             rank=rank,
@@ -1605,7 +1654,7 @@ class SetClass:
             SC(4-22){0, 2, 4, 7}
             SC(4-23){0, 2, 5, 7}
             SC(4-24){0, 2, 4, 8}
-            SC(4-25){2, 6, 8, 9}
+            SC(4-25){0, 2, 6, 8}
             SC(4-26){0, 3, 5, 8}
             SC(4-27){0, 2, 5, 8}
             SC(4-28){0, 3, 6, 9}
@@ -0,0 +1,162 @@
+"""
+Bitmask pitch-class set engine.
+
+Encodes pitch-class sets as integers with bit ``n`` set when pitch-class
+``n`` is present. Semitone (12-ET) sets use 12-bit masks and read normal
+orders, prime forms and interval-class vectors from tables precomputed for
+all 4096 sets; quarter-tone (24-ET) sets use 24-bit masks in quarter-tone
+units and compute the same values on integers, memoized per mask.
+
+Normal orders and prime forms agree with the object-based algorithms in
+``PitchClassSet``: candidates are compared first by outside interval, then
+by intervals from the first pitch-class, then by first pitch-class.
+"""
+import functools
+
+_tables: dict = {}
+
+
+def _get_pitch_classes(mask, modulus):
+    return tuple(_ for _ in range(modulus) if mask >> _ & 1)
+
+
+def _get_normal_order(pitch_classes, modulus):
+    if not pitch_classes:
+        return ()
+    best_key, best_candidate = None, None
+    for i in range(len(pitch_classes)):
+        candidate = pitch_classes[i:] + pitch_classes[:i]
+        first = candidate[0]
+        widths = [(_ - first) % modulus or modulus for _ in candidate]
+        key = (widths[-1],) + tuple(widths[1:]) + (first,)
+        if best_key is None or key < best_key:
+            best_key, best_candidate = key, candidate
+    return best_candidate
+
+
+def _get_prime_form(pitch_classes, modulus, transposition_only):
+    if not pitch_classes:
+        return ()
+    normal_order = _get_normal_order(pitch_classes, modulus)
+    prime_form = tuple((_ - normal_order[0]) % modulus for _ in normal_order)
+    if not transposition_only:
+        inversion = sorted((-_) % modulus for _ in pitch_classes)
+        normal_order = _get_normal_order(tuple(inversion), modulus)
+        first = normal_order[0]
+        prime_form = min(prime_form, tuple((_ - first) % modulus for _ in normal_order))
+    return prime_form
+
+
+def _get_interval_class_vector(pitch_classes, modulus):
+    counts = [0] * (modulus // 2)
+    for i, first in enumerate(pitch_classes):
+        for second in pitch_classes[i + 1 :]:
+            interval = second - first
+            interval_class = min(interval, modulus - interval)
+            counts[interval_class - 1] += 1
+    return tuple(counts)
+
+
+def _get_tables():
+    if not _tables:
+        normal_orders, prime_forms, transposition_only_prime_forms = [], [], []
+        interval_class_vectors = []
+        for mask in range(4096):
+            pitch_classes = _get_pitch_classes(mask, 12)
+            normal_orders.append(_get_normal_order(pitch_classes, 12))
+            prime_forms.append(_get_prime_form(pitch_classes, 12, False))
+            transposition_only_prime_forms.append(
+                _get_prime_form(pitch_classes, 12, True)
+            )
+            interval_class_vectors.append(_get_interval_class_vector(pitch_classes, 12))
+        _tables["normal_orders"] = tuple(normal_orders)
+        _tables["prime_forms"] = tuple(prime_forms)
+        _tables["transposition_only_prime_forms"] = tuple(
+            transposition_only_prime_forms
+        )
+        _tables["interval_class_vectors"] = tuple(interval_class_vectors)
+    return _tables
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_quarter_tone_entry(mask):
+    pitch_classes = _get_pitch_classes(mask, 24)
+    return (
+        _get_normal_order(pitch_classes, 24),
+        _get_prime_form(pitch_classes, 24, False),
+        _get_prime_form(pitch_classes, 24, True),
+        _get_interval_class_vector(pitch_classes, 24),
+    )
+
+
+def from_numbers(numbers):
+    """
+    Changes pitch-class ``numbers`` to ``(mask, modulus)`` pair.
+
+    Returns none when any number lies off the quarter-tone grid.
+    """
+    numbers = [_ % 12 for _ in numbers]
+    if all(_ == int(_) for _ in numbers):
+        mask = 0
+        for number in numbers:
+            mask |= 1 << int(number)
+        return mask, 12
+    mask = 0
+    for number in numbers:
+        quarter_tones = 2 * number
+        if quarter_tones != int(quarter_tones):
+            return None
+        mask |= 1 << int(quarter_tones)
+    return mask, 24
+
+
+def to_numbers(pitch_classes, modulus):
+    """
+    Changes ``pitch_classes`` in units of ``modulus`` to semitone numbers.
+    """
+    if modulus == 12:
+        return pitch_classes
+    return tuple(_ // 2 if _ % 2 == 0 else _ / 2 for _ in pitch_classes)
+
+
+def get_interval_class_vector(mask, modulus):
+    """
+    Gets interval-class vector of ``mask``.
+
+    Counts interval-classes ``1`` through ``modulus // 2`` in units of
+    ``modulus``.
+    """
+    if modulus == 12:
+        return _get_tables()["interval_class_vectors"][mask]
+    return _get_quarter_tone_entry(mask)[3]
+
+
+def get_normal_order(mask, modulus):
+    """
+    Gets normal order of ``mask`` in units of ``modulus``.
+    """
+    if modulus == 12:
+        return _get_tables()["normal_orders"][mask]
+    return _get_quarter_tone_entry(mask)[0]
+
+
+def get_prime_form(mask, modulus, transposition_only=False):
+    """
+    Gets prime form of ``mask`` in units of ``modulus``.
+    """
+    if modulus == 12:
+        if transposition_only:
+            return _get_tables()["transposition_only_prime_forms"][mask]
+        return _get_tables()["prime_forms"][mask]
+    if transposition_only:
+        return _get_quarter_tone_entry(mask)[2]
+    return _get_quarter_tone_entry(mask)[1]
+
+
+def transpose(mask, modulus, n):
+    """
+    Rotates ``mask`` by ``n`` units of ``modulus``.
+    """
+    n %= modulus
+    full = (1 << modulus) - 1
+    return ((mask << n) | (mask >> (modulus - n))) & full
@@ -9,6 +9,7 @@ from ..new import new
 from ..sequence import Sequence
 from ..storage import FormatSpecification
 from ..typedcollections import TypedCollection, TypedFrozenset
+from . import _pcmasks
 from .intervalclasses import IntervalClass, NamedIntervalClass, NumberedIntervalClass
 from .intervals import Interval, NamedInterval, NumberedInterval
 from .pitchclasses import NamedPitchClass, NumberedPitchClass, PitchClass
@@ -436,6 +437,12 @@ class PitchClassSet(Set):
 
     ### PRIVATE METHODS ###
 
+    def _get_mask(self):
+        pair = _pcmasks.from_numbers([_.number for _ in self])
+        if pair is not None and bin(pair[0]).count("1") != len(self):
+            return None
+        return pair
+
     @staticmethod
     def _get_most_compact_ordering(candidates):
         widths = []
@@ -552,6 +559,12 @@ class PitchClassSet(Set):
         """
         if not len(self):
             return PitchClassSegment(items=None, item_class=NumberedPitchClass)
+        pair = self._get_mask()
+        if pair is not None:
+            mask, modulus = pair
+            normal_order = _pcmasks.get_normal_order(mask, modulus)
+            numbers = _pcmasks.to_numbers(normal_order, modulus)
+            return PitchClassSegment(items=numbers, item_class=NumberedPitchClass)
         pitch_classes = list(self)
         pitch_classes.sort()
         candidates = []
@@ -669,6 +682,14 @@ class PitchClassSet(Set):
         """
         if not len(self):
             return copy.copy(self)
+        pair = self._get_mask()
+        if pair is not None:
+            mask, modulus = pair
+            prime_form = _pcmasks.get_prime_form(
+                mask, modulus, transposition_only=transposition_only
+            )
+            numbers = _pcmasks.to_numbers(prime_form, modulus)
+            return type(self)(items=numbers, item_class=NumberedPitchClass)
         normal_order = self.get_normal_order()
         if not transposition_only:
             normal_orders = [normal_order]
@@ -725,6 +746,20 @@ class PitchClassSet(Set):
 
         Returns true or false.
         """
+        if (
+            isinstance(pcset, PitchClassSet)
+            and self.item_class is NumberedPitchClass
+            and pcset.item_class is NumberedPitchClass
+        ):
+            pair, other_pair = self._get_mask(), pcset._get_mask()
+            if pair is not None and other_pair is not None:
+                if pair[1] == other_pair[1]:
+                    (mask, modulus), other_mask = pair, other_pair[0]
+                    for n in range(0, modulus, modulus // 12):
+                        transposed_mask = _pcmasks.transpose(mask, modulus, n)
+                        if transposed_mask & other_mask == transposed_mask:
+                            return True
+                    return False
         for n in range(12):
             if self.transpose(n).issubset(pcset):
                 return True
@@ -748,6 +783,20 @@ class PitchClassSet(Set):
 
         Returns true or false.
         """
+        if (
+            isinstance(pcset, PitchClassSet)
+            and self.item_class is NumberedPitchClass
+            and pcset.item_class is NumberedPitchClass
+        ):
+            pair, other_pair = self._get_mask(), pcset._get_mask()
+            if pair is not None and other_pair is not None:
+                if pair[1] == other_pair[1]:
+                    (mask, modulus), other_mask = pair, other_pair[0]
+                    for n in range(0, modulus, modulus // 12):
+                        transposed_mask = _pcmasks.transpose(mask, modulus, n)
+                        if transposed_mask & other_mask == other_mask:
+                            return True
+                    return False
         for n in range(12):
             if self.transpose(n).issuperset(pcset):
                 return True
@@ -6,7 +6,13 @@ from .. import mathx
 from ..enumeratex import Enumerator
 from ..storage import FormatSpecification
 from ..typedcollections import TypedCollection, TypedCounter
-from .intervalclasses import IntervalClass, NamedIntervalClass, NumberedIntervalClass
+from . import _pcmasks
+from .intervalclasses import (
+    IntervalClass,
+    NamedIntervalClass,
+    NumberedIntervalClass,
+    NumberedInversionEquivalentIntervalClass,
+)
 from .intervals import Interval, NamedInterval, NumberedInterval
 from .pitchclasses import NamedPitchClass, NumberedPitchClass, PitchClass
 from .pitches import NamedPitch, NumberedPitch, Pitch
@@ -298,6 +304,17 @@ class IntervalClassVector(Vector):
             PitchClassSegment,
             PitchClassSet,
         )
+        if (
+            isinstance(items, PitchClassSet)
+            and item_class is NumberedInversionEquivalentIntervalClass
+        ):
+            pair = items._get_mask()
+            if pair is not None:
+                mask, modulus = pair
+                counts = _pcmasks.get_interval_class_vector(mask, modulus)
+                numbers = range(1, len(counts) + 1)
+                numbers = _pcmasks.to_numbers(numbers, modulus)
+                items = {n: c for n, c in zip(numbers, counts) if c}
         if isinstance(items, prototype):
             intervals = []
             items = tuple(items)
@@ -13,7 +13,7 @@ from .duration import Duration, Multiplier, NonreducedFraction, Offset
 from .makers import LeafMaker
 from .mutate import Mutation
 from .parsers.base import Parser
-from .score import Container, Tuplet
+from .score import Container, Note, Rest, Tuplet
 from .sequence import Sequence
 from .spanners import tie
 from .storage import FormatSpecification, StorageFormatManager
@@ -983,6 +983,331 @@ class RhythmTreeParser(Parser):
         p[0] = p[1] + [p[2]]
 
 
+class CompiledRhythmTree:
+    r"""
+    Compiled rhythm tree.
+
+    ..  container:: example
+
+        Compiles rhythm tree into flat arrays indexed in depth-first order:
+
+        >>> rtm = '(1 (1 (2 (1 1 1)) 2))'
+        >>> tree = abjad.rhythmtrees.RhythmTreeParser()(rtm)[0]
+        >>> compiled = abjad.rhythmtrees.CompiledRhythmTree(tree)
+        >>> len(compiled)
+        7
+
+        >>> compiled.parents
+        (None, 0, 0, 2, 2, 2, 0)
+
+        >>> compiled.prolations
+        (Multiplier(1, 1), Multiplier(1, 5), Multiplier(1, 5), Multiplier(2, 15), Multiplier(2, 15), Multiplier(2, 15), Multiplier(1, 5))
+
+        Offsets are integer ticks at the least common denominator of the
+        tree:
+
+        >>> compiled.denominator
+        15
+
+        >>> compiled.start_ticks
+        (0, 0, 3, 3, 5, 7, 9)
+
+        >>> compiled.stop_ticks
+        (15, 3, 9, 5, 7, 9, 15)
+
+        >>> compiled.start_offsets
+        (Offset((0, 1)), Offset((0, 1)), Offset((1, 5)), Offset((1, 5)), Offset((1, 3)), Offset((7, 15)), Offset((3, 5)))
+
+    ..  container:: example
+
+        Generates the same components as the rhythm tree:
+
+        >>> compiled((1, 4))
+        [Tuplet(Multiplier(4, 5), "c'16 { 2/3 c'16 c'16 c'16 } c'8")]
+
+        Also compiles RTM strings directly:
+
+        >>> rtm = '(3/4 (1 1/2 (4/3 (1 -1/2 1))))'
+        >>> compiled = abjad.rhythmtrees.CompiledRhythmTree(rtm)
+        >>> staff = abjad.Staff(compiled((1, 4)))
+        >>> abjad.show(staff) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> abjad.f(staff)
+            \new Staff
+            {
+                \tweak text #tuplet-number::calc-fraction-text
+                \times 9/17 {
+                    c'8
+                    c'16
+                    \tweak edge-height #'(0.7 . 0)
+                    \times 8/15 {
+                        c'8
+                        r16
+                        c'8
+                    }
+                }
+            }
+
+    Compiling walks the tree once; prolations and offsets are then read from
+    arrays instead of being recomputed through the parentage of each node.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_children",
+        "_contents_durations",
+        "_denominator",
+        "_is_pitched",
+        "_parents",
+        "_preprolated_durations",
+        "_prolations",
+        "_rtm_format",
+        "_start_ticks",
+        "_stop_ticks",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, argument) -> None:
+        if isinstance(argument, str):
+            nodes = RhythmTreeParser()(argument)
+            if len(nodes) != 1:
+                message = f"RTM string must describe one rhythm tree: {argument!r}."
+                raise ValueError(message)
+            argument = nodes[0]
+        if not isinstance(argument, RhythmTreeMixin):
+            message = f"must be rhythm-tree node or RTM string: {argument!r}."
+            raise TypeError(message)
+        parents: typing.List[typing.Optional[int]] = []
+        children: typing.List[typing.Tuple[int, ...]] = []
+        preprolated_durations = []
+        contents_durations: typing.List[typing.Optional[Duration]] = []
+        is_pitched: typing.List[typing.Optional[bool]] = []
+        prolations, start_offsets, stop_offsets = [], [], []
+        stack = [(argument, None, Multiplier(1), quicktions.Fraction(0))]
+        while stack:
+            node, parent, prolation, start_offset = stack.pop()
+            index = len(parents)
+            parents.append(parent)
+            children.append(())
+            if parent is not None:
+                children[parent] += (index,)
+            preprolated_durations.append(node.preprolated_duration)
+            prolations.append(prolation)
+            start_offsets.append(start_offset)
+            stop_offsets.append(start_offset + prolation * node.preprolated_duration)
+            if isinstance(node, RhythmTreeContainer):
+                contents_duration = node._get_contents_duration()
+                contents_durations.append(contents_duration)
+                is_pitched.append(None)
+                prolation = Multiplier(
+                    prolation * node.preprolated_duration / contents_duration
+                )
+                pending = []
+                for child in node:
+                    pending.append((child, index, prolation, start_offset))
+                    start_offset += prolation * child.preprolated_duration
+                stack.extend(reversed(pending))
+            else:
+                contents_durations.append(None)
+                is_pitched.append(bool(node.is_pitched))
+        denominators = [_.denominator for _ in start_offsets + stop_offsets]
+        denominator = mathx.least_common_multiple(1, *denominators)
+        self._parents = tuple(parents)
+        self._children = tuple(children)
+        self._preprolated_durations = tuple(preprolated_durations)
+        self._contents_durations = tuple(contents_durations)
+        self._is_pitched = tuple(is_pitched)
+        self._prolations = tuple(prolations)
+        self._denominator = denominator
+        self._start_ticks = tuple(
+            _.numerator * (denominator // _.denominator) for _ in start_offsets
+        )
+        self._stop_ticks = tuple(
+            _.numerator * (denominator // _.denominator) for _ in stop_offsets
+        )
+        self._rtm_format = argument.rtm_format
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, pulse_duration):
+        """
+        Generates Abjad score components.
+
+        Returns list of components.
+        """
+        children = self._children
+        contents_durations = self._contents_durations
+        is_pitched = self._is_pitched
+        preprolated_durations = self._preprolated_durations
+        maker = LeafMaker()
+
+        def recurse(index, tuplet_duration):
+            contents_duration = contents_durations[index]
+            basic_prolated_duration = tuplet_duration / contents_duration
+            basic_written_duration = (
+                basic_prolated_duration.equal_or_greater_power_of_two
+            )
+            components = []
+            for child in children[index]:
+                preprolated_duration = preprolated_durations[child]
+                if is_pitched[child] is None:
+                    multiplier, components_ = recurse(
+                        child, preprolated_duration * basic_written_duration
+                    )
+                    if multiplier == 1:
+                        components.extend(components_)
+                    else:
+                        components.append(Tuplet(multiplier, components_))
+                    continue
+                total_duration = basic_written_duration * preprolated_duration
+                if total_duration.is_assignable:
+                    if is_pitched[child]:
+                        components.append(Note(0, total_duration))
+                    else:
+                        components.append(Rest(total_duration))
+                    continue
+                if is_pitched[child]:
+                    leaves = maker(0, total_duration)
+                else:
+                    leaves = maker([None], total_duration)
+                components.extend(leaves)
+                if 1 < len(leaves):
+                    tie(leaves)
+            multiplier = tuplet_duration / (contents_duration * basic_written_duration)
+            return multiplier, components
+
+        pulse_duration = Duration(pulse_duration)
+        assert 0 < pulse_duration
+        preprolated_duration = preprolated_durations[0]
+        if is_pitched[0] is not None:
+            total_duration = pulse_duration * preprolated_duration
+            if is_pitched[0]:
+                return maker(0, total_duration)
+            return maker([None], total_duration)
+        multiplier, components = recurse(0, pulse_duration * preprolated_duration)
+        tuplet = Tuplet(multiplier, components)
+        if tuplet.multiplier == 1:
+            result = tuplet[:]
+        else:
+            result = [tuplet]
+        for component in result[:]:
+            if isinstance(component, Tuplet):
+                if component.trivial():
+                    Mutation._extract(component)
+        return result
+
+    def __len__(self) -> int:
+        """
+        Gets number of nodes in compiled rhythm tree.
+        """
+        return len(self._parents)
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        return FormatSpecification(
+            client=self,
+            storage_format_args_values=[self.rtm_format],
+            storage_format_is_indented=False,
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def children(self) -> typing.Tuple[typing.Tuple[int, ...], ...]:
+        """
+        Gets child indices of each node; leaves have no children.
+        """
+        return self._children
+
+    @property
+    def contents_durations(self) -> typing.Tuple[typing.Optional[Duration], ...]:
+        """
+        Gets contents duration of each container; none for leaves.
+        """
+        return self._contents_durations
+
+    @property
+    def denominator(self) -> int:
+        """
+        Gets tick denominator of compiled rhythm tree.
+        """
+        return self._denominator
+
+    @property
+    def is_pitched(self) -> typing.Tuple[typing.Optional[bool], ...]:
+        """
+        Gets pitchedness of each leaf; none for containers.
+        """
+        return self._is_pitched
+
+    @property
+    def parents(self) -> typing.Tuple[typing.Optional[int], ...]:
+        """
+        Gets parent index of each node; none for root.
+        """
+        return self._parents
+
+    @property
+    def preprolated_durations(self) -> typing.Tuple[Duration, ...]:
+        """
+        Gets preprolated duration of each node.
+        """
+        return self._preprolated_durations
+
+    @property
+    def prolations(self) -> typing.Tuple[Multiplier, ...]:
+        """
+        Gets prolation of each node.
+        """
+        return self._prolations
+
+    @property
+    def rtm_format(self) -> str:
+        """
+        Gets RTM format of compiled rhythm tree.
+        """
+        return self._rtm_format
+
+    @property
+    def start_offsets(self) -> typing.Tuple[Offset, ...]:
+        """
+        Gets start offset of each node.
+        """
+        return tuple(Offset(_, self._denominator) for _ in self._start_ticks)
+
+    @property
+    def start_ticks(self) -> typing.Tuple[int, ...]:
+        """
+        Gets start offset of each node in ticks.
+        """
+        return self._start_ticks
+
+    @property
+    def stop_offsets(self) -> typing.Tuple[Offset, ...]:
+        """
+        Gets stop offset of each node.
+        """
+        return tuple(Offset(_, self._denominator) for _ in self._stop_ticks)
+
+    @property
+    def stop_ticks(self) -> typing.Tuple[int, ...]:
+        """
+        Gets stop offset of each node in ticks.
+        """
+        return self._stop_ticks
+
+
 def parse_rtm_syntax(rtm):
     r"""
     Parses RTM syntax.
@@ -9,11 +9,11 @@ import quicktions
 
 from . import enums, exceptions, mathx, typings
 from .bundle import LilyPondFormatBundle
+from .contextmanagers import Profiler
 from .duration import Duration, Multiplier, NonreducedFraction
 from .ly.LilyPondContext import LilyPondContext
 from .ly.drums import drums
 from .markups import Markup
-from .new import new
 from .overrides import TweakInterface, override, setting, tweak
 from .pitch.pitches import NamedPitch
 from .pitch.segments import PitchSegment
@@ -33,9 +33,14 @@ class Component:
     __slots__ = (
         "_indicators_are_current",
         "_is_forbidden_to_update",
+        "_iteration_snapshots",
+        "_journal",
+        "_leaf_index",
         "_overrides",
+        "_lilypond_format",
         "_lilypond_setting_name_manager",
         "_measure_number",
+        "_measure_numbers_are_current",
         "_offsets_are_current",
         "_offsets_in_seconds_are_current",
         "_parent",
@@ -50,6 +55,9 @@ class Component:
 
     _is_abstract = True
 
+    # advances when indicators change in place:
+    _lilypond_format_epoch = 0
+
     ### INITIALIZER ###
 
     @staticmethod
@@ -62,7 +70,12 @@ class Component:
     def __init__(self, name: str = None, tag: Tag = None) -> None:
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
+        self._iteration_snapshots = None
+        self._journal = None
+        self._leaf_index = None
+        self._lilypond_format = None
         self._measure_number = None
+        self._measure_numbers_are_current = False
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
         self._overrides = None
@@ -101,10 +114,10 @@ class Component:
             if not wrapper.annotation:
                 continue
             wrapper_ = copy.copy(wrapper)
-            new(wrapper_, component=component)
+            wrapper_._bind_component(component)
         for wrapper in self._get_indicators(unwrap=False):
             wrapper_ = copy.copy(wrapper)
-            new(wrapper_, component=component)
+            wrapper_._bind_component(component)
         return component
 
     def __getnewargs__(self):
@@ -136,16 +149,36 @@ class Component:
         return name_dictionary
 
     def _check_for_cycles(self, components):
-        parentage = [self]
+        parentage = {id(self)}
         parent = self._parent
         while parent is not None:
-            parentage.append(parent)
+            parentage.add(id(parent))
             parent = parent._parent
         for component in components:
-            if component in parentage:
+            if id(component) in parentage:
                 return True
         return False
 
+    def _clear_leaf_index(self):
+        for component in self._get_parentage():
+            component._leaf_index = None
+
+    def _clear_lilypond_format(self, descendants=False):
+        # grace music formats as part of main leaf:
+        component = root = self
+        while component is not None:
+            component._lilypond_format = None
+            root = component
+            if getattr(component, "_main_leaf", None) is not None:
+                component = component._main_leaf
+            else:
+                component = component._parent
+        if root._journal is not None:
+            root._journal.append((self, self._parent))
+        if descendants:
+            for component in self._get_subtree():
+                component._lilypond_format = None
+
     def _format_absolute_after_slot(self, bundle):
         result = []
         result.append(("literals", bundle.absolute_after.commands))
@@ -169,26 +202,7 @@ class Component:
         return []
 
     def _format_component(self, pieces=False):
-        from .formatx import LilyPondFormatManager
-
-        result = []
-        bundle = LilyPondFormatManager.bundle_format_contributions(self)
-        result.extend(self._format_absolute_before_slot(bundle))
-        result.extend(self._format_before_slot(bundle))
-        result.extend(self._format_open_brackets_slot(bundle))
-        result.extend(self._format_opening_slot(bundle))
-        result.extend(self._format_contents_slot(bundle))
-        result.extend(self._format_closing_slot(bundle))
-        result.extend(self._format_close_brackets_slot(bundle))
-        result.extend(self._format_after_slot(bundle))
-        result.extend(self._format_absolute_after_slot(bundle))
-        contributions = []
-        for contributor, contribution in result:
-            for line in contribution:
-                if line.isspace():
-                    contributions.append("")
-                else:
-                    contributions.append(line)
+        contributions = list(self._iterate_format_pieces())
         if pieces:
             return contributions
         else:
@@ -271,7 +285,9 @@ class Component:
             result.extend(contributions)
         return result
 
-    def _get_format_pieces(self):
+    def _get_format_pieces(self, streaming=False):
+        if streaming:
+            return self._iterate_format_pieces(streaming=True)
         return self._format_component(pieces=True)
 
     def _get_format_specification(self):
@@ -334,7 +350,12 @@ class Component:
 
     def _get_lilypond_format(self):
         self._update_now(indicators=True)
-        return self._format_component()
+        epoch = Component._lilypond_format_epoch
+        if self._lilypond_format is None or self._lilypond_format[0] != epoch:
+            start_time = Profiler._start()
+            self._lilypond_format = (epoch, self._format_component())
+            Profiler._stop("format", start_time)
+        return self._lilypond_format[1]
 
     def _get_markup(self, direction=None):
         markup = self._get_indicators(Markup)
@@ -387,6 +408,50 @@ class Component:
         indicators = self._get_indicators(prototype=prototype, attributes=attributes)
         return bool(indicators)
 
+    def _iterate_contents_slot(self, bundle):
+        return self._format_contents_slot(bundle)
+
+    def _iterate_format_pieces(self, streaming=False):
+        from .formatx import LilyPondFormatManager
+
+        bundle = LilyPondFormatManager.bundle_format_contributions(self)
+        Profiler._count("format_component")
+        if streaming:
+            format_contents_slot = self._iterate_contents_slot
+        else:
+            format_contents_slot = self._format_contents_slot
+        for format_slot in (
+            self._format_absolute_before_slot,
+            self._format_before_slot,
+            self._format_open_brackets_slot,
+            self._format_opening_slot,
+            format_contents_slot,
+            self._format_closing_slot,
+            self._format_close_brackets_slot,
+            self._format_after_slot,
+            self._format_absolute_after_slot,
+        ):
+            for contributor, contribution in format_slot(bundle):
+                for line in contribution:
+                    if line.isspace():
+                        yield ""
+                    else:
+                        yield line
+
+    def _iterate_lilypond_format(self):
+        self._update_now(indicators=True)
+        epoch = Component._lilypond_format_epoch
+        if self._lilypond_format is not None and self._lilypond_format[0] == epoch:
+            yield self._lilypond_format[1]
+        else:
+            # streams pieces without building or caching format string:
+            yield from self._iterate_format_pieces(streaming=True)
+
+    def _journal_change(self):
+        root = self._get_parentage()[-1]
+        if root._journal is not None:
+            root._journal.append((self, self._parent))
+
     def _remove_from_parent(self):
         self._update_later(offsets=True)
         for component in self._get_parentage()[1:]:
@@ -395,8 +460,10 @@ class Component:
             for wrapper in component._dependent_wrappers[:]:
                 if wrapper.component is self:
                     component._dependent_wrappers.remove(wrapper)
+                    component._dependent_wrapper_index.clear()
+                    component._journal_change()
         if self._parent is not None:
-            self._parent._components.remove(self)
+            self._parent._remove_child(self)
         self._parent = None
 
     def _remove_named_children_from_parentage(self, name_dictionary):
@@ -429,6 +496,11 @@ class Component:
         self._parent = new_parent
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
+        # prolation and effective contexts of descendants may change when
+        # subtree moves:
+        for component in self._get_subtree():
+            component._lilypond_format = None
+            component._offsets_are_current = False
 
     def _sibling(self, n):
         assert n in (-1, 0, 1), repr(n)
@@ -442,13 +514,23 @@ class Component:
     def _tag_strings(self, strings):
         return Tag.tag(strings, tag=self.tag)
 
-    def _update_later(self, offsets=False, offsets_in_seconds=False):
-        assert offsets or offsets_in_seconds
+    def _update_later(
+        self, offsets=False, offsets_in_seconds=False, measure_numbers=False
+    ):
+        assert offsets or offsets_in_seconds or measure_numbers
+        if offsets:
+            self._clear_lilypond_format()
         for component in self._get_parentage():
             if offsets:
+                component._iteration_snapshots = None
+                component._leaf_index = None
                 component._offsets_are_current = False
+                component._offsets_in_seconds_are_current = False
+                component._measure_numbers_are_current = False
             elif offsets_in_seconds:
                 component._offsets_in_seconds_are_current = False
+            elif measure_numbers:
+                component._measure_numbers_are_current = False
 
     def _update_measure_numbers(self):
         from ._update import _update_measure_numbers
@@ -549,7 +631,7 @@ class Leaf(Component):
             self._lilypond_setting_name_manager = copy.copy(setting(leaf))
         for wrapper in leaf._wrappers:
             wrapper_ = copy.copy(wrapper)
-            new(wrapper_, component=self)
+            wrapper_._bind_component(self)
 
     def _format_after_grace_body(self):
         result = []
@@ -640,7 +722,7 @@ class Leaf(Component):
     def _get_compact_representation(self):
         return f"({self._get_formatted_duration()})"
 
-    def _get_format_pieces(self):
+    def _get_format_pieces(self, streaming=False):
         return self._get_lilypond_format().split("\n")
 
     def _get_format_specification(self):
@@ -720,6 +802,7 @@ class Leaf(Component):
         else:
             multiplier = Multiplier(argument)
         self._multiplier = multiplier
+        self._update_later(offsets=True)
 
     @property
     def written_duration(self) -> Duration:
@@ -735,6 +818,7 @@ class Leaf(Component):
             message = f"not assignable duration: {duration!r}."
             raise exceptions.AssignabilityError(message)
         self._written_duration = duration
+        self._update_later(offsets=True)
 
 
 class Container(Component):
@@ -890,6 +974,8 @@ class Container(Component):
     __documentation_section__ = "Containers"
 
     __slots__ = (
+        "_child_position_misses",
+        "_child_positions",
         "_identifier",
         "_components",
         "_formatter",
@@ -910,6 +996,8 @@ class Container(Component):
     ) -> None:
         components = components or []
         Component.__init__(self, tag=tag)
+        self._child_position_misses = 0
+        self._child_positions: dict = {}
         self._named_children: dict = {}
         self._is_simultaneous = None
         # sets name temporarily for _find_correct_effective_context:
@@ -1108,14 +1196,38 @@ class Container(Component):
 
     ### PRIVATE METHODS ###
 
-    def _copy_with_children(self):
+    def _copy_subtree(self):
         new_container = self.__copy__()
+        named_children = new_container._named_children
         for component in self:
             if isinstance(component, Container):
-                new_component = component._copy_with_children()
+                new_component = component._copy_subtree()
+                for name, children in new_component._named_children.items():
+                    if name in named_children:
+                        named_children[name].extend(children)
+                    else:
+                        named_children[name] = list(children)
             else:
                 new_component = component.__copy__()
-            new_container.append(new_component)
+            name = getattr(new_component, "name", None)
+            if name is not None:
+                if name in named_children:
+                    named_children[name].append(new_component)
+                else:
+                    named_children[name] = [new_component]
+            new_component._parent = new_container
+            new_container._components.append(new_component)
+        return new_container
+
+    def _copy_with_children(self):
+        # wires new tree directly instead of appending child by child:
+        new_container = self._copy_subtree()
+        for component in new_container._get_subtree():
+            component._iteration_snapshots = None
+            component._leaf_index = None
+            for wrapper in component._get_indicators(unwrap=False):
+                wrapper._update_effective_context()
+        new_container._update_later(offsets=True)
         return new_container
 
     def _eject_contents(self):
@@ -1127,6 +1239,29 @@ class Container(Component):
         self._components[:] = []
         return contents
 
+    def _find_child_position(self, component):
+        components = self._components
+        positions = self._child_positions
+        # scans after edits; rebuilds positions only after repeated misses:
+        self._child_position_misses += 1
+        if 16 <= self._child_position_misses:
+            self._child_position_misses = 0
+            positions.clear()
+            positions.update((id(_), i) for i, _ in enumerate(components))
+            return positions.get(id(component))
+        try:
+            i = components.index(component)
+        except ValueError:
+            return None
+        if components[i] is not component:
+            for i, component_ in enumerate(components):
+                if component_ is component:
+                    break
+            else:
+                return None
+        positions[id(component)] = i
+        return i
+
     def _format_after_slot(self, bundle):
         result = []
         result.append(("commands", bundle.after.commands))
@@ -1164,17 +1299,7 @@ class Container(Component):
         return self._format_slot_contributions_with_indent(result)
 
     def _format_content_pieces(self):
-        indent = LilyPondFormatBundle.indent
-        strings = []
-        for component in self.components:
-            string = component._get_lilypond_format()
-            for string in string.split("\n"):
-                if string.isspace():
-                    string = ""
-                else:
-                    string = indent + string
-                strings.append(string)
-        return strings
+        return list(self._iterate_content_pieces())
 
     def _format_contents_slot(self, bundle):
         result = []
@@ -1351,6 +1476,27 @@ class Container(Component):
     def _is_one_of_my_last_leaves(self, leaf):
         return leaf in self._get_descendants_stopping_with()
 
+    def _iterate_content_pieces(self, streaming=False):
+        indent = LilyPondFormatBundle.indent
+        for component in self.components:
+            if streaming:
+                strings = component._iterate_lilypond_format()
+            else:
+                strings = [component._get_lilypond_format()]
+            for string in strings:
+                for string in string.split("\n"):
+                    if string.isspace():
+                        yield ""
+                    else:
+                        yield indent + string
+
+    def _iterate_contents_slot(self, bundle):
+        result = []
+        result.append(
+            [("contents", "_contents"), self._iterate_content_pieces(streaming=True)]
+        )
+        return tuple(result)
+
     def _parse_string(self, string):
         user_input = string.strip()
         if not user_input.startswith("<<") or not user_input.endswith(">>"):
@@ -1359,6 +1505,13 @@ class Container(Component):
         assert isinstance(parsed, Container)
         return parsed
 
+    def _remove_child(self, component):
+        components = self._components
+        i = self._child_positions.pop(id(component), None)
+        if i is None or len(components) <= i or components[i] is not component:
+            i = components.index(component)
+        del components[i]
+
     @staticmethod
     def _remove_powers_of_two(n):
         assert isinstance(n, int), repr(n)
@@ -1446,6 +1599,7 @@ class Container(Component):
     def identifier(self, argument):
         assert isinstance(argument, (str, type(None))), repr(argument)
         self._identifier: typing.Optional[str] = argument
+        self._clear_lilypond_format()
 
     @property
     def name(self) -> typing.Optional[str]:
@@ -1516,6 +1670,10 @@ class Container(Component):
                     named_children[argument].append(self)
             parent = parent._parent
         self._name = argument
+        # wrappers may resolve effective context by name:
+        if argument != old_name:
+            self._clear_leaf_index()
+            self._clear_lilypond_format(descendants=True)
 
     @property
     def simultaneous(self) -> typing.Optional[bool]:
@@ -1738,11 +1896,14 @@ class Container(Component):
             3
 
         """
-        for i, element in enumerate(self.components):
-            if element is component:
-                return i
-        else:
-            raise ValueError(f"component {component!r} not in container {self!r}.")
+        components = self._components
+        i = self._child_positions.get(id(component))
+        if i is None or len(components) <= i or components[i] is not component:
+            i = self._find_child_position(component)
+            if i is None:
+                message = f"component {component!r} not in container {self!r}."
+                raise ValueError(message)
+        return i
 
     def insert(self, i, component) -> None:
         r"""
@@ -2050,12 +2211,16 @@ class AfterGraceContainer(Container):
             raise TypeError(f"must attach to leaf (not {leaf!r}).")
         leaf._after_grace_container = self
         self._main_leaf = leaf
+        leaf._update_later(offsets=True)
+        self._clear_lilypond_format(descendants=True)
 
     def _detach(self):
         if self._main_leaf is not None:
             main_leaf = self._main_leaf
             main_leaf._after_grace_container = None
             self._main_leaf = None
+            main_leaf._update_later(offsets=True)
+            self._clear_lilypond_format(descendants=True)
         return self
 
     def _format_open_brackets_slot(self, bundle):
@@ -2265,12 +2430,16 @@ class BeforeGraceContainer(Container):
             raise TypeError(f"must attach to leaf {leaf!r}.")
         leaf._before_grace_container = self
         self._main_leaf = leaf
+        leaf._update_later(offsets=True)
+        self._clear_lilypond_format(descendants=True)
 
     def _detach(self):
         if self._main_leaf is not None:
             main_leaf = self._main_leaf
             main_leaf._before_grace_container = None
             self._main_leaf = None
+            main_leaf._update_later(offsets=True)
+            self._clear_lilypond_format(descendants=True)
         return self
 
     def _format_open_brackets_slot(self, bundle):
@@ -2279,10 +2448,6 @@ class BeforeGraceContainer(Container):
         result.append([("grace_brackets", "open"), [string]])
         return tuple(result)
 
-    def _get_lilypond_format(self):
-        self._update_now(indicators=True)
-        return self._format_component()
-
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -2666,7 +2831,7 @@ class Chord(Leaf):
                 is_forced = None
             if not is_parenthesized:
                 is_parenthesized = None
-            if written_pitch not in drums:
+            if not (isinstance(written_pitch, str) and written_pitch in drums):
                 note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -2946,10 +3111,6 @@ class Cluster(Container):
         result.append([contributor, contributions])
         return tuple(result)
 
-    def _get_lilypond_format(self):
-        self._update_now(indicators=True)
-        return self._format_component()
-
 
 class Context(Container):
     r"""
@@ -2981,6 +3142,7 @@ class Context(Container):
     __slots__ = (
         "_lilypond_type",
         "_consists_commands",
+        "_dependent_wrapper_index",
         "_dependent_wrappers",
         "_remove_commands",
     )
@@ -3021,6 +3183,7 @@ class Context(Container):
         tag: Tag = None,
     ) -> None:
         self._consists_commands: typing.List[str] = []
+        self._dependent_wrapper_index: typing.Dict = {}
         self._dependent_wrappers: typing.List = []
         self._remove_commands: typing.List[str] = []
         self.lilypond_type = lilypond_type
@@ -3083,7 +3246,7 @@ class Context(Container):
 
     def _format_consists_commands(self):
         result = []
-        for engraver in self.consists_commands:
+        for engraver in self._consists_commands:
             string = rf"\consists {engraver}"
             result.append(string)
         return result
@@ -3165,18 +3328,11 @@ class Context(Container):
 
     def _format_remove_commands(self):
         result = []
-        for engraver in self.remove_commands:
+        for engraver in self._remove_commands:
             string = rf"\remove {engraver}"
             result.append(string)
         return result
 
-    def _get_format_pieces(self):
-        return self._format_component(pieces=True)
-
-    def _get_lilypond_format(self):
-        self._update_now(indicators=True)
-        return self._format_component()
-
     def _get_repr_keyword_names(self):
         if self.lilypond_type == type(self).__name__:
             return ["simultaneous", "name"]
@@ -3207,6 +3363,8 @@ class Context(Container):
             }
 
         """
+        # caller may change list in place:
+        self._clear_lilypond_format()
         return self._consists_commands
 
     @property
@@ -3248,7 +3406,11 @@ class Context(Container):
             argument = type(self).__name__
         else:
             argument = str(argument)
+        old_lilypond_type = getattr(self, "_lilypond_type", None)
         self._lilypond_type = argument
+        # wrappers may resolve effective context by lilypond type:
+        if old_lilypond_type is not None and argument != old_lilypond_type:
+            self._clear_lilypond_format(descendants=True)
 
     @property
     def remove_commands(self):
@@ -3271,6 +3433,8 @@ class Context(Container):
             }
 
         """
+        # caller may change list in place:
+        self._clear_lilypond_format()
         return self._remove_commands
 
     @property
@@ -3546,6 +3710,10 @@ class NoteHead:
 
     ### PRIVATE METHODS ###
 
+    def _clear_client_lilypond_format(self):
+        if self._client is not None:
+            self._client._clear_lilypond_format()
+
     def _get_format_pieces(self):
         assert self.written_pitch
         result = []
@@ -3678,6 +3846,7 @@ class NoteHead:
             assert isinstance(argument[1], str), repr(argument)
             assert isinstance(argument[2], str), repr(argument)
         self._alternative = argument
+        self._clear_client_lilypond_format()
 
     @property
     def client(self):
@@ -3727,6 +3896,7 @@ class NoteHead:
         if argument is not None:
             argument = bool(argument)
         self._is_cautionary = argument
+        self._clear_client_lilypond_format()
 
     @property
     def is_forced(self) -> bool:
@@ -3761,6 +3931,7 @@ class NoteHead:
         if argument is not None:
             argument = bool(argument)
         self._is_forced = argument
+        self._clear_client_lilypond_format()
 
     @property
     def is_parenthesized(self) -> bool:
@@ -3797,6 +3968,7 @@ class NoteHead:
         if argument is not None:
             argument = bool(argument)
         self._is_parenthesized = argument
+        self._clear_client_lilypond_format()
 
     @property
     def named_pitch(self) -> NamedPitch:
@@ -3918,6 +4090,7 @@ class NoteHead:
         self._written_pitch = written_pitch
         if self.alternative is not None:
             self.alternative[0].written_pitch = written_pitch
+        self._clear_client_lilypond_format()
 
 
 class NoteHeadList(TypedList):
@@ -3989,8 +4162,10 @@ class NoteHeadList(TypedList):
 
     def _on_insertion(self, item):
         item._client = self.client
+        item._clear_client_lilypond_format()
 
     def _on_removal(self, item):
+        item._clear_client_lilypond_format()
         item._client = None
 
     ### PUBLIC METHODS ###
@@ -4296,7 +4471,7 @@ class Note(Leaf):
             raise ValueError("can not initialize note from {arguments!r}.")
         Leaf.__init__(self, written_duration, multiplier=multiplier, tag=tag)
         if written_pitch is not None:
-            if written_pitch not in drums:
+            if not (isinstance(written_pitch, str) and written_pitch in drums):
                 self.note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -4376,10 +4551,12 @@ class Note(Leaf):
         if isinstance(argument, type(None)):
             self._note_head = None
         elif isinstance(argument, NoteHead):
+            argument._client = self
             self._note_head = argument
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._clear_lilypond_format()
 
     @property
     def written_duration(self) -> Duration:
@@ -4946,10 +5123,6 @@ class TremoloContainer(Container):
         result.append([("tremolo_brackets", "open"), [string]])
         return tuple(result)
 
-    def _get_lilypond_format(self):
-        self._update_now(indicators=True)
-        return self._format_component()
-
     def _get_preprolated_duration(self):
         return self.implied_prolation * self._get_contents_duration()
 
@@ -5219,10 +5392,6 @@ class Tuplet(Container):
             storage_format_keyword_names=[],
         )
 
-    def _get_lilypond_format(self):
-        self._update_now(indicators=True)
-        return self._format_component()
-
     def _get_multiplier_fraction_string(self):
         if self.denominator is not None:
             inverse_multiplier = Multiplier(
@@ -5344,6 +5513,7 @@ class Tuplet(Container):
         elif not isinstance(argument, type(None)):
             raise TypeError(argument)
         self._denominator = argument
+        self._clear_lilypond_format()
 
     @property
     def force_fraction(self) -> typing.Optional[bool]:
@@ -5530,6 +5700,7 @@ class Tuplet(Container):
             self._force_fraction = argument
         else:
             raise TypeError(f"force fraction must be boolean (not {argument!r}).")
+        self._clear_lilypond_format()
 
     @property
     def hide(self) -> typing.Optional[bool]:
@@ -5605,6 +5776,7 @@ class Tuplet(Container):
     def hide(self, argument):
         assert isinstance(argument, (bool, type(None))), repr(argument)
         self._hide = argument
+        self._clear_lilypond_format()
 
     @property
     def implied_prolation(self) -> Multiplier:
@@ -5688,6 +5860,10 @@ class Tuplet(Container):
             self._multiplier = rational
         else:
             raise ValueError(f"tuplet multiplier must be positive: {argument!r}.")
+        # prolation of descendants changes with multiplier:
+        for component in self._get_subtree():
+            component._offsets_are_current = False
+        self._update_later(offsets=True)
 
     @property
     def tag(self) -> typing.Optional[Tag]:
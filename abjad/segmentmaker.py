@@ -10,7 +10,6 @@ from .parentage import Parentage
 from .path import Path
 from .score import Container, Context, Score, Staff, Voice
 from .segments.PartAssignment import PartAssignment
-from .selectx import Selection
 from .storage import StorageFormatManager
 from .stringx import String
 from .tag import Tag
@@ -249,11 +248,14 @@ class SegmentMaker:
             if not context.simultaneous:
                 break
         site = Tag("abjad.SegmentMaker.comment_measure_numbers()")
-        measures = Selection(context).leaves().group_by_measure()
-        for i, measure in enumerate(measures):
-            measure_number = i + 1
-            first_leaf = Selection(measure).leaf(0)
-            start_offset = first_leaf._get_timespan().start_offset
+        score._update_measure_numbers()
+        measure_numbers = set()
+        for leaf in Iteration(context).leaves():
+            measure_number = leaf._measure_number
+            if measure_number in measure_numbers:
+                continue
+            measure_numbers.add(measure_number)
+            start_offset = leaf._get_timespan().start_offset
             offset_to_measure_number[start_offset] = measure_number
         for leaf in Iteration(score).leaves():
             offset = leaf._get_timespan().start_offset
@@ -283,6 +283,71 @@ class StorageFormatSpecification:
         return self._storage_format_text
 
 
+class _SignatureDescriptor:
+    """
+    Signature descriptor.
+
+    Holds initializer signature names of one class together with the
+    attribute names ``StorageFormatManager`` reads for each signature name.
+    Built once per class.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "accepts_args",
+        "accepts_keywords",
+        "accessors",
+        "keyword_names",
+        "positional_names",
+        "signature_names",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, class_):
+        positional_names = []
+        keyword_names = []
+        accepts_args = False
+        accepts_keywords = False
+        try:
+            signature = inspect.signature(class_)
+        except ValueError:
+            signature = None
+        if signature is not None:
+            for name, parameter in signature.parameters.items():
+                if parameter.kind == inspect._POSITIONAL_OR_KEYWORD:
+                    if parameter.default == parameter.empty:
+                        positional_names.append(name)
+                    else:
+                        keyword_names.append(name)
+                elif parameter.kind == inspect._KEYWORD_ONLY:
+                    keyword_names.append(name)
+                elif parameter.kind == inspect._VAR_POSITIONAL:
+                    accepts_args = True
+                elif parameter.kind == inspect._VAR_KEYWORD:
+                    accepts_keywords = True
+        self.accepts_args = accepts_args
+        self.accepts_keywords = accepts_keywords
+        self.positional_names = tuple(positional_names)
+        self.keyword_names = tuple(keyword_names)
+        self.signature_names = self.positional_names + self.keyword_names
+        self.accessors = {_: self.get_accessor(_) for _ in self.signature_names}
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def get_accessor(name):
+        """
+        Gets attribute names read, in order, for signature ``name``.
+        """
+        names = [name]
+        for name_ in ("_" + name, "_" + name.rstrip("_")):
+            if name_ not in names:
+                names.append(name_)
+        return tuple(names)
+
+
 class StorageFormatManager:
     """
     Manages Abjad object storage formats.
@@ -294,13 +359,12 @@ class StorageFormatManager:
 
     __slots__ = (
         "_client",
+        "_descriptor",
         "_format_specification",
-        "_signature_accepts_args",
-        "_signature_accepts_keywords",
-        "_signature_keyword_names",
-        "_signature_positional_names",
     )
 
+    _descriptors: dict = {}
+
     _exclude_tools_package = (
         "core",
         "indicators",
@@ -321,12 +385,7 @@ class StorageFormatManager:
     def __init__(self, client=None):
         self._client = client
         self._format_specification = None
-        (
-            self._signature_positional_names,
-            self._signature_keyword_names,
-            self._signature_accepts_args,
-            self._signature_accepts_keywords,
-        ) = self.inspect_signature(self._client)
+        self._descriptor = self._get_descriptor(client)
 
     ### PRIVATE METHODS ###
 
@@ -513,12 +572,14 @@ class StorageFormatManager:
 
     def _get(self, name):
         value = None
+        accessor = self._descriptor.accessors.get(name)
+        if accessor is None:
+            accessor = _SignatureDescriptor.get_accessor(name)
         try:
-            value = getattr(self._client, name, None)
-            if value is None:
-                value = getattr(self._client, "_" + name, None)
-            if value is None:
-                value = getattr(self._client, "_" + name.rstrip("_"), None)
+            for name_ in accessor:
+                value = getattr(self._client, name_, None)
+                if value is not None:
+                    break
         except AttributeError:
             try:
                 value = self._client[name]
@@ -526,6 +587,18 @@ class StorageFormatManager:
                 value = None
         return value
 
+    @classmethod
+    def _get_descriptor(class_, subject):
+        if not isinstance(subject, type):
+            subject = type(subject)
+        try:
+            return class_._descriptors[subject]
+        except KeyError:
+            pass
+        descriptor = _SignatureDescriptor(subject)
+        class_._descriptors[subject] = descriptor
+        return descriptor
+
     def _get_formatting_keywords(self, as_storage_format=True):
         # NOTE: This acts to abstract-away our competing spec-specs.
         #       It can probably be removed/reduced in the near future.
@@ -641,23 +714,23 @@ class StorageFormatManager:
 
     @property
     def signature_accepts_args(self):
-        return self._signature_accepts_args
+        return self._descriptor.accepts_args
 
     @property
     def signature_accepts_keywords(self):
-        return self._signature_accepts_keywords
+        return self._descriptor.accepts_keywords
 
     @property
     def signature_keyword_names(self):
-        return self._signature_keyword_names
+        return list(self._descriptor.keyword_names)
 
     @property
     def signature_names(self):
-        return self.signature_positional_names + self.signature_keyword_names
+        return list(self._descriptor.signature_names)
 
     @property
     def signature_positional_names(self):
-        return self._signature_positional_names
+        return list(self._descriptor.positional_names)
 
     ### PUBLIC METHODS ###
 
@@ -823,39 +896,16 @@ class StorageFormatManager:
     def inspect_signature(class_, subject):
         """
         Inspects signature of ``subject``.
+
+        Reads signature once per class and caches the result.
         """
-        positional_names = []
-        keyword_names = []
-        accepts_args = False
-        accepts_keywords = False
-        if not isinstance(subject, type):
-            subject = type(subject)
-        try:
-            signature = inspect.signature(subject)
-        except ValueError:
-            return (
-                positional_names,
-                keyword_names,
-                accepts_args,
-                accepts_keywords,
-            )
-        for name, parameter in signature.parameters.items():
-            if parameter.kind == inspect._POSITIONAL_OR_KEYWORD:
-                if parameter.default == parameter.empty:
-                    positional_names.append(name)
-                else:
-                    keyword_names.append(name)
-            # Python 3 allow keyword only parameters:
-            elif (
-                hasattr(inspect, "_KEYWORD_ONLY")
-                and parameter.kind == inspect._KEYWORD_ONLY
-            ):
-                keyword_names.append(name)
-            elif parameter.kind == inspect._VAR_POSITIONAL:
-                accepts_args = True
-            elif parameter.kind == inspect._VAR_KEYWORD:
-                accepts_keywords = True
-        return (positional_names, keyword_names, accepts_args, accepts_keywords)
+        descriptor = class_._get_descriptor(subject)
+        return (
+            list(descriptor.positional_names),
+            list(descriptor.keyword_names),
+            descriptor.accepts_args,
+            descriptor.accepts_keywords,
+        )
 
 
 ### FUNCTIONS ###
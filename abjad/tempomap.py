@@ -0,0 +1,177 @@
+import bisect
+import typing
+
+from .duration import Duration, Multiplier, Offset
+from .storage import FormatSpecification, StorageFormatManager
+
+
+class TempoMap:
+    """
+    Tempo map.
+
+    ..  container:: example
+
+        Maps offsets to clock time in seconds and back again:
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> mark = abjad.MetronomeMark((1, 4), 60)
+        >>> abjad.attach(mark, staff[0])
+        >>> mark = abjad.MetronomeMark((1, 4), 120)
+        >>> abjad.attach(mark, staff[2])
+        >>> tempo_map = abjad.inspect(staff).tempo_map()
+
+        >>> tempo_map.offset_to_seconds(abjad.Offset(1, 4))
+        Offset((1, 1))
+
+        >>> tempo_map.offset_to_seconds(abjad.Offset(3, 4))
+        Offset((5, 2))
+
+        >>> tempo_map.seconds_to_offset(abjad.Offset(5, 2))
+        Offset((3, 4))
+
+        >>> tempo_map.stop_offset_in_seconds
+        Offset((3, 1))
+
+    Segment lookup bisects sorted start offsets; both queries take O(log n)
+    time in the number of metronome marks.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_clocktime_durations",
+        "_clocktime_start_offsets",
+        "_durations",
+        "_metronome_marks",
+        "_start_offsets",
+        "_stop_offset",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, pairs, stop_offset) -> None:
+        pairs = list(pairs)
+        if not pairs:
+            raise ValueError("tempo map needs at least one metronome mark.")
+        pairs.sort(key=lambda _: _[0])
+        if pairs[0][0] != 0:
+            message = f"first metronome mark must start at 0: {pairs[0]!r}."
+            raise ValueError(message)
+        stop_offset = Offset(stop_offset)
+        start_offsets, metronome_marks = [], []
+        durations, clocktime_start_offsets, clocktime_durations = [], [], []
+        clocktime_start_offset = Offset(0)
+        for i, (start_offset, metronome_mark) in enumerate(pairs):
+            start_offset = Offset(start_offset)
+            if i + 1 < len(pairs):
+                stop_offset_ = pairs[i + 1][0]
+            else:
+                stop_offset_ = stop_offset
+            duration = stop_offset_ - start_offset
+            multiplier = Multiplier(60, metronome_mark.units_per_minute)
+            clocktime_duration = duration / metronome_mark.reference_duration
+            clocktime_duration *= multiplier
+            start_offsets.append(start_offset)
+            metronome_marks.append(metronome_mark)
+            durations.append(duration)
+            clocktime_start_offsets.append(clocktime_start_offset)
+            clocktime_durations.append(clocktime_duration)
+            clocktime_start_offset += clocktime_duration
+        self._start_offsets = start_offsets
+        self._metronome_marks = metronome_marks
+        self._durations = durations
+        self._clocktime_start_offsets = clocktime_start_offsets
+        self._clocktime_durations = clocktime_durations
+        self._stop_offset = stop_offset
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        """
+        Gets number of metronome marks in tempo map.
+        """
+        return len(self._start_offsets)
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        return FormatSpecification(
+            client=self,
+            storage_format_args_values=[self.pairs, self.stop_offset],
+            storage_format_is_indented=False,
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def pairs(self) -> typing.List[typing.Tuple]:
+        """
+        Gets (start offset, metronome mark) pairs of tempo map.
+        """
+        return list(zip(self._start_offsets, self._metronome_marks))
+
+    @property
+    def stop_offset(self) -> Offset:
+        """
+        Gets stop offset of tempo map.
+        """
+        return self._stop_offset
+
+    @property
+    def stop_offset_in_seconds(self) -> Offset:
+        """
+        Gets stop offset of tempo map in seconds.
+        """
+        offset = self._clocktime_start_offsets[-1] + self._clocktime_durations[-1]
+        return Offset(offset)
+
+    ### PUBLIC METHODS ###
+
+    def offset_to_seconds(self, offset) -> Offset:
+        """
+        Changes ``offset`` to clock time in seconds.
+
+        Ignores displacement of grace music offsets.
+
+        Raises value error when ``offset`` lies outside tempo map.
+        """
+        offset = Offset(offset)
+        # grace music sounds at the clock time of its undisplaced offset:
+        if offset.displacement is not None:
+            offset = Offset(offset.pair)
+        if offset == self._stop_offset:
+            return self.stop_offset_in_seconds
+        if not (0 <= offset < self._stop_offset):
+            message = f"offset {offset!r} not in tempo map "
+            message += f"[0, {self._stop_offset!r})."
+            raise ValueError(message)
+        i = bisect.bisect(self._start_offsets, offset) - 1
+        local_offset = offset - self._start_offsets[i]
+        multiplier = local_offset / self._durations[i]
+        duration = multiplier * self._clocktime_durations[i]
+        return Offset(self._clocktime_start_offsets[i] + duration)
+
+    def seconds_to_offset(self, seconds) -> Offset:
+        """
+        Changes clock time ``seconds`` to offset.
+
+        Raises value error when ``seconds`` lies outside tempo map.
+        """
+        seconds = Duration(seconds)
+        if seconds == self.stop_offset_in_seconds:
+            return self._stop_offset
+        if not (0 <= seconds < self.stop_offset_in_seconds):
+            message = f"{seconds!r} seconds not in tempo map "
+            message += f"[0, {self.stop_offset_in_seconds!r})."
+            raise ValueError(message)
+        i = bisect.bisect(self._clocktime_start_offsets, seconds) - 1
+        local_seconds = seconds - self._clocktime_start_offsets[i]
+        multiplier = local_seconds / self._clocktime_durations[i]
+        duration = multiplier * self._durations[i]
+        return Offset(self._start_offsets[i] + duration)
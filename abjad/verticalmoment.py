@@ -1,9 +1,21 @@
+import bisect
+import collections
+import heapq
+
+import quicktions
+
 from .enumeratex import Enumerator
 from .iterate import Iteration
-from .ordereddict import OrderedDict
 from .parentage import Parentage
 from .pitch.segments import PitchSegment
-from .score import Chord, Leaf, Note
+from .score import (
+    AfterGraceContainer,
+    BeforeGraceContainer,
+    Chord,
+    Container,
+    Leaf,
+    Note,
+)
 from .selectx import Selection
 from .sequence import Sequence
 
@@ -490,7 +502,141 @@ class VerticalMoment:
 ### FUNCTIONS ###
 
 
-def iterate_vertical_moments(components, reverse=None):
+def _get_offset_key(offset):
+    """
+    Gets sort key of ``offset``; orders like ``offset`` but compares faster.
+    """
+    displacement = offset.displacement or 0
+    if displacement:
+        displacement = quicktions.Fraction(*displacement.pair)
+    return (quicktions.Fraction(*offset.pair), displacement)
+
+
+def _get_score_index(component, score_indices):
+    """
+    Gets score index of ``component``; caches score indices of siblings.
+    """
+    score_index = score_indices.get(id(component))
+    if score_index is not None:
+        return score_index
+    parent = component._parent
+    if parent is None or isinstance(
+        component, (AfterGraceContainer, BeforeGraceContainer)
+    ):
+        score_index = Parentage(component).score_index()
+        score_indices[id(component)] = score_index
+        return score_index
+    parent_score_index = _get_score_index(parent, score_indices)
+    for i, child in enumerate(parent._components):
+        score_indices[id(child)] = parent_score_index + (i,)
+    return score_indices[id(component)]
+
+
+def _get_start_offset_key(component):
+    return _get_offset_key(component._get_timespan().start_offset)
+
+
+def _iterate_components_by_start_offset(component):
+    """
+    Iterates ``component``, its descendants and their grace music in order
+    of start offset without first collecting all components.
+
+    Merges the children of simultaneous containers. Preorder within
+    sequential containers leaves start offsets out of order only where grace
+    music displaces components at the same undisplaced offset; those
+    components are buffered until a later offset arrives.
+    """
+    if isinstance(component, Container) and component.simultaneous:
+        yield from heapq.merge(
+            [component],
+            *[_iterate_components_by_start_offset(_) for _ in component],
+            key=_get_start_offset_key,
+        )
+        return
+    buffer, buffer_pair = [], None
+    for component_ in _iterate_sequential_components(component):
+        start_offset = component_._get_timespan().start_offset
+        if buffer and buffer_pair != start_offset.pair:
+            buffer.sort(key=_get_start_offset_key)
+            yield from buffer
+            buffer = []
+        buffer.append(component_)
+        buffer_pair = start_offset.pair
+    buffer.sort(key=_get_start_offset_key)
+    yield from buffer
+
+
+def _iterate_sequential_components(component):
+    before_grace_container = getattr(component, "_before_grace_container", None)
+    if before_grace_container is not None:
+        yield from _iterate_sequential_components(before_grace_container)
+    yield component
+    after_grace_container = getattr(component, "_after_grace_container", None)
+    if after_grace_container is not None:
+        yield from _iterate_sequential_components(after_grace_container)
+    if isinstance(component, Container):
+        for child in component:
+            if isinstance(child, Container) and child.simultaneous:
+                yield from _iterate_components_by_start_offset(child)
+            else:
+                yield from _iterate_sequential_components(child)
+
+
+def _make_vertical_moment(offset, sounding_components, stop_offsets):
+    offset_key = _get_offset_key(offset)
+    while stop_offsets and stop_offsets[0][0] <= offset_key:
+        item = heapq.heappop(stop_offsets)[-1]
+        del sounding_components[bisect.bisect_left(sounding_components, item)]
+    components = [_[-1] for _ in sounding_components]
+    return VerticalMoment(components=components, offset=offset)
+
+
+def _make_start_offset_streams(argument):
+    """
+    Makes one start-offset-ordered stream per container in ``argument``;
+    leaves in ``argument`` contribute themselves without grace music, as in
+    ``Selection.components()``.
+    """
+    if isinstance(argument, Container):
+        return [_iterate_components_by_start_offset(argument)]
+    if isinstance(argument, collections.abc.Iterable):
+        return [_ for item in argument for _ in _make_start_offset_streams(item)]
+    return [iter([argument])]
+
+
+def _sweep_vertical_moments(pairs):
+    """
+    Sweeps (timespan, component) ``pairs`` in order of start offset and
+    yields one vertical moment per distinct start offset.
+
+    Keeps components sounding at the current offset sorted by score index
+    and keeps their stop offsets in a heap; each component enters and leaves
+    the sweep once.
+    """
+    score_indices, ids = {}, set()
+    sounding_components, stop_offsets = [], []
+    moment_offset, moment_offset_key = None, None
+    for count, (timespan, component) in enumerate(pairs):
+        if id(component) in ids:
+            continue
+        ids.add(id(component))
+        start_offset_key = _get_offset_key(timespan.start_offset)
+        if moment_offset is not None and start_offset_key != moment_offset_key:
+            yield _make_vertical_moment(
+                moment_offset, sounding_components, stop_offsets
+            )
+        moment_offset = timespan.start_offset
+        moment_offset_key = start_offset_key
+        score_index = _get_score_index(component, score_indices)
+        item = (score_index, count, component)
+        bisect.insort(sounding_components, item)
+        stop_offset_key = _get_offset_key(timespan.stop_offset)
+        heapq.heappush(stop_offsets, (stop_offset_key, count, item))
+    if moment_offset is not None:
+        yield _make_vertical_moment(moment_offset, sounding_components, stop_offsets)
+
+
+def iterate_vertical_moments(components, reverse=None, streaming=None):
     r'''
     Iterates vertical moments.
 
@@ -625,37 +771,50 @@ def iterate_vertical_moments(components, reverse=None):
         Selection([Note("a'4"), Note("e'8")])
         Selection([Note("a'4"), Note("f'8")])
 
-    Returns tuple.
+    ..  container:: example
+
+        Streams vertical moments. Merges components in order of start offset
+        as the score is traversed; yields the first vertical moment before
+        the rest of the score has been visited:
+
+        >>> score = abjad.Score()
+        >>> score.append(abjad.Staff("c'4 d'4 e'4 f'4"))
+        >>> score.append(abjad.Staff("g2 a8 b8 c'4"))
+        >>> moments = abjad.iterate_vertical_moments(score, streaming=True)
+        >>> next(moments).leaves
+        Selection([Note("c'4"), Note('g2')])
+
+        >>> for moment in moments:
+        ...     moment.leaves
+        ...
+        Selection([Note("d'4"), Note('g2')])
+        Selection([Note("e'4"), Note('a8')])
+        Selection([Note("e'4"), Note('b8')])
+        Selection([Note("f'4"), Note("c'4")])
+
+        Streaming in reverse is not supported.
+
+    Sweeps components in order of start offset: O(n log n) in the number of
+    components plus the size of the vertical moments yielded.
+
+    Returns generator.
     '''
-    moments = []
-    components = list(Selection(components).components())
-    components.sort(key=lambda _: _._get_timespan().start_offset)
-    offset_to_components = OrderedDict()
-    for component in components:
-        start_offset = component._get_timespan().start_offset
-        if start_offset not in offset_to_components:
-            offset_to_components[start_offset] = []
-    # TODO: optimize with bisect
-    for component in components:
-        inserted = False
-        timespan = component._get_timespan()
-        for offset, list_ in offset_to_components.items():
-            if (
-                timespan.start_offset <= offset < timespan.stop_offset
-                and component not in list_
-            ):
-                list_.append(component)
-                inserted = True
-            elif inserted is True:
-                break
-    moments = []
-    for offset, list_ in offset_to_components.items():
-        list_.sort(key=lambda _: Parentage(_).score_index())
-        moment = VerticalMoment(components=list_, offset=offset)
-        moments.append(moment)
+    if streaming is True:
+        if reverse is True:
+            raise Exception("can not stream vertical moments in reverse.")
+        components = heapq.merge(
+            *_make_start_offset_streams(components), key=_get_start_offset_key
+        )
+        pairs = ((_._get_timespan(), _) for _ in components)
+        yield from _sweep_vertical_moments(pairs)
+        return
+    pairs = [(_._get_timespan(), _) for _ in Selection(components).components()]
+    pairs.sort(key=lambda _: _get_offset_key(_[0].start_offset))
     if reverse is True:
-        moments.reverse()
-    return tuple(moments)
+        moments = list(_sweep_vertical_moments(pairs))
+        yield from reversed(moments)
+    else:
+        yield from _sweep_vertical_moments(pairs)
 
 
 def iterate_leaf_pairs(components):
@@ -1,6 +1,7 @@
+import concurrent.futures
 import typing
 
-from . import _inspect, const
+from . import _inspect, _iterate, const
 from .duration import Duration
 from .indicators.Clef import Clef
 from .indicators.StartBeam import StartBeam
@@ -13,12 +14,533 @@ from .instruments import Instrument
 from .iterate import Iteration
 from .iterpitches import sounding_pitches_are_in_range
 from .parentage import Parentage
-from .score import Container, Context
+from .score import Chord, Component, Container, Context, Leaf, Note
 from .sequence import Sequence
 from .storage import StorageFormatManager
 from .tag import Tag
 
 
+class WellformednessCheck:
+    r"""
+    Wellformedness check.
+
+    ..  container:: example
+
+        Custom checks subclass wellformedness check and set ``name``:
+
+        >>> class RestsCheck(abjad.WellformednessCheck):
+        ...     name = "rests"
+        ...     def visit_component(self, component, cache):
+        ...         if isinstance(component, abjad.Rest):
+        ...             self.total += 1
+        ...             self.violators.append(component)
+        ...
+
+        >>> staff = abjad.Staff("c'4 r4 e'4 r4")
+        >>> wellformedness = abjad.Wellformedness(checks=[RestsCheck])
+        >>> for violators, total, check_name in wellformedness(staff):
+        ...     print(len(violators), total, check_name)
+        ...
+        0 4 check_beamed_long_notes
+        0 5 check_duplicate_ids
+        0 1 check_empty_containers
+        0 5 check_missing_parents
+        0 4 check_notes_on_wrong_clef
+        0 2 check_out_of_range_pitches
+        0 0 check_overlapping_text_spanners
+        2 2 check_rests
+        0 0 check_unmatched_stop_text_spans
+        0 0 check_unterminated_hairpins
+        0 0 check_unterminated_text_spanners
+
+    Wellformedness walks the score once per call. Wellformedness passes each
+    component to ``visit_component()`` of every check, then passes the
+    wrappers of each context name to ``visit_wrappers()``; checks must not
+    modify wrappers. Wellformedness then calls ``finish()``, which returns
+    ``(violators, total)`` pair.
+
+    Checks share ``cache`` during the walk; call
+    ``cache.get_effective(leaf, prototype)`` instead of
+    ``abjad.inspect(leaf).effective(prototype)``.
+
+    Wellformedness calls ``merge()`` to combine checks that walk different
+    staves in parallel; override ``merge()`` when checks keep state other
+    than violators and total.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Collaborators"
+
+    __slots__ = ("total", "violators")
+
+    name: typing.Optional[str] = None
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.violators: typing.List = []
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Delegates to storage format manager.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PUBLIC METHODS ###
+
+    def finish(self, cache) -> typing.Tuple[typing.List, int]:
+        """
+        Finishes check.
+
+        Returns violators and total.
+        """
+        return self.violators, self.total
+
+    def merge(self, check) -> None:
+        """
+        Merges violators and total of ``check`` into this check.
+        """
+        self.violators.extend(check.violators)
+        self.total += check.total
+
+    def visit_component(self, component, cache) -> None:
+        """
+        Visits ``component``.
+        """
+        pass
+
+    def visit_wrappers(self, wrappers, cache) -> None:
+        """
+        Visits ``wrappers`` of one context name, in attachment order.
+        """
+        pass
+
+
+class _WellformednessCache:
+    """
+    Effective indicators shared by wellformedness checks during one walk.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_argument",
+        "_effective",
+        "_indicator_types",
+        "_prototypes",
+        "_scan",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, argument, scan=True) -> None:
+        self._argument = argument
+        self._effective: typing.Dict = {}
+        self._indicator_types: typing.Optional[typing.Set] = None
+        self._prototypes: typing.Dict = {}
+        self._scan = scan
+
+    ### PRIVATE METHODS ###
+
+    def _get_indicator_types(self):
+        if self._indicator_types is None:
+            root = Parentage(self._argument).root
+            indicator_types = set()
+            components = _iterate._iterate_components(
+                root, do_not_iterate_grace_containers=False
+            )
+            for component in components:
+                for wrapper in component._wrappers:
+                    if not wrapper.annotation:
+                        indicator_types.add(type(wrapper.indicator))
+            self._indicator_types = indicator_types
+        return self._indicator_types
+
+    def _is_attached(self, prototype):
+        try:
+            return self._prototypes[prototype]
+        except KeyError:
+            pass
+        if self._scan and isinstance(self._argument, Component):
+            indicator_types = self._get_indicator_types()
+            result = any(issubclass(_, prototype) for _ in indicator_types)
+        else:
+            result = True
+        self._prototypes[prototype] = result
+        return result
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def argument(self):
+        """
+        Gets argument of wellformedness call.
+        """
+        return self._argument
+
+    ### PUBLIC METHODS ###
+
+    def get_effective(self, leaf, prototype, unwrap=True):
+        """
+        Gets effective indicator of ``prototype`` for ``leaf``.
+
+        Looks up each leaf, prototype and unwrap flag once per walk; returns
+        none without lookup when no indicator of ``prototype`` is attached
+        anywhere in the score.
+        """
+        key = (id(leaf), prototype, unwrap)
+        try:
+            return self._effective[key]
+        except KeyError:
+            pass
+        if self._is_attached(prototype):
+            result = _inspect._get_effective(leaf, prototype, unwrap=unwrap)
+        else:
+            result = None
+        self._effective[key] = result
+        return result
+
+
+class _BeamedLongNotesCheck(WellformednessCheck):
+
+    __slots__ = ()
+
+    name = "beamed_long_notes"
+
+    def visit_component(self, component, cache):
+        if not isinstance(component, Leaf):
+            return
+        self.total += 1
+        leaf = component
+        if leaf.written_duration < Duration((1, 4)):
+            return
+        start_wrapper = cache.get_effective(leaf, StartBeam, unwrap=False)
+        if start_wrapper is None:
+            return
+        stop_wrapper = cache.get_effective(leaf, StopBeam, unwrap=False)
+        if stop_wrapper is None:
+            self.violators.append(leaf)
+            return
+        if stop_wrapper.leaked_start_offset < start_wrapper.leaked_start_offset:
+            self.violators.append(leaf)
+            return
+        leaf_start_offset = leaf._get_timespan().start_offset
+        if stop_wrapper.leaked_start_offset == leaf_start_offset:
+            self.violators.append(leaf)
+
+
+class _DuplicateIDsCheck(WellformednessCheck):
+
+    __slots__ = ("_components",)
+
+    name = "duplicate_ids"
+
+    def __init__(self):
+        WellformednessCheck.__init__(self)
+        self._components = []
+
+    def finish(self, cache):
+        components = self._components
+        total_ids = [id(_) for _ in components]
+        if len(set(total_ids)) == len(total_ids):
+            return self.violators, len(total_ids)
+        unique_ids = Sequence(total_ids).remove_repeats()
+        if len(unique_ids) < len(total_ids):
+            for current_id in unique_ids:
+                if 1 < total_ids.count(current_id):
+                    self.violators.extend(
+                        [_ for _ in components if id(_) == current_id]
+                    )
+        return self.violators, len(total_ids)
+
+    def merge(self, check):
+        self._components.extend(check._components)
+
+    def visit_component(self, component, cache):
+        self._components.append(component)
+
+
+class _EmptyContainersCheck(WellformednessCheck):
+
+    __slots__ = ("_containers",)
+
+    name = "empty_containers"
+
+    def __init__(self):
+        WellformednessCheck.__init__(self)
+        self._containers = set()
+
+    def finish(self, cache):
+        return self.violators, len(self._containers)
+
+    def merge(self, check):
+        self.violators.extend(check.violators)
+        self._containers.update(check._containers)
+
+    def visit_component(self, component, cache):
+        if isinstance(component, Container):
+            self._containers.add(component)
+            if len(component) == 0:
+                self.violators.append(component)
+
+
+class _MissingParentsCheck(WellformednessCheck):
+
+    __slots__ = ("_components", "_first")
+
+    name = "missing_parents"
+
+    def __init__(self):
+        WellformednessCheck.__init__(self)
+        self._components = set()
+        self._first = None
+
+    def finish(self, cache):
+        return self.violators, len(self._components)
+
+    def merge(self, check):
+        self.violators.extend(check.violators)
+        self._components.update(check._components)
+
+    def visit_component(self, component, cache):
+        self._components.add(component)
+        if self._first is None:
+            self._first = component
+            return
+        # TODO: figure out why "if component._parent is None" doesn't work
+        if Parentage(component).parent is None:
+            self.violators.append(component)
+
+
+class _NotesOnWrongClefCheck(WellformednessCheck):
+
+    __slots__ = ("_leaves", "_results")
+
+    name = "notes_on_wrong_clef"
+
+    def __init__(self):
+        WellformednessCheck.__init__(self)
+        self._leaves = set()
+        self._results = {}
+
+    def finish(self, cache):
+        return self.violators, len(self._leaves)
+
+    def merge(self, check):
+        self.violators.extend(check.violators)
+        self._leaves.update(check._leaves)
+
+    def visit_component(self, component, cache):
+        if not isinstance(component, Leaf):
+            return
+        self._leaves.add(component)
+        instrument = cache.get_effective(component, Instrument)
+        if instrument is None:
+            return
+        clef = cache.get_effective(component, Clef)
+        if clef is None:
+            return
+        # effective instruments and clefs repeat from leaf to leaf:
+        key = (id(instrument), id(clef))
+        if key not in self._results:
+            allowable_clefs = [Clef(_) for _ in instrument.allowable_clefs]
+            allowable_clefs.append(Clef("percussion"))
+            self._results[key] = clef in allowable_clefs
+        if not self._results[key]:
+            self.violators.append(component)
+
+
+class _OutOfRangePitchesCheck(WellformednessCheck):
+
+    __slots__ = ("_leaves", "_results", "_unpitched")
+
+    name = "out_of_range_pitches"
+
+    def __init__(self):
+        WellformednessCheck.__init__(self)
+        self._leaves = set()
+        self._results = {}
+        self._unpitched = None
+
+    def finish(self, cache):
+        return self.violators, len(self._leaves)
+
+    def merge(self, check):
+        self.violators.extend(check.violators)
+        self._leaves.update(check._leaves)
+
+    def visit_component(self, component, cache):
+        if not isinstance(component, (Chord, Note)):
+            return
+        self._leaves.add(component)
+        if component._has_indicator(const.ALLOW_OUT_OF_RANGE):
+            return
+        if component._has_indicator(const.HIDDEN):
+            return
+        if self._unpitched is None:
+            self._unpitched = "unpitched" in cache.argument._get_indicators(str)
+        if self._unpitched:
+            return
+        instrument = cache.get_effective(component, Instrument)
+        if instrument is None:
+            return
+        if isinstance(component, Note):
+            pitches = (component.written_pitch,)
+        else:
+            pitches = component.written_pitches
+        key = (
+            id(instrument),
+            "sounding pitch" in component._get_indicators(str),
+            tuple(_.name for _ in pitches),
+        )
+        if key not in self._results:
+            # if leaf not in instrument.pitch_range:
+            pitch_range = instrument.pitch_range
+            result = sounding_pitches_are_in_range(component, pitch_range)
+            self._results[key] = result
+        if not self._results[key]:
+            self.violators.append(component)
+
+
+class _OverlappingTextSpannersCheck(WellformednessCheck):
+
+    __slots__ = ()
+
+    name = "overlapping_text_spanners"
+
+    @staticmethod
+    def _key(wrapper):
+        if isinstance(wrapper.indicator, StartTextSpan):
+            priority = 1
+        else:
+            priority = 0
+        return (wrapper.leaked_start_offset, priority)
+
+    def visit_wrappers(self, wrappers, cache):
+        open_spanners: typing.Dict = {}
+        for wrapper in sorted(wrappers, key=self._key):
+            if isinstance(wrapper.indicator, StartTextSpan):
+                self.total += 1
+                command = wrapper.indicator.command
+                command = command.replace("start", "")
+                command = command.replace("Start", "")
+                if command not in open_spanners:
+                    open_spanners[command] = []
+                if open_spanners[command]:
+                    self.violators.append(wrapper.component)
+                open_spanners[command].append(wrapper.component)
+            elif isinstance(wrapper.indicator, StopTextSpan):
+                command = wrapper.indicator.command
+                command = command.replace("stop", "")
+                command = command.replace("Stop", "")
+                if command in open_spanners and open_spanners[command]:
+                    open_spanners[command].pop()
+
+
+class _UnmatchedStopTextSpansCheck(WellformednessCheck):
+
+    __slots__ = ()
+
+    name = "unmatched_stop_text_spans"
+
+    def visit_wrappers(self, wrappers, cache):
+        open_spanners: typing.Dict = {}
+        for wrapper in sorted(wrappers, key=lambda _: _.leaked_start_offset):
+            if isinstance(wrapper.indicator, StartTextSpan):
+                self.total += 1
+                command = wrapper.indicator.command
+                command = command.replace("start", "")
+                command = command.replace("Start", "")
+                if command not in open_spanners:
+                    open_spanners[command] = []
+                open_spanners[command].append(wrapper.component)
+            elif isinstance(wrapper.indicator, StopTextSpan):
+                command = wrapper.indicator.command
+                command = command.replace("stop", "")
+                command = command.replace("Stop", "")
+                if command not in open_spanners or not open_spanners[command]:
+                    self.violators.append(wrapper.component)
+                else:
+                    open_spanners[command].pop()
+
+
+class _UnterminatedHairpinsCheck(WellformednessCheck):
+
+    __slots__ = ()
+
+    name = "unterminated_hairpins"
+
+    def visit_wrappers(self, wrappers, cache):
+        last_dynamic = None
+        last_tag = None
+        for wrapper in sorted(wrappers, key=lambda _: _.leaked_start_offset):
+            parameter = getattr(wrapper.indicator, "parameter", None)
+            if parameter == "DYNAMIC" or isinstance(wrapper.indicator, StopHairpin):
+                last_dynamic = wrapper.indicator
+                last_tag = wrapper.tag
+                if isinstance(wrapper.indicator, StartHairpin):
+                    self.total += 1
+        if isinstance(last_dynamic, StartHairpin) and str(
+            Tag("RIGHT_BROKEN")
+        ) not in str(last_tag):
+            self.violators.append(wrapper.component)
+
+
+class _UnterminatedTextSpannersCheck(WellformednessCheck):
+
+    __slots__ = ()
+
+    name = "unterminated_text_spanners"
+
+    def visit_wrappers(self, wrappers, cache):
+        open_spanners: typing.Dict = {}
+        for wrapper in sorted(wrappers, key=lambda _: _.leaked_start_offset):
+            if isinstance(wrapper.indicator, StartTextSpan):
+                self.total += 1
+                command = wrapper.indicator.command
+                command = command.replace("start", "")
+                command = command.replace("Start", "")
+                if command not in open_spanners:
+                    open_spanners[command] = []
+                open_spanners[command].append(wrapper.component)
+            elif isinstance(wrapper.indicator, StopTextSpan):
+                command = wrapper.indicator.command
+                command = command.replace("stop", "")
+                command = command.replace("Stop", "")
+                if command not in open_spanners or not open_spanners[command]:
+                    # unmatched stop text span
+                    pass
+                else:
+                    open_spanners[command].pop()
+        for command, list_ in open_spanners.items():
+            for component in list_:
+                self.violators.append(component)
+
+
+class _WellformednessState:
+    """
+    Results of incremental wellformedness kept between calls.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("argument", "check_classes", "epoch", "journal", "names", "units")
+
+    ### INITIALIZER ###
+
+    def __init__(self, argument, check_classes) -> None:
+        self.argument = argument
+        self.check_classes = check_classes
+        self.epoch = Component._lilypond_format_epoch
+        self.journal: typing.List = []
+        self.names: typing.Dict = {}
+        self.units: typing.Dict = {}
+
+
 class Wellformedness:
     """
     Wellformedness.
@@ -28,12 +550,114 @@ class Wellformedness:
         >>> abjad.Wellformedness()
         Wellformedness()
 
+    ..  container:: example
+
+        Walks the staves of a score in parallel with ``workers`` threads:
+
+        >>> score = abjad.Score(
+        ...     [abjad.Staff("c'4 d'4 e'4 f'4"), abjad.Staff("c4 d4 e4 f4")]
+        ... )
+        >>> wellformedness = abjad.Wellformedness(workers=2)
+        >>> for violators, total, check_name in wellformedness(score):
+        ...     print(len(violators), total, check_name)
+        ...
+        0 8 check_beamed_long_notes
+        0 11 check_duplicate_ids
+        0 3 check_empty_containers
+        0 11 check_missing_parents
+        0 8 check_notes_on_wrong_clef
+        0 8 check_out_of_range_pitches
+        0 0 check_overlapping_text_spanners
+        0 0 check_unmatched_stop_text_spans
+        0 0 check_unterminated_hairpins
+        0 0 check_unterminated_text_spanners
+
+    ..  container:: example
+
+        Incremental wellformedness re-checks only contexts changed since the
+        previous call:
+
+        >>> score = abjad.Score(
+        ...     [abjad.Staff("c'4 d'4 e'4 f'4"), abjad.Staff("c4 d4 e4 f4")]
+        ... )
+        >>> wellformedness = abjad.Wellformedness(incremental=True)
+        >>> violators, total = wellformedness.check_empty_containers(score)
+        >>> violators
+        []
+
+        >>> score[1].append(abjad.Container())
+        >>> violators, total = wellformedness.check_empty_containers(score)
+        >>> violators
+        [Container()]
+
+    Wellformedness walks ``argument`` once and dispatches each component and
+    each group of context wrappers to all checks; checks share effective
+    indicator lookups during the walk. Add custom checks with ``checks``; see
+    ``abjad.WellformednessCheck``.
+
+    Wellformedness splits container ``argument`` into lowest-level contexts
+    when ``incremental`` is true or when ``workers`` is greater than 1.
+    Parallel wellformedness walks lowest-level contexts in ``workers``
+    threads.
+
+    Incremental wellformedness keeps the results of each lowest-level context
+    between calls on the same score root. Changes to the score are journaled
+    to the root; the next call re-checks contexts that contain changed
+    components, together with the contexts that share an effective context
+    with them. Wrappers of unchanged context names are not re-checked.
     """
 
     ### CLASS VARIABLES ###
 
     __documentation_section__ = "Collaborators"
 
+    __slots__ = ("_checks", "_incremental", "_state", "_workers")
+
+    _builtin_checks = (
+        _BeamedLongNotesCheck,
+        _DuplicateIDsCheck,
+        _EmptyContainersCheck,
+        _MissingParentsCheck,
+        _NotesOnWrongClefCheck,
+        _OutOfRangePitchesCheck,
+        _OverlappingTextSpannersCheck,
+        _UnmatchedStopTextSpansCheck,
+        _UnterminatedHairpinsCheck,
+        _UnterminatedTextSpannersCheck,
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        checks: typing.Sequence = None,
+        *,
+        incremental: bool = None,
+        workers: int = None,
+    ) -> None:
+        if checks is not None:
+            checks = tuple(checks)
+            names = [_.name for _ in self._builtin_checks]
+            for check in checks:
+                if not (
+                    isinstance(check, type) and issubclass(check, WellformednessCheck)
+                ):
+                    message = f"must be wellformedness check class: {check!r}."
+                    raise TypeError(message)
+                if not isinstance(check.name, str) or check.name in names:
+                    message = f"check name must be unique string: {check.name!r}."
+                    raise ValueError(message)
+                names.append(check.name)
+        self._checks = checks
+        if incremental is not None:
+            incremental = bool(incremental)
+        self._incremental = incremental
+        self._state: typing.Optional[_WellformednessState] = None
+        if workers is not None:
+            if not isinstance(workers, int) or workers < 1:
+                raise ValueError(f"workers must be positive integer: {workers!r}.")
+        self._workers = workers
+
     ### SPECIAL METHODS ###
 
     def __call__(self, argument=None):
@@ -44,14 +668,8 @@ class Wellformedness:
         """
         if argument is None:
             return
-        check_names = [_ for _ in dir(self) if _.startswith("check_")]
-        triples = []
-        for current_check_name in sorted(check_names):
-            current_check = getattr(self, current_check_name)
-            current_violators, current_total = current_check(argument=argument)
-            triple = (current_violators, current_total, current_check_name)
-            triples.append(triple)
-        return triples
+        checks = self._builtin_checks + (self.checks or ())
+        return self._run(argument, checks)
 
     def __repr__(self) -> str:
         """
@@ -61,19 +679,233 @@ class Wellformedness:
 
     ### PRIVATE METHODS ###
 
-    def _aggregate_context_wrappers(self, argument):
+    def _check(self, argument, check_class):
+        violators, total, check_name = self._run(argument, [check_class])[0]
+        return violators, total
+
+    @staticmethod
+    def _finish(checks, cache):
+        triples = []
+        for check in checks:
+            violators, total = check.finish(cache)
+            triples.append((violators, total, f"check_{check.name}"))
+        return triples
+
+    def _get_dirty_units(self, argument, units, state):
+        unit_ids = {id(_) for _ in units}
+        dirty = {_ for _ in unit_ids if _ not in state.units}
+        changed_frame_ids = set()
+        # components are journaled together with parent at time of change:
+        for component, parent in state.journal:
+            changed = [component]
+            if parent is not None and component._parent is not parent:
+                changed.append(parent)
+            for component_ in changed:
+                parentage = component_._get_parentage()
+                if parentage[-1] is not argument:
+                    continue
+                for component__ in parentage:
+                    if id(component__) in unit_ids:
+                        dirty.add(id(component__))
+                        break
+                else:
+                    changed_frame_ids.add(id(component_))
+        state.journal.clear()
+        # wrappers in changed unit may govern units in same outer context:
+        for unit in units:
+            if id(unit) not in dirty:
+                continue
+            for context in unit._get_parentage()[1:]:
+                if not isinstance(context, Context):
+                    continue
+                for wrapper in context._dependent_wrappers:
+                    if any(_ is unit for _ in wrapper.component._get_parentage()):
+                        changed_frame_ids.add(id(context))
+                        break
+        if changed_frame_ids:
+            for unit in units:
+                parentage = unit._get_parentage()[1:]
+                if any(id(_) in changed_frame_ids for _ in parentage):
+                    dirty.add(id(unit))
+        return dirty
+
+    @staticmethod
+    def _get_pieces(argument):
+        """
+        Splits ``argument`` into lowest-level contexts and remaining
+        components, in iteration order.
+
+        Lowest-level contexts are containers with no context children.
+        """
+        pieces = []
+
+        def recurse(component):
+            if isinstance(component, Container):
+                if not any(isinstance(_, Context) for _ in component):
+                    pieces.append((component, True))
+                    return
+                pieces.append((component, False))
+                for component_ in component:
+                    recurse(component_)
+            else:
+                components = _iterate._iterate_components(
+                    component, do_not_iterate_grace_containers=False
+                )
+                pieces.extend((_, False) for _ in components)
+
+        recurse(argument)
+        return pieces
+
+    def _run(self, argument, check_classes):
+        check_classes = tuple(sorted(check_classes, key=lambda _: _.name))
+        if isinstance(argument, Component):
+            argument._update_now(offsets=True, indicators=True)
+        if isinstance(argument, Container) and (
+            self.incremental or (self.workers is not None and 1 < self.workers)
+        ):
+            return self._run_pieces(argument, check_classes)
+        checks = [_() for _ in check_classes]
+        cache = _WellformednessCache(argument)
+        name_to_wrappers: typing.Dict = {}
+        components = Iteration(argument).components()
+        self._visit(components, checks, cache, name_to_wrappers)
+        for wrappers in name_to_wrappers.values():
+            for check in checks:
+                check.visit_wrappers(wrappers, cache)
+        return self._finish(checks, cache)
+
+    def _run_pieces(self, argument, check_classes):
+        pieces = self._get_pieces(argument)
+        units = [_ for _, is_unit in pieces if is_unit]
+        state = None
+        if self.incremental and argument._get_parentage()[-1] is argument:
+            state = self._state
+            if (
+                state is None
+                or state.argument is not argument
+                or state.check_classes != check_classes
+                or state.epoch != Component._lilypond_format_epoch
+                or argument._journal is not state.journal
+            ):
+                if state is not None and state.argument._journal is state.journal:
+                    state.argument._journal = None
+                state = _WellformednessState(argument, check_classes)
+                argument._journal = state.journal
+                self._state = state
+                dirty = {id(_) for _ in units}
+                cache = _WellformednessCache(argument)
+            else:
+                dirty = self._get_dirty_units(argument, units, state)
+                # scanning whole score for indicator classes costs O(score):
+                cache = _WellformednessCache(argument, scan=False)
+        else:
+            dirty = {id(_) for _ in units}
+            cache = _WellformednessCache(argument)
+
+        def visit_unit(unit):
+            checks_ = [_() for _ in check_classes]
+            name_to_wrappers_: typing.Dict = {}
+            components = _iterate._iterate_components(
+                unit, do_not_iterate_grace_containers=False
+            )
+            self._visit(components, checks_, cache, name_to_wrappers_)
+            return unit, checks_, name_to_wrappers_
+
+        dirty_units = [_ for _ in units if id(_) in dirty]
+        if self.workers is not None and 1 < self.workers and 1 < len(dirty_units):
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers
+            ) as executor:
+                results = list(executor.map(visit_unit, dirty_units))
+        else:
+            results = [visit_unit(_) for _ in dirty_units]
+        unit_results = {id(_[0]): _ for _ in results}
+        if state is not None:
+            for unit in units:
+                if id(unit) not in unit_results:
+                    unit_results[id(unit)] = state.units[id(unit)]
+            state.units = unit_results
+        checks = [_() for _ in check_classes]
+        name_to_entry: typing.Dict = {}
+        for component, is_unit in pieces:
+            if is_unit:
+                unit, checks_, name_to_wrappers_ = unit_results[id(component)]
+                for check, check_ in zip(checks, checks_):
+                    check.merge(check_)
+                for name, wrappers in name_to_wrappers_.items():
+                    if name not in name_to_entry:
+                        name_to_entry[name] = [[], False]
+                    name_to_entry[name][0].extend(wrappers)
+                    if id(unit) in dirty:
+                        name_to_entry[name][1] = True
+            else:
+                for check in checks:
+                    check.visit_component(component, cache)
+                if isinstance(component, Context):
+                    if component.name not in name_to_entry:
+                        name_to_entry[component.name] = [[], False]
+                    name_to_entry[component.name][0].extend(
+                        component._dependent_wrappers
+                    )
+                    name_to_entry[component.name][1] = True
+        name_results = {}
+        for name, (wrappers, changed) in name_to_entry.items():
+            result = None
+            if state is not None and not changed and name in state.names:
+                result = state.names[name]
+                if len(result[0]) != len(wrappers) or not all(
+                    _ is __ for _, __ in zip(result[0], wrappers)
+                ):
+                    result = None
+            if result is None:
+                checks_ = [_() for _ in check_classes]
+                for check in checks_:
+                    check.visit_wrappers(wrappers, cache)
+                result = (wrappers, checks_)
+            for check, check_ in zip(checks, result[1]):
+                check.merge(check_)
+            name_results[name] = result
+        if state is not None:
+            state.names = name_results
+        return self._finish(checks, cache)
+
+    @staticmethod
+    def _visit(components, checks, cache, name_to_wrappers):
         """
         Special_Voice may contain other instances of Special_Voice.
         This currently happens with OnBeatGraceContainer.
         This method aggregates all Special_Voice wrappers for checks.
         """
-        name_to_wrappers: typing.Dict = {}
-        for context in Iteration(argument).components(Context):
-            if context.name not in name_to_wrappers:
-                name_to_wrappers[context.name] = []
-            wrappers = context._dependent_wrappers[:]
-            name_to_wrappers[context.name].extend(wrappers)
-        return name_to_wrappers
+        for component in components:
+            for check in checks:
+                check.visit_component(component, cache)
+            if isinstance(component, Context):
+                if component.name not in name_to_wrappers:
+                    name_to_wrappers[component.name] = []
+                name_to_wrappers[component.name].extend(component._dependent_wrappers)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def checks(self) -> typing.Optional[typing.Tuple]:
+        """
+        Gets custom checks.
+        """
+        return self._checks
+
+    @property
+    def incremental(self) -> typing.Optional[bool]:
+        """
+        Is true when wellformedness keeps results between calls.
+        """
+        return self._incremental
+
+    @property
+    def workers(self) -> typing.Optional[int]:
+        """
+        Gets number of threads that walk contexts in parallel.
+        """
+        return self._workers
 
     ### PUBLIC METHODS ###
 
@@ -185,39 +1017,13 @@ class Wellformedness:
         The examples above feature Abjad voice containers because beams are
         voice-persistent.
         """
-        violators, total = [], 0
-        for leaf in Iteration(argument).leaves():
-            total += 1
-            if leaf.written_duration < Duration((1, 4)):
-                continue
-            start_wrapper = _inspect._get_effective(leaf, StartBeam, unwrap=False)
-            if start_wrapper is None:
-                continue
-            stop_wrapper = _inspect._get_effective(leaf, StopBeam, unwrap=False)
-            if stop_wrapper is None:
-                violators.append(leaf)
-                continue
-            if stop_wrapper.leaked_start_offset < start_wrapper.leaked_start_offset:
-                violators.append(leaf)
-                continue
-            leaf_start_offset = leaf._get_timespan().start_offset
-            if stop_wrapper.leaked_start_offset == leaf_start_offset:
-                violators.append(leaf)
-        return violators, total
+        return self._check(argument, _BeamedLongNotesCheck)
 
     def check_duplicate_ids(self, argument=None) -> typing.Tuple[typing.List, int]:
         """
         Checks duplicate IDs.
         """
-        violators = []
-        components = Iteration(argument).components()
-        total_ids = [id(_) for _ in components]
-        unique_ids = Sequence(total_ids).remove_repeats()
-        if len(unique_ids) < len(total_ids):
-            for current_id in unique_ids:
-                if 1 < total_ids.count(current_id):
-                    violators.extend([_ for _ in components if id(_) == current_id])
-        return violators, len(total_ids)
+        return self._check(argument, _DuplicateIDsCheck)
 
     def check_empty_containers(self, argument=None) -> typing.Tuple[typing.List, int]:
         r"""
@@ -245,26 +1051,13 @@ class Wellformedness:
             [Container()]
 
         """
-        violators, containers = [], set()
-        for container in Iteration(argument).components(Container):
-            containers.add(container)
-            if len(container) == 0:
-                violators.append(container)
-        return violators, len(containers)
+        return self._check(argument, _EmptyContainersCheck)
 
     def check_missing_parents(self, argument=None) -> typing.Tuple[typing.List, int]:
         """
         Checks missing parents.
         """
-        violators, total = [], set()
-        components = Iteration(argument).components()
-        for i, component in enumerate(components):
-            total.add(component)
-            if 0 < i:
-                # TODO: figure out why "if component._parent is None" doesn't work
-                if Parentage(component).parent is None:
-                    violators.append(component)
-        return violators, len(total)
+        return self._check(argument, _MissingParentsCheck)
 
     def check_notes_on_wrong_clef(
         self, argument=None
@@ -341,20 +1134,7 @@ class Wellformedness:
             0 /	0 unterminated text spanners
 
         """
-        violators, total = [], set()
-        for leaf in Iteration(argument).leaves():
-            total.add(leaf)
-            instrument = _inspect._get_effective(leaf, Instrument)
-            if instrument is None:
-                continue
-            clef = _inspect._get_effective(leaf, Clef)
-            if clef is None:
-                continue
-            allowable_clefs = [Clef(_) for _ in instrument.allowable_clefs]
-            allowable_clefs.append(Clef("percussion"))
-            if clef not in allowable_clefs:
-                violators.append(leaf)
-        return violators, len(total)
+        return self._check(argument, _NotesOnWrongClefCheck)
 
     def check_out_of_range_pitches(
         self, argument=None
@@ -428,22 +1208,7 @@ class Wellformedness:
             0 /	0 unterminated text spanners
 
         """
-        violators, total = [], set()
-        for leaf in Iteration(argument).leaves(pitched=True):
-            total.add(leaf)
-            if leaf._has_indicator(const.ALLOW_OUT_OF_RANGE):
-                continue
-            if leaf._has_indicator(const.HIDDEN):
-                continue
-            if "unpitched" in argument._get_indicators(str):
-                continue
-            instrument = _inspect._get_effective(leaf, Instrument)
-            if instrument is None:
-                continue
-            # if leaf not in instrument.pitch_range:
-            if not sounding_pitches_are_in_range(leaf, instrument.pitch_range):
-                violators.append(leaf)
-        return violators, len(total)
+        return self._check(argument, _OutOfRangePitchesCheck)
 
     def check_overlapping_text_spanners(
         self, argument=None
@@ -593,37 +1358,7 @@ class Wellformedness:
             0 /	2 unterminated text spanners
 
         """
-        violators, total = [], 0
-
-        def key(wrapper):
-            if isinstance(wrapper.indicator, StartTextSpan):
-                priority = 1
-            else:
-                priority = 0
-            return (wrapper.leaked_start_offset, priority)
-
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            wrappers.sort(key=key)
-            open_spanners: typing.Dict = {}
-            for wrapper in wrappers:
-                if isinstance(wrapper.indicator, StartTextSpan):
-                    total += 1
-                    command = wrapper.indicator.command
-                    command = command.replace("start", "")
-                    command = command.replace("Start", "")
-                    if command not in open_spanners:
-                        open_spanners[command] = []
-                    if open_spanners[command]:
-                        violators.append(wrapper.component)
-                    open_spanners[command].append(wrapper.component)
-                elif isinstance(wrapper.indicator, StopTextSpan):
-                    command = wrapper.indicator.command
-                    command = command.replace("stop", "")
-                    command = command.replace("Stop", "")
-                    if command in open_spanners and open_spanners[command]:
-                        open_spanners[command].pop()
-        return violators, total
+        return self._check(argument, _OverlappingTextSpannersCheck)
 
     def check_unmatched_stop_text_spans(
         self, argument=None
@@ -686,29 +1421,7 @@ class Wellformedness:
             True
 
         """
-        violators, total = [], 0
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            wrappers.sort(key=lambda _: _.leaked_start_offset)
-            open_spanners: typing.Dict = {}
-            for wrapper in wrappers:
-                if isinstance(wrapper.indicator, StartTextSpan):
-                    total += 1
-                    command = wrapper.indicator.command
-                    command = command.replace("start", "")
-                    command = command.replace("Start", "")
-                    if command not in open_spanners:
-                        open_spanners[command] = []
-                    open_spanners[command].append(wrapper.component)
-                elif isinstance(wrapper.indicator, StopTextSpan):
-                    command = wrapper.indicator.command
-                    command = command.replace("stop", "")
-                    command = command.replace("Stop", "")
-                    if command not in open_spanners or not open_spanners[command]:
-                        violators.append(wrapper.component)
-                    else:
-                        open_spanners[command].pop()
-        return violators, total
+        return self._check(argument, _UnmatchedStopTextSpansCheck)
 
     def check_unterminated_hairpins(
         self, argument=None
@@ -828,24 +1541,7 @@ class Wellformedness:
             True
 
         """
-        violators, total = [], 0
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            last_dynamic = None
-            last_tag = None
-            wrappers.sort(key=lambda _: _.leaked_start_offset)
-            for wrapper in wrappers:
-                parameter = getattr(wrapper.indicator, "parameter", None)
-                if parameter == "DYNAMIC" or isinstance(wrapper.indicator, StopHairpin):
-                    last_dynamic = wrapper.indicator
-                    last_tag = wrapper.tag
-                    if isinstance(wrapper.indicator, StartHairpin):
-                        total += 1
-            if isinstance(last_dynamic, StartHairpin) and str(
-                Tag("RIGHT_BROKEN")
-            ) not in str(last_tag):
-                violators.append(wrapper.component)
-        return violators, total
+        return self._check(argument, _UnterminatedHairpinsCheck)
 
     def check_unterminated_text_spanners(
         self, argument=None
@@ -908,33 +1604,7 @@ class Wellformedness:
             True
 
         """
-        violators, total = [], 0
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            wrappers.sort(key=lambda _: _.leaked_start_offset)
-            open_spanners: typing.Dict = {}
-            for wrapper in wrappers:
-                if isinstance(wrapper.indicator, StartTextSpan):
-                    total += 1
-                    command = wrapper.indicator.command
-                    command = command.replace("start", "")
-                    command = command.replace("Start", "")
-                    if command not in open_spanners:
-                        open_spanners[command] = []
-                    open_spanners[command].append(wrapper.component)
-                elif isinstance(wrapper.indicator, StopTextSpan):
-                    command = wrapper.indicator.command
-                    command = command.replace("stop", "")
-                    command = command.replace("Stop", "")
-                    if command not in open_spanners or not open_spanners[command]:
-                        # unmatched stop text span
-                        pass
-                    else:
-                        open_spanners[command].pop()
-            for command, list_ in open_spanners.items():
-                for component in list_:
-                    violators.append(component)
-        return violators, total
+        return self._check(argument, _UnterminatedTextSpannersCheck)
 
     @staticmethod
     def tabulate_wellformedness(
@@ -953,11 +1623,13 @@ class Wellformedness:
         """
         Tabulates wellformedness.
         """
-        triples = Wellformedness()(component)
+        check_classes = []
+        for check_class in Wellformedness._builtin_checks:
+            if eval(f"check_{check_class.name}") is True:
+                check_classes.append(check_class)
+        triples = Wellformedness()._run(component, check_classes)
         strings = []
         for violators, total, check_name in triples:
-            if eval(check_name) is not True:
-                continue
             violator_count = len(violators)
             check_name = check_name.replace("check_", "")
             check_name = check_name.replace("_", " ")
@@ -985,9 +1657,11 @@ def wellformed(
     """
     Is true when ``component`` is wellformed.
     """
-    for violators, total, check_name in Wellformedness()(component):
-        if eval(check_name) is not True:
-            continue
+    check_classes = []
+    for check_class in Wellformedness._builtin_checks:
+        if eval(f"check_{check_class.name}") is True:
+            check_classes.append(check_class)
+    for violators, total, check_name in Wellformedness()._run(component, check_classes):
         if violators:
             return False
     return True
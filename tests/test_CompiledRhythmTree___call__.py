@@ -0,0 +1,51 @@
+import abjad
+import abjad.rhythmtrees
+
+
+def test_CompiledRhythmTree___call___01():
+    """
+    Compiled rhythm tree generates the same components as rhythm tree.
+    """
+
+    rtms = [
+        "(1 (1 1 1 1))",
+        "(1 (1 (2 (1 1 1)) 2))",
+        "(3/4 (1 1/2 (4/3 (1 -1/2 1))))",
+        "(2 (1 -1 (3 (1 (2 (1 1 1)) 1)) 5 -7))",
+        "(1 ((1 (1 1)) (1 (1 1))))",
+        "5",
+        "-3",
+    ]
+    parser = abjad.rhythmtrees.RhythmTreeParser()
+    for rtm in rtms:
+        tree = parser(rtm)[0]
+        compiled = abjad.rhythmtrees.CompiledRhythmTree(tree)
+        for pulse_duration in [(1, 4), (3, 16), (1, 6)]:
+            expected = tree(pulse_duration)
+            result = compiled(pulse_duration)
+            assert type(result) is type(expected)
+            staff_1, staff_2 = abjad.Staff(), abjad.Staff()
+            staff_1.extend(expected)
+            staff_2.extend(result)
+            assert abjad.lilypond(staff_2) == abjad.lilypond(staff_1)
+            assert abjad.wellformed(staff_2)
+
+
+def test_CompiledRhythmTree___call___02():
+    """
+    Compiled prolations and offsets match rhythm-tree nodes.
+    """
+
+    rtm = "(3/4 (1 1/2 (4/3 (1 -1/2 (2 (1 1 1))))))"
+    compiled = abjad.rhythmtrees.CompiledRhythmTree(rtm)
+    tree = abjad.rhythmtrees.RhythmTreeParser()(rtm)[0]
+    nodes = [tree] + list(tree.depth_first())
+
+    assert len(compiled) == len(nodes)
+    assert compiled.rtm_format == tree.rtm_format
+    assert list(compiled.prolations) == [_.prolation for _ in nodes]
+    assert list(compiled.start_offsets) == [_.start_offset for _ in nodes]
+    assert list(compiled.stop_offsets) == [_.stop_offset for _ in nodes]
+    for start_tick, node in zip(compiled.start_ticks, nodes):
+        assert isinstance(start_tick, int)
+        assert abjad.Offset(start_tick, compiled.denominator) == node.start_offset
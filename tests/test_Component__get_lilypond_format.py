@@ -0,0 +1,160 @@
+import abjad
+
+
+def test_Component__get_lilypond_format_01():
+    """
+    Caches format of unchanged subtree.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    string = abjad.lilypond(staff)
+    assert staff[1]._lilypond_format is not None
+    assert abjad.lilypond(staff) == string
+
+    staff[1].written_pitch = "ds'"
+    assert staff._lilypond_format is None
+    assert staff[1]._lilypond_format is None
+    assert staff[0]._lilypond_format is not None
+
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            c'4
+            ds'4
+            e'4
+            f'4
+        }
+        """)
+
+
+def test_Component__get_lilypond_format_02():
+    """
+    Attach, detach, override, setting and tweak clear cached format.
+    """
+
+    staff = abjad.Staff("c'4 d'4")
+    abjad.lilypond(staff)
+    abjad.attach(abjad.LilyPondLiteral(r"\break", "after"), staff[1])
+    articulation = abjad.Articulation("accent")
+    abjad.attach(articulation, staff[0])
+    abjad.lilypond(staff)
+    abjad.override(staff[1]).note_head.color = "red"
+    abjad.setting(staff).auto_beaming = False
+    abjad.tweak(articulation).color = "blue"
+    abjad.tweak(staff[1].note_head).color = "green"
+    abjad.detach(abjad.LilyPondLiteral, staff[1])
+
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        \with
+        {
+            autoBeaming = ##f
+        }
+        {
+            c'4
+            - \tweak color #blue
+            - \accent
+            \once \override NoteHead.color = #red
+            \tweak color #green
+            d'4
+        }
+        """)
+
+
+def test_Component__get_lilypond_format_03():
+    """
+    Moving subtree clears cached format of effective context indicators.
+    """
+
+    voice = abjad.Voice("c'4 d'4")
+    abjad.attach(abjad.TimeSignature((2, 4)), voice[0])
+    assert "%%% \\time 2/4 %%%" in abjad.lilypond(voice)
+
+    staff = abjad.Staff([voice])
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \new Voice
+            {
+                \time 2/4
+                c'4
+                d'4
+            }
+        }
+        """)
+
+
+def test_Component__get_lilypond_format_04():
+    """
+    Detaching all wrappers from leaf clears cached format.
+    """
+
+    staff = abjad.Staff("c'4 d'4")
+    abjad.attach(abjad.Clef("bass"), staff[0])
+    abjad.attach(abjad.Articulation("staccato"), staff[0])
+    abjad.attach(abjad.Tie(), staff[0])
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \clef "bass"
+            c'4
+            - \staccato
+            ~
+            d'4
+        }
+        """)
+
+    abjad.detach(object, staff[0])
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            c'4
+            d'4
+        }
+        """)
+
+
+def test_Component__get_lilypond_format_05():
+    """
+    Changing saved override, setting and tweak managers clears cached format.
+    """
+
+    voice = abjad.Voice("c'4 d'4")
+    staff = abjad.Staff([voice])
+    articulation = abjad.Articulation("accent")
+    abjad.attach(articulation, voice[1])
+    note_override = abjad.override(voice[0])
+    voice_override = abjad.override(voice)
+    staff_setting = abjad.setting(staff)
+    note_head_tweak = abjad.tweak(voice[1].note_head)
+    articulation_tweak = abjad.tweak(articulation)
+    abjad.lilypond(staff)
+
+    note_override.note_head.color = "red"
+    voice_override.stem.direction = abjad.Up
+    staff_setting.instrument_name = abjad.Markup("Vn.")
+    note_head_tweak.color = "blue"
+    articulation_tweak.color = "green"
+
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        \with
+        {
+            instrumentName = \markup { Vn. }
+        }
+        {
+            \new Voice
+            \with
+            {
+                \override Stem.direction = #up
+            }
+            {
+                \once \override NoteHead.color = #red
+                c'4
+                \tweak color #blue
+                d'4
+                - \tweak color #green
+                - \accent
+            }
+        }
+        """)
@@ -1,3 +1,5 @@
+import pytest
+
 import abjad
 
 
@@ -12,3 +14,55 @@ def test_Container_index_01():
     assert container.index(container[1]) == 1
     assert container.index(container[2]) == 2
     assert container.index(container[3]) == 3
+
+
+def test_Container_index_02():
+    """
+    Index stays current through setitem, delitem, insert, pop and extend.
+    """
+
+    container = abjad.Container("c'4 d'4 e'4 f'4")
+    notes = container[:]
+    assert [container.index(_) for _ in notes] == [0, 1, 2, 3]
+
+    container.insert(0, abjad.Note("b4"))
+    container.extend("g'4 a'4")
+    note = container.pop(2)
+    del container[0]
+    container[1:1] = [abjad.Rest("r4")]
+    container.append(note)
+
+    for i, component in enumerate(container):
+        assert container.index(component) == i
+    assert container.index(note) == len(container) - 1
+    assert note._sibling(-1) is container[-2]
+
+    container.remove(note)
+    with pytest.raises(ValueError):
+        container.index(note)
+
+
+def test_Container_index_03():
+    """
+    Positions before edits stay current; positions after edits are found
+    by scan without rebuilding position map.
+    """
+
+    container = abjad.Container("c'4 d'4 e'4 f'4 g'4 a'4")
+    for i, component in enumerate(container):
+        assert container.index(component) == i
+    positions = container._child_positions
+    misses = container._child_position_misses
+
+    container.insert(3, abjad.Note("b'4"))
+    del container[4]
+    container[5:5] = [abjad.Rest("r4")]
+    container.pop(1)
+    container.extend("c''4 d''4")
+
+    assert [container.index(_) for _ in container[:1]] == [0]
+    assert container._child_position_misses == misses
+    for i, component in enumerate(container):
+        assert container.index(component) == i
+    assert misses < container._child_position_misses
+    assert positions == {id(_): i for i, _ in enumerate(container)}
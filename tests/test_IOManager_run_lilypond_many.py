@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+import abjad
+
+configuration = abjad.Configuration()
+directory = configuration.abjad_directory
+ly_paths = [os.path.join(directory, f"test-{_}.ly") for _ in (1, 2)]
+paths = []
+for ly_path in ly_paths:
+    base = os.path.splitext(ly_path)[0]
+    paths.extend([ly_path, f"{ly_path}.sha1", f"{base}.log", f"{base}.pdf"])
+
+
+def test_IOManager_run_lilypond_many_01():
+    """
+    Renders each LilyPond file and skips unchanged files on rerun.
+    """
+
+    with abjad.FilesystemState(remove=paths):
+        for ly_path in ly_paths:
+            abjad.persist(abjad.Note("c'4")).as_ly(ly_path)
+        jobs = abjad.IOManager.run_lilypond_many(ly_paths, workers=2)
+        assert [_.ly_path for _ in jobs] == ly_paths
+        assert all(os.path.isfile(_.log_path) for _ in jobs)
+        assert not any(_.skipped for _ in jobs)
+        jobs_ = abjad.IOManager.run_lilypond_many(ly_paths, workers=2)
+        for job, job_ in zip(jobs, jobs_):
+            assert job_.skipped == job.success
+        jobs_ = abjad.IOManager.run_lilypond_many(ly_paths, force=True)
+        assert not any(_.skipped for _ in jobs_)
+
+
+def test_IOManager_run_lilypond_many_02():
+    """
+    Raises value error on nonpositive workers.
+    """
+
+    with pytest.raises(ValueError):
+        abjad.IOManager.run_lilypond_many([], workers=0)
@@ -0,0 +1,51 @@
+import abjad
+
+
+def test_Inspection_effective_01():
+    """
+    Effective indicators update after attach and detach.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef("bass"), staff[0])
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == abjad.Clef("bass")
+
+    abjad.attach(abjad.Clef("alto"), staff[2])
+    assert abjad.inspect(staff[1]).effective(abjad.Clef) == abjad.Clef("bass")
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == abjad.Clef("alto")
+
+    abjad.detach(abjad.Clef, staff[2])
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == abjad.Clef("bass")
+
+
+def test_Inspection_effective_02():
+    """
+    Effective indicators update after offsets of sibling voice change.
+    """
+
+    voice_1 = abjad.Voice("c'8 d'8", name="Voice_1")
+    voice_2 = abjad.Voice("e'8 f'8", name="Voice_2")
+    abjad.Staff([voice_1, voice_2])
+    abjad.attach(abjad.Clef("bass"), voice_1[0])
+    abjad.attach(abjad.Clef("alto"), voice_2[1])
+    assert abjad.inspect(voice_2[0]).effective(abjad.Clef) == abjad.Clef("bass")
+    assert abjad.inspect(voice_2[1]).effective(abjad.Clef) == abjad.Clef("alto")
+
+    voice_1.append("g'8")
+    assert abjad.inspect(voice_2[0]).effective(abjad.Clef) == abjad.Clef("bass")
+    assert abjad.inspect(voice_2[1]).effective(abjad.Clef) == abjad.Clef("alto")
+    assert abjad.inspect(voice_1[-1]).effective(abjad.Clef) == abjad.Clef("bass")
+
+
+def test_Inspection_effective_03():
+    """
+    Effective indicators with n.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef("bass"), staff[0])
+    abjad.attach(abjad.Clef("alto"), staff[2])
+
+    assert abjad.inspect(staff[1]).effective(abjad.Clef, n=1) == abjad.Clef("alto")
+    assert abjad.inspect(staff[3]).effective(abjad.Clef, n=-1) == abjad.Clef("bass")
+    assert abjad.inspect(staff[3]).effective(abjad.Clef, n=1) is None
@@ -1000,3 +1000,30 @@ def test_Inspection_leaf_26():
     assert abjad.inspect(voice_2[1]).leaf(-1) is voice_2[0]
     assert abjad.inspect(voice_2[2]).leaf(-1) is voice_2[1]
     assert abjad.inspect(voice_1[1]).leaf(-1) is voice_2[-1]
+
+
+def test_Inspection_leaf_27():
+    """
+    Leaf index caches neighbors and logical ties until score changes.
+    """
+
+    staff = abjad.Staff("c'8 ~ c'8 d'8 e'8", name="Staff")
+    assert abjad.inspect(staff[0]).leaf(1) is staff[1]
+    assert abjad.inspect(staff[2]).logical_tie().leaves == staff[2:3]
+    assert staff._leaf_index is not None
+    assert staff._leaf_index.logical_ties[staff[2]] == (staff[2],)
+
+    abjad.attach(abjad.Tie(), staff[2])
+    assert staff._leaf_index is None
+    assert abjad.inspect(staff[2]).logical_tie().leaves == staff[2:]
+    assert abjad.inspect(staff[3]).logical_tie().head is staff[2]
+
+    staff.insert(1, abjad.Note("f'8"))
+    assert staff._leaf_index is None
+    assert abjad.inspect(staff[0]).leaf(1) is staff[1]
+    assert abjad.inspect(staff[0]).logical_tie().leaves == staff[:2]
+
+    abjad.detach(abjad.Tie, staff[0])
+    assert abjad.inspect(staff[0]).logical_tie().leaves == staff[:1]
+    logical_ties = [_.leaves for _ in abjad.iterate(staff).logical_ties()]
+    assert logical_ties == [staff[0:1], staff[1:2], staff[2:3], staff[3:]]
@@ -0,0 +1,49 @@
+import abjad
+
+
+def test_Inspection_measure_number_01():
+    """
+    Measure numbers update after time signature attach and detach.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    assert abjad.inspect(staff[-1]).measure_number() == 2
+
+    time_signature = abjad.TimeSignature((2, 4))
+    abjad.attach(time_signature, staff[0])
+    assert abjad.inspect(staff[-1]).measure_number() == 4
+
+    abjad.detach(time_signature, staff[0])
+    assert abjad.inspect(staff[-1]).measure_number() == 2
+
+
+def test_Inspection_measure_number_02():
+    """
+    Measure numbers update after score mutation.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    numbers = [abjad.inspect(_).measure_number() for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 3]
+
+    staff.append(abjad.Note("d''4"))
+    numbers = [abjad.inspect(_).measure_number() for _ in staff]
+    assert numbers == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+
+    staff[0].written_duration = abjad.Duration(1, 2)
+    numbers = [abjad.inspect(_).measure_number() for _ in staff]
+    assert numbers == [1, 1, 2, 2, 2, 3, 3, 3, 4]
+
+
+def test_Inspection_measure_number_03():
+    """
+    Grace notes before downbeat belong to previous measure.
+    """
+
+    staff = abjad.Staff("c'2 d'2 e'2 f'2")
+    abjad.attach(abjad.BeforeGraceContainer("cs'16"), staff[0])
+    abjad.attach(abjad.BeforeGraceContainer("ds'16"), staff[2])
+    leaves = abjad.select(staff).leaves()
+    numbers = [abjad.inspect(_).measure_number() for _ in leaves]
+    assert numbers == [0, 1, 1, 1, 2, 2]
@@ -355,3 +355,107 @@ def test_Inspection_timespan_26():
     assert start_offset == abjad.Offset(0)
     start_offset = abjad.inspect(staff[1]).timespan(in_seconds=True).start_offset
     assert start_offset == abjad.Offset(5, 4)
+
+
+def test_Inspection_timespan_27():
+    """
+    Offsets update after written duration changes.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    assert abjad.inspect(staff[-1]).timespan().start_offset == abjad.Offset(3, 8)
+    staff[0].written_duration = abjad.Duration(1, 4)
+    assert abjad.inspect(staff[-1]).timespan().start_offset == abjad.Offset(4, 8)
+    assert abjad.inspect(staff).timespan().stop_offset == abjad.Offset(5, 8)
+
+
+def test_Inspection_timespan_28():
+    """
+    Offsets update after tuplet multiplier changes.
+    """
+
+    staff = abjad.Staff(r"\times 2/3 { c'4 d'4 e'4 } f'4")
+    assert abjad.inspect(staff[-1]).timespan().start_offset == abjad.Offset(2, 4)
+    staff[0].multiplier = (4, 5)
+    leaf = abjad.select(staff).leaf(1)
+    assert abjad.inspect(leaf).timespan().start_offset == abjad.Offset(1, 5)
+    assert abjad.inspect(staff[-1]).timespan().start_offset == abjad.Offset(3, 5)
+
+
+def test_Inspection_timespan_29():
+    """
+    Incremental offset updates agree with whole-score offset updates.
+    """
+
+    staff_1 = abjad.Staff(r"\times 2/3 { c'8 d'8 e'8 } f'4 { g'8 a'8 } b'4")
+    voice = abjad.Voice("c'8 d'8 e'8 f'8 g'8 a'8", name="Music_Voice")
+    staff_2 = abjad.Staff([voice])
+    score = abjad.Score([staff_1, staff_2])
+    abjad.on_beat_grace_container("g'16 a'16", voice[1:3], leaf_duration=(1, 40))
+    abjad.attach(abjad.BeforeGraceContainer("c'16 d'16"), staff_1[1])
+    abjad.attach(abjad.AfterGraceContainer("e'16"), abjad.select(staff_1).leaf(2))
+
+    def get_offsets():
+        return [
+            (_._start_offset, _._start_offset.displacement, _._stop_offset)
+            for _ in abjad._update._iterate_entire_score(score)
+        ]
+
+    abjad.inspect(score).timespan()
+    staff_1[0].multiplier = (4, 5)
+    abjad.inspect(score).timespan()
+    abjad.mutate(staff_1[1]).split([abjad.Duration(1, 8)])
+    abjad.inspect(score).timespan()
+    staff_1[-2][0].written_duration = abjad.Duration(1, 4)
+    abjad.attach(abjad.BeforeGraceContainer("b16"), staff_1[-1])
+    voice.insert(0, abjad.Note("c'4"))
+    leaf = abjad.select(score).leaf(-1)
+    abjad.inspect(leaf).timespan()
+    offsets = get_offsets()
+    abjad._update._update_all_offsets(score)
+    assert get_offsets() == offsets
+
+
+def test_Inspection_timespan_30():
+    """
+    Offset seconds update after notes insert before metronome mark change.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    abjad.attach(abjad.MetronomeMark((1, 4), 120), staff[2])
+    timespan = abjad.inspect(staff[3]).timespan(in_seconds=True)
+    assert timespan == abjad.Timespan(abjad.Offset(5, 2), abjad.Offset(3))
+
+    staff.insert(1, abjad.Note("g'4"))
+    timespan = abjad.inspect(staff[4]).timespan(in_seconds=True)
+    assert timespan == abjad.Timespan(abjad.Offset(7, 2), abjad.Offset(4))
+
+
+def test_Inspection_timespan_31():
+    """
+    After grace offsets update when before grace music that follows them
+    is deleted or replaced.
+    """
+
+    voice = abjad.Voice([abjad.Container("e'8"), abjad.Note("c'4")])
+    after_grace_container = abjad.AfterGraceContainer("b'16")
+    abjad.attach(after_grace_container, voice[0][0])
+    abjad.attach(abjad.BeforeGraceContainer("c'16 d'16"), voice[1])
+    timespan = abjad.inspect(after_grace_container[0]).timespan()
+    assert timespan.start_offset.displacement == abjad.Duration(-3, 16)
+
+    voice[1] = abjad.Note("c'4")
+    timespan = abjad.inspect(after_grace_container[0]).timespan()
+    assert timespan.start_offset.displacement == abjad.Duration(-1, 16)
+
+    abjad.attach(abjad.BeforeGraceContainer("c'16 d'16"), voice[1])
+    timespan = abjad.inspect(after_grace_container[0]).timespan()
+    assert timespan.start_offset.displacement == abjad.Duration(-3, 16)
+
+    del voice[1]
+    timespan = abjad.inspect(after_grace_container[0]).timespan()
+    assert timespan == abjad.Timespan(
+        abjad.Offset((1, 8), displacement=abjad.Duration(-1, 16)),
+        abjad.Offset(1, 8),
+    )
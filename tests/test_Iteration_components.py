@@ -0,0 +1,40 @@
+import abjad
+from abjad import _iterate
+
+
+def test_Iteration_components_01():
+    """
+    Iterates grace music in score order, forward and in reverse.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8")
+    abjad.attach(abjad.BeforeGraceContainer("cs'16"), voice[1])
+    abjad.attach(abjad.AfterGraceContainer("ds'16"), voice[1])
+    names = [str(_) for _ in abjad.iterate(voice).leaves()]
+    assert names == ["c'8", "cs'16", "d'8", "ds'16", "e'8"]
+
+    leaves = abjad.iterate(voice).leaves(reverse=True)
+    names = [str(_) for _ in leaves]
+    assert names == ["e'8", "ds'16", "d'8", "cs'16", "c'8"]
+
+    names = [str(_) for _ in abjad.iterate(voice).leaves(grace=True)]
+    assert names == ["cs'16", "ds'16"]
+
+    names = [str(_) for _ in abjad.iterate(voice).leaves(grace=False)]
+    assert names == ["c'8", "d'8", "e'8"]
+
+
+def test_Iteration_components_02():
+    """
+    Snapshot iteration reuses result until score structure changes.
+    """
+
+    staff = abjad.Staff("c'8 d'8 e'8")
+    leaves = list(_iterate._iterate_components(staff, abjad.Leaf, snapshot=True))
+    assert leaves == list(staff)
+    assert staff._iteration_snapshots
+
+    staff.append("f'8")
+    assert staff._iteration_snapshots is None
+    leaves = list(_iterate._iterate_components(staff, abjad.Leaf, snapshot=True))
+    assert leaves == list(staff)
@@ -68,3 +68,16 @@ def test_Meter___init___09():
         abjad.Meter(time_signature).rtm_format
         == "(11/4 ((3/4 (1/4 1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4))))"
     )
+
+
+def test_Meter___init___10():
+
+    meter = abjad.Meter((7, 4))
+    assert abjad.Meter(abjad.TimeSignature((7, 4))) is meter
+    assert abjad.Meter((7, 4), increase_monotonic=True) is not meter
+    assert abjad.Meter((7, 4), preferred_boundary_depth=1) is not meter
+    assert abjad.Meter(meter.rtm_format) is not meter
+    assert abjad.Meter(meter.rtm_format) == meter
+    assert meter.depthwise_offset_inventory is meter.depthwise_offset_inventory
+    kernel = meter.generate_offset_kernel_to_denominator(8)
+    assert abjad.MetricAccentKernel.from_meter((7, 4), denominator=8) is kernel
@@ -0,0 +1,25 @@
+import pytest
+
+import abjad
+
+
+def test_Meter_fit_meters_01():
+
+    meters = [abjad.Meter(_) for _ in [(3, 4), (4, 4), (5, 4)]]
+    argument = [(0, 4), (4, 4), (8, 4), (12, 4), (16, 4)]
+    result = abjad.Meter.fit_meters(argument, meters, search="viterbi")
+    assert [str(_) for _ in result] == ["4/4", "4/4", "4/4", "4/4"]
+    result = abjad.Meter.fit_meters(
+        argument, meters, beam_width=2, maximum_run_length=1, search="viterbi"
+    )
+    assert sum(_.duration for _ in result) >= abjad.Duration(16, 4)
+    for meter_1, meter_2 in zip(result, result[1:]):
+        assert meter_1 is not meter_2
+
+
+def test_Meter_fit_meters_02():
+
+    meters = [abjad.Meter((4, 4))]
+    assert abjad.Meter.fit_meters([], meters, search="viterbi") == abjad.MeterList()
+    with pytest.raises(ValueError):
+        abjad.Meter.fit_meters([(0, 4), (4, 4)], meters, search="dynamic")
@@ -0,0 +1,35 @@
+import pytest
+
+import abjad
+
+
+def test_Meter_rewrite_meters_01():
+    """
+    Matches splitting at barlines and rewriting each measure.
+    """
+
+    string = r"c'4. \times 2/3 { d'4 e'4 f'4 } g'2 ~ g'8 r8 r4 a'2"
+    pairs = [(3, 4), (6, 8), (2, 4), (3, 4)]
+    staff_1 = abjad.Staff(string)
+    abjad.attach(abjad.TimeSignature((3, 4)), staff_1[0])
+    durations = [abjad.Duration(_) for _ in pairs]
+    selections = abjad.mutate(staff_1[:]).split(durations)
+    for selection, pair in zip(selections, pairs):
+        abjad.Meter.rewrite_meter(selection, pair)
+    staff_2 = abjad.Staff(string)
+    abjad.attach(abjad.TimeSignature((3, 4)), staff_2[0])
+    abjad.Meter.rewrite_meters(staff_2, pairs)
+
+    assert abjad.lilypond(staff_2) == abjad.lilypond(staff_1)
+    assert abjad.wellformed(staff_2)
+
+
+def test_Meter_rewrite_meters_02():
+    """
+    Raises value error when meters are shorter than components.
+    """
+
+    staff = abjad.Staff("c'2 d'2 e'2")
+    with pytest.raises(ValueError):
+        abjad.Meter.rewrite_meters(staff, [(2, 4), (2, 4)])
+    assert abjad.lilypond(staff) == abjad.lilypond(abjad.Staff("c'2 d'2 e'2"))
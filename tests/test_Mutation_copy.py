@@ -582,3 +582,32 @@ def test_Mutation_copy_08():
         """
     )
     assert abjad.wellformed(staff)
+
+
+def test_Mutation_copy_09():
+    """
+    Copies parents, named children and effective contexts of score tree.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8", name="Voice_1")
+    voice.append(abjad.Tuplet((2, 3), "g'8 a'8 b'8"))
+    staff = abjad.Staff([voice], name="Staff_1")
+    score = abjad.Score([staff], name="Score")
+    abjad.attach(abjad.Clef("alto"), voice[0])
+    abjad.attach(abjad.TimeSignature((3, 4)), voice[0])
+
+    new_score = abjad.mutate(score).copy()
+
+    assert abjad.lilypond(new_score) == abjad.lilypond(score)
+    assert abjad.wellformed(new_score)
+    assert new_score["Voice_1"] is new_score[0][0]
+    assert new_score[0]["Voice_1"] is new_score[0][0]
+    assert sorted(new_score._named_children) == ["Staff_1", "Voice_1"]
+    for component in abjad.select(new_score).components():
+        for child in getattr(component, "components", ()):
+            assert child._parent is component
+    wrapper = abjad.inspect(new_score[0][0][0]).wrapper(abjad.Clef)
+    assert wrapper._effective_context is new_score[0]
+    wrapper = abjad.inspect(new_score[0][0][0]).wrapper(abjad.TimeSignature)
+    assert wrapper._effective_context is new_score[0]
+    assert wrapper in new_score[0]._dependent_wrappers
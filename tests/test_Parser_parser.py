@@ -0,0 +1,64 @@
+import os
+
+import ply
+
+import abjad
+from abjad.parsers.reduced import ReducedLyParser
+
+
+def test_Parser_parser_01():
+    """
+    Parser builds PLY parser and lexer on first use.
+    """
+
+    parser = ReducedLyParser()
+    assert parser._parser is None
+    assert parser._lexer is None
+    container = parser("c'4 d'4")
+    assert abjad.lilypond(container) == "{\n    c'4\n    d'4\n}"
+    assert parser._parser is not None
+    assert parser._lexer is not None
+
+
+def test_Parser_parser_02():
+    """
+    Pickle path keys parsing tables to PLY version and grammar hash.
+    """
+
+    parser = abjad.rhythmtrees.RhythmTreeParser()
+    if parser.pickle_path is None:
+        return
+    file_name = os.path.basename(parser.pickle_path)
+    assert f"ply-{ply.__version__}" in file_name
+    assert parser.grammar_hash in file_name
+    assert abjad.rhythmtrees.RhythmTreeParser().grammar_hash == parser.grammar_hash
+    assert ReducedLyParser().grammar_hash != parser.grammar_hash
+
+
+def test_Parser_parser_03():
+    """
+    Parser writes parsing tables to pickle path when none exist.
+    """
+
+    parser = ReducedLyParser()
+    pickle_path = parser.pickle_path
+    if pickle_path is None:
+        return
+    if os.path.exists(pickle_path):
+        os.remove(pickle_path)
+    parser.parser
+    assert os.path.isfile(pickle_path)
+    directory = os.path.dirname(pickle_path)
+    assert not [_ for _ in os.listdir(directory) if _.endswith(".tmp")]
+    assert len(ReducedLyParser()("c'4 d'4 e'4")) == 3
+
+
+def test_Parser_parser_04(capsys):
+    """
+    LilyPond parser tokenizes in notes state on first use.
+    """
+
+    abjad.parser.LilyPondParser().tokenize("c'4")
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("LexToken(NOTENAME_PITCH,NamedPitchClass('c'),")
+    assert lines[-1].startswith("LexToken(UNSIGNED,4,")
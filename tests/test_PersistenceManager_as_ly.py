@@ -30,3 +30,51 @@ def test_PersistenceManager_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist(note).as_ly(ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_PersistenceManager_as_ly_03():
+    """
+    Agent abjad.persists LilyPond file identically when streaming.
+    """
+
+    staff = abjad.Staff("c'8 [ d'8 ] \\times 2/3 { e'8 f'8 g'8 } <c' e'>4")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    abjad.attach(abjad.BeforeGraceContainer("c'16"), staff[1])
+    abjad.override(staff[1]).note_head.color = "red"
+    score = abjad.Score([staff])
+    lilypond_file = abjad.LilyPondFile.new(score, includes=["stylesheet.ily"])
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(lilypond_file).as_ly(ly_path, strict=40)
+        with open(ly_path) as pointer:
+            string = pointer.read()
+        abjad.persist(lilypond_file).as_ly(ly_path, streaming=True, strict=40)
+        with open(ly_path) as pointer:
+            assert pointer.read() == string
+        staff[0].written_pitch = "cs'"
+        abjad.persist(lilypond_file).as_ly(ly_path, streaming=True, strict=40)
+        with open(ly_path) as pointer:
+            assert "cs'8" in pointer.read()
+
+
+def test_PersistenceManager_as_ly_04():
+    """
+    Agent abjad.persists top-level context block identically when streaming.
+    """
+
+    context_block = abjad.ContextBlock(
+        source_lilypond_type="Staff", name="FluteStaff", type_="Engraver_group"
+    )
+    context_block.consists_commands.append("Clef_engraver")
+    abjad.override(context_block).stem.color = "red"
+    layout_block = abjad.Block(name="layout")
+    layout_block.items.append(abjad.ContextBlock(source_lilypond_type="Score"))
+    lilypond_file = abjad.LilyPondFile.new(abjad.Staff("c'4 d'4"))
+    lilypond_file.items[:0] = [context_block, layout_block]
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(lilypond_file).as_ly(ly_path)
+        with open(ly_path) as pointer:
+            string = pointer.read()
+        abjad.persist(lilypond_file).as_ly(ly_path, streaming=True)
+        with open(ly_path) as pointer:
+            assert pointer.read() == string
+    assert "\\consists Clef_engraver" in string
@@ -0,0 +1,32 @@
+import abjad
+
+
+def test_PitchClassSet_get_prime_form_01():
+    """
+    Gets prime form of quarter-tone pitch-class set.
+    """
+
+    pc_set = abjad.PitchClassSet([10, 10.5, 1, 4])
+
+    assert pc_set.get_normal_order() == abjad.PitchClassSegment([10, 10.5, 1, 4])
+    assert pc_set.get_prime_form() == abjad.PitchClassSet([0, 0.5, 3, 6])
+    assert pc_set.transpose(3.5).get_prime_form() == abjad.PitchClassSet([0, 0.5, 3, 6])
+    assert pc_set.invert().get_prime_form() == abjad.PitchClassSet([0, 0.5, 3, 6])
+    assert pc_set.invert().get_prime_form(transposition_only=True) == (
+        abjad.PitchClassSet([0, 3, 5.5, 6])
+    )
+
+
+def test_PitchClassSet_get_prime_form_02():
+    """
+    Transposed and inverted prime forms identify their set-classes.
+    """
+
+    for set_class in abjad.SetClass.list_set_classes():
+        pc_set = set_class.prime_form.transpose(5).invert()
+        assert set_class == abjad.SetClass.from_pitch_class_set(pc_set)
+    for set_class in abjad.SetClass.list_set_classes(transposition_only=True):
+        pc_set = set_class.prime_form.transpose(7)
+        assert set_class == abjad.SetClass.from_pitch_class_set(
+            pc_set, transposition_only=True
+        )
@@ -0,0 +1,44 @@
+import abjad
+
+
+def test_Profiler___enter___01():
+    """
+    Counts whole-score updates triggered by effective indicator lookups.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Clef("bass"), staff[0])
+    abjad.inspect(staff[-1]).effective(abjad.Clef)
+
+    with abjad.Profiler() as profiler:
+        for leaf in staff:
+            abjad.inspect(leaf).effective(abjad.Clef)
+
+    assert profiler.counts == {"get_effective": 4}
+
+    with profiler:
+        staff.append("g'4")
+        for leaf in staff:
+            abjad.inspect(leaf).effective(abjad.Clef)
+
+    assert profiler.counts == {
+        "get_effective": 5,
+        "update_indicators": 1,
+        "update_offsets": 1,
+    }
+    assert sorted(profiler.times) == sorted(profiler.counts)
+
+
+def test_Profiler___enter___02():
+    """
+    Counts nothing outside with block.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    profiler = abjad.Profiler()
+    with profiler:
+        pass
+    abjad.lilypond(staff)
+
+    assert profiler.counts == {}
+    assert profiler.report() == ""
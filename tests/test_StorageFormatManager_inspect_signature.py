@@ -0,0 +1,33 @@
+import abjad
+
+
+def test_StorageFormatManager_inspect_signature_01():
+    """
+    Reads signature once per class.
+    """
+
+    descriptor = abjad.StorageFormatManager._get_descriptor(abjad.Clef)
+    manager = abjad.StorageFormatManager(abjad.Clef("alto"))
+    assert manager._descriptor is descriptor
+    assert abjad.StorageFormatManager(abjad.Clef)._descriptor is descriptor
+    assert abjad.StorageFormatManager.inspect_signature(abjad.Clef) == (
+        [],
+        ["name", "hide"],
+        False,
+        False,
+    )
+
+
+def test_StorageFormatManager_inspect_signature_02():
+    """
+    Changing returned names leaves cached signature unchanged.
+    """
+
+    manager = abjad.StorageFormatManager(abjad.NamedPitch("cs'"))
+    names = manager.signature_positional_names
+    names += manager.signature_keyword_names
+    names.append("foo")
+    assert "foo" not in manager.signature_names
+    assert manager.signature_positional_names == []
+    assert abjad.NamedPitch("cs'") == abjad.NamedPitch("cs'")
+    assert abjad.new(abjad.Clef("alto"), name="bass") == abjad.Clef("bass")
@@ -0,0 +1,63 @@
+import pytest
+
+import abjad
+
+
+def test_TempoMap_01():
+    """
+    Changes offsets to seconds and back again.
+    """
+
+    staff = abjad.Staff("c'4 d'8 e'8 f'2 g'4 a'4")
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    abjad.attach(abjad.MetronomeMark((1, 8), 72), staff[2])
+    abjad.attach(abjad.MetronomeMark((1, 4), 90), staff[4])
+    tempo_map = abjad.inspect(staff).tempo_map()
+    assert len(tempo_map) == 3
+
+    for leaf in abjad.select(staff).leaves():
+        timespan = abjad.inspect(leaf).timespan()
+        timespan_in_seconds = abjad.inspect(leaf).timespan(in_seconds=True)
+        start_offset = tempo_map.offset_to_seconds(timespan.start_offset)
+        assert start_offset == timespan_in_seconds.start_offset
+        stop_offset = tempo_map.offset_to_seconds(timespan.stop_offset)
+        assert stop_offset == timespan_in_seconds.stop_offset
+        offset = tempo_map.seconds_to_offset(timespan_in_seconds.start_offset)
+        assert offset == timespan.start_offset
+        offset = tempo_map.seconds_to_offset(timespan_in_seconds.stop_offset)
+        assert offset == timespan.stop_offset
+
+
+def test_TempoMap_02():
+    """
+    Grace music sounds at the clock time of its undisplaced offset.
+    """
+
+    staff = abjad.Staff("c'4 d'4")
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    abjad.attach(abjad.BeforeGraceContainer("cs'16"), staff[0])
+    abjad.attach(abjad.BeforeGraceContainer("ds'16"), staff[1])
+    tempo_map = abjad.inspect(staff).tempo_map()
+
+    grace_note = abjad.inspect(staff[1]).before_grace_container()[0]
+    start_offset = abjad.inspect(grace_note).timespan().start_offset
+    assert start_offset.displacement == abjad.Duration(-1, 16)
+    assert tempo_map.offset_to_seconds(start_offset) == abjad.Offset(1)
+
+
+def test_TempoMap_03():
+    """
+    Raises value error outside tempo map.
+    """
+
+    staff = abjad.Staff("c'4 d'4")
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staff[0])
+    tempo_map = abjad.inspect(staff).tempo_map()
+    assert tempo_map.offset_to_seconds(abjad.Offset(1, 2)) == abjad.Offset(2)
+    assert tempo_map.seconds_to_offset(2) == abjad.Offset(1, 2)
+
+    with pytest.raises(ValueError):
+        tempo_map.offset_to_seconds(abjad.Offset(3, 4))
+
+    with pytest.raises(ValueError):
+        tempo_map.seconds_to_offset(3)
@@ -0,0 +1,43 @@
+import itertools
+
+import abjad
+
+
+def test_Tuning_voice_pitch_classes_01():
+    """
+    Voices pitch-classes on six strings within maximum span.
+    """
+
+    tuning = abjad.Tuning(("E2", "A2", "D3", "G3", "B3", "E4"))
+    pitch_classes = ("c", "e", "g", "bf")
+    voicings = tuning.voice_pitch_classes(pitch_classes, maximum_span=12)
+
+    assert len(voicings) == 644
+    assert list(voicings) == sorted(voicings)
+    for voicing in voicings:
+        pitches = [_ for _ in voicing if _ is not None]
+        assert len(pitches) == 4
+        assert sorted(_.pitch_class.name for _ in pitches) == ["bf", "c", "e", "g"]
+        numbers = [_.number for _ in pitches]
+        assert max(numbers) - min(numbers) <= 12
+
+    voicings_ = tuning.yield_voicings(pitch_classes, maximum_span=12)
+    assert tuple(itertools.islice(voicings_, 10)) == voicings[:10]
+    voicings_ = tuning.voice_pitch_classes(
+        pitch_classes, maximum_span=12, maximum_voicings=10
+    )
+    assert voicings_ == voicings[:10]
+
+
+def test_Tuning_voice_pitch_classes_02():
+    """
+    Voices repeated pitch-classes and pitch-classes with no open strings.
+    """
+
+    tuning = abjad.Tuning(("G3", "D4", "A4", "E5"))
+    voicings = tuning.voice_pitch_classes(("d", "d"), allow_open_strings=False)
+
+    assert len(voicings) == 24
+    assert list(voicings) == sorted(voicings)
+    assert (None, None, abjad.NamedPitch("d''"), abjad.NamedPitch("d'''")) in voicings
+    assert all(_[1] != abjad.NamedPitch("d'") for _ in voicings)
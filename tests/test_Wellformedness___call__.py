@@ -0,0 +1,120 @@
+import pytest
+
+import abjad
+
+
+def test_Wellformedness___call___01():
+    """
+    Parallel walk over staves returns same triples as serial walk.
+    """
+
+    staff_1 = abjad.Staff([abjad.Voice("c'4 d'4 e'2", name="Voice_1")])
+    staff_2 = abjad.Staff([abjad.Voice("c4 d4 e2", name="Voice_2")])
+    abjad.attach(abjad.Violin(), staff_1[0][0])
+    abjad.attach(abjad.Clef("bass"), staff_1[0][0])
+    abjad.attach(abjad.StartTextSpan(), staff_2[0][0])
+    abjad.attach(abjad.StartHairpin("<"), staff_2[0][1])
+    score = abjad.Score([staff_1, staff_2])
+
+    serial = abjad.Wellformedness()(score)
+    parallel = abjad.Wellformedness(workers=2)(score)
+
+    assert [(len(_[0]), _[1], _[2]) for _ in serial] == [
+        (0, 6, "check_beamed_long_notes"),
+        (0, 11, "check_duplicate_ids"),
+        (0, 5, "check_empty_containers"),
+        (0, 11, "check_missing_parents"),
+        (3, 6, "check_notes_on_wrong_clef"),
+        (0, 6, "check_out_of_range_pitches"),
+        (0, 1, "check_overlapping_text_spanners"),
+        (0, 1, "check_unmatched_stop_text_spans"),
+        (1, 1, "check_unterminated_hairpins"),
+        (1, 1, "check_unterminated_text_spanners"),
+    ]
+    assert parallel == serial
+
+
+def test_Wellformedness___call___02():
+    """
+    Rejects custom checks that are not named wellformedness check classes.
+    """
+
+    class EmptyContainersCheck(abjad.WellformednessCheck):
+        name = "empty_containers"
+
+    with pytest.raises(TypeError):
+        abjad.Wellformedness(checks=[abjad.Rest])
+
+    with pytest.raises(ValueError):
+        abjad.Wellformedness(checks=[abjad.WellformednessCheck])
+
+    with pytest.raises(ValueError):
+        abjad.Wellformedness(checks=[EmptyContainersCheck])
+
+    with pytest.raises(ValueError):
+        abjad.Wellformedness(workers=0)
+
+
+def test_Wellformedness___call___03():
+    """
+    Incremental wellformedness re-checks changed contexts only and returns
+    same triples as full wellformedness.
+    """
+
+    staff_1 = abjad.Staff([abjad.Voice("c'4 d'4 e'2", name="Voice_1")])
+    staff_2 = abjad.Staff([abjad.Voice("c'4 d'4 e'2", name="Voice_2")])
+    score = abjad.Score([staff_1, staff_2])
+    wellformedness = abjad.Wellformedness(incremental=True)
+    wellformedness(score)
+    voice_2_results = wellformedness._state.units[id(staff_2[0])]
+
+    abjad.attach(abjad.Violin(), staff_1[0][0])
+    staff_1[0][1].written_pitch = "c,,"
+    abjad.attach(abjad.StartTextSpan(), staff_1[0][2])
+    triples = wellformedness(score)
+
+    assert wellformedness._state.units[id(staff_2[0])] is voice_2_results
+    assert triples == abjad.Wellformedness()(score)
+    assert [(len(_[0]), _[1]) for _ in triples] == [
+        (0, 6),
+        (0, 11),
+        (0, 5),
+        (0, 11),
+        (0, 6),
+        (1, 6),
+        (0, 1),
+        (0, 1),
+        (0, 0),
+        (1, 1),
+    ]
+
+    abjad.attach(abjad.Clef("bass"), staff_2[0][0])
+    del staff_1[0][1]
+    triples = wellformedness(score)
+
+    assert wellformedness._state.units[id(staff_2[0])] is not voice_2_results
+    assert triples == abjad.Wellformedness()(score)
+
+    staff_1[0][0].written_pitch = "c,,"
+    triples = wellformedness(score)
+
+    assert triples == abjad.Wellformedness()(score)
+    assert len(triples[5][0]) == 1
+
+    abjad.detach(object, staff_1[0][0])
+    abjad.detach(object, staff_2[0][0])
+    triples = wellformedness(score)
+
+    assert triples == abjad.Wellformedness()(score)
+    assert [(len(_[0]), _[1]) for _ in triples] == [
+        (0, 5),
+        (0, 10),
+        (0, 5),
+        (0, 10),
+        (0, 5),
+        (0, 5),
+        (0, 1),
+        (0, 1),
+        (0, 0),
+        (1, 1),
+    ]
@@ -0,0 +1,47 @@
+import abjad
+
+
+def test_iterate_vertical_moments_01():
+    """
+    Streaming and nonstreaming vertical moments agree with grace music.
+    """
+
+    voice_1 = abjad.Voice("c'8 d'8 e'4 f'2", name="Voice_1")
+    abjad.attach(abjad.BeforeGraceContainer("cs'16 ds'16"), voice_1[0])
+    abjad.attach(abjad.AfterGraceContainer("fs'16"), voice_1[2])
+    voice_2 = abjad.Voice("g4 a8 b8 c'2", name="Voice_2")
+    abjad.on_beat_grace_container("a'16 b'16", voice_2[1:2])
+    score = abjad.Score([abjad.Staff([voice_1]), abjad.Staff([voice_2])])
+
+    moments = list(abjad.iterate_vertical_moments(score))
+    streamed_moments = list(abjad.iterate_vertical_moments(score, streaming=True))
+    assert moments == streamed_moments
+    assert [_.offset for _ in moments] == [_.offset for _ in streamed_moments]
+    assert moments[0].offset == abjad.Offset(0, displacement=(-1, 8))
+    assert moments[0].leaves == abjad.select([voice_1[0]._before_grace_container[0]])
+
+
+def test_iterate_vertical_moments_02():
+    """
+    Vertical moments list components in score order.
+    """
+
+    score = abjad.Score()
+    score.append(abjad.Staff("c'4 d'4"))
+    score.append(abjad.Staff(r"\times 2/3 { e'4 f'4 g'4 }"))
+
+    moments = list(abjad.iterate_vertical_moments(score))
+    assert [_.offset for _ in moments] == [
+        abjad.Offset(0),
+        abjad.Offset(1, 6),
+        abjad.Offset(1, 4),
+        abjad.Offset(1, 3),
+    ]
+    assert moments[2].components == [
+        score,
+        score[0],
+        score[0][1],
+        score[1],
+        score[1][0],
+        score[1][0][1],
+    ]
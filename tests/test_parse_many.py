@@ -0,0 +1,48 @@
+import pytest
+
+import abjad
+
+
+def test_parse_many_01():
+    """
+    Parses strings in order across process pool.
+    """
+
+    strings = [f"{{c'4 d'4 e'{i}}}" for i in (1, 2, 4, 8, 16)] * 4
+    results = abjad.parse_many(strings, workers=2)
+    assert [abjad.lilypond(_) for _ in results] == [
+        abjad.lilypond(abjad.parse(_)) for _ in strings
+    ]
+
+
+def test_parse_many_02():
+    """
+    Captures errors item by item across process pool.
+    """
+
+    strings = ["{c'4}", "{c'4 \\foo}", "{des'4}"]
+    results = abjad.parse_many(strings, language="nederlands", workers=2)
+    assert abjad.lilypond(results[0]) == "{\n    c'4\n}"
+    assert isinstance(results[1], Exception)
+    assert abjad.lilypond(results[2]) == "{\n    df'4\n}"
+
+
+def test_parse_many_03():
+    """
+    Raises value error on nonpositive workers.
+    """
+
+    with pytest.raises(ValueError):
+        abjad.parse_many(["{c'4}"], workers=0)
+
+
+def test_parse_many_04():
+    """
+    Captures syntax errors item by item across process pool.
+    """
+
+    strings = ["{ c'4 }", "{ c'4 } }", "{ d'4 }"]
+    results = abjad.parse_many(strings, workers=2)
+    assert abjad.lilypond(results[0]) == "{\n    c'4\n}"
+    assert isinstance(results[1], abjad.LilyPondParserError)
+    assert abjad.lilypond(results[2]) == "{\n    d'4\n}"